@@ -0,0 +1,49 @@
+"""Compares the recurrence with the trigonometric evaluation of the Chebyshev
+polynomials, both for all degrees 0, ..., n and for the single degree n. Run with
+
+    python benchmarks/chebyshev.py
+"""
+import itertools
+import timeit
+
+import numpy as np
+
+import orthopy
+
+
+def main():
+    header = ["kind", "points", "n", "recurrence", "trig Eval", "tabulate", "evaluate"]
+    print(" | ".join(f"{h:>12}" for h in header))
+    for name in ["chebyshev1", "chebyshev2"]:
+        module = getattr(orthopy.c1, name)
+        for num_points, n in [
+            (10, 100),
+            (10_000, 100),
+            (10_000, 1000),
+            (1_000_000, 10),
+        ]:
+            x = np.random.rand(num_points) * 2 - 1
+
+            def recurrence():
+                list(itertools.islice(module.Eval(x, "standard"), n + 1))
+
+            def trig():
+                list(itertools.islice(module.Eval(x, "standard", method="trig"), n + 1))
+
+            def tabulate():
+                module.tabulate(x, n)
+
+            def evaluate():
+                module.evaluate(x, n)
+
+            number = max(1, 1_000_000 // (num_points * n))
+            times = [
+                timeit.timeit(fun, number=number) / number
+                for fun in [recurrence, trig, tabulate, evaluate]
+            ]
+            row = [name, str(num_points), str(n)] + [f"{t:.3e} s" for t in times]
+            print(" | ".join(f"{r:>12}" for r in row))
+
+
+if __name__ == "__main__":
+    main()
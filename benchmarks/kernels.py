@@ -0,0 +1,97 @@
+"""Compares the iterators with the fused kernels (NumPy and, if installed, numba) for
+few and many points. Run with
+
+    python benchmarks/kernels.py
+"""
+import itertools
+import timeit
+
+import numpy as np
+
+import orthopy
+from orthopy import kernels
+
+
+def _jacobi(x, n):
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients("normal", 0.5, 0.5, symbolic=False)
+    coeffs = kernels.pack_1d(rc, n)
+    out = np.empty((n, len(x)))
+
+    def iterator():
+        list(itertools.islice(orthopy.c1.jacobi.Eval(x, "normal", 0.5, 0.5), n))
+
+    def kernel(backend, parallel):
+        kernels.eval_1d(x, coeffs, rc.p0, out, backend, parallel)
+
+    return iterator, kernel
+
+
+def _t2(x, n):
+    bary = np.array([x, (1 - x) / 2, (1 - x) / 2])
+    evaluator = orthopy.t2.Eval(bary, "normal")
+    u, v, w = bary
+    s, t, q = 1 - 2 * w, u - v, (u + v) ** 2
+    coeffs = kernels.pack_triangle(lambda k: evaluator.rc[k], n)
+    out = np.empty((kernels.num_members_triangle(n), len(x)))
+
+    def iterator():
+        list(itertools.islice(orthopy.t2.Eval(bary, "normal"), n))
+
+    def kernel(backend, parallel):
+        kernels.eval_triangle(
+            s, t, q, coeffs, evaluator.rc.p0, n, out, backend, parallel
+        )
+
+    return iterator, kernel
+
+
+def _associated_legendre(x, n):
+    evaluator = orthopy.c1.associated_legendre.Eval(x, "normal")
+    kernels_135 = {}
+    out = np.empty((kernels.num_members_135(n), len(x)))
+
+    def iterator():
+        list(itertools.islice(orthopy.c1.associated_legendre.Eval(x, "normal"), n))
+
+    def kernel(backend, parallel):
+        if (backend, parallel) not in kernels_135:
+            kernels_135[backend, parallel] = kernels.Kernel(
+                evaluator, n, backend, parallel
+            )
+        kernels_135[backend, parallel](out)
+
+    return iterator, kernel
+
+
+def main():
+    backends = [("numpy", False)]
+    if kernels.has_numba():
+        backends += [("numba", False), ("numba", True)]
+
+    header = ["family", "points", "n", "iterator"] + [
+        f"{b}{' (parallel)' if p else ''}" for b, p in backends
+    ]
+    print(" | ".join(f"{h:>16}" for h in header))
+    for name, setup in [
+        ("jacobi", _jacobi),
+        ("associated_legendre", _associated_legendre),
+        ("t2", _t2),
+    ]:
+        for num_points, n in [(10, 50), (10_000, 50), (1_000_000, 10)]:
+            x = np.random.rand(num_points) * 2 - 1
+            iterator, kernel = setup(x, n)
+            # warm-up, includes the JIT compilation
+            for b, p in backends:
+                kernel(b, p)
+            number = max(1, 100_000 // (num_points * n))
+            times = [timeit.timeit(iterator, number=number) / number]
+            for b, p in backends:
+                times.append(
+                    timeit.timeit(lambda: kernel(b, p), number=number) / number
+                )
+            row = [name, str(num_points), str(n)] + [f"{t:.3e} s" for t in times]
+            print(" | ".join(f"{r:>16}" for r in row))
+
+
+if __name__ == "__main__":
+    main()
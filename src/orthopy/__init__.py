@@ -1,13 +1,18 @@
-from . import c1, cn, e1r, e1r2, enr2, s2, t2, tools, u3
+from . import c1, cache, cn, e1r, e1r2, enr2, pce, s2, store, t2, tools, u3
+from .series import Series
 
 __all__ = [
+    "cache",
     "e1r",
     "e1r2",
     "enr2",
     "c1",
     "cn",
+    "pce",
     "s2",
+    "store",
     "t2",
     "u3",
     "tools",
+    "Series",
 ]
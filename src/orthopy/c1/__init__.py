@@ -1,4 +1,5 @@
 from . import associated_legendre, chebyshev1, chebyshev2, gegenbauer, jacobi, legendre
+from .connection import convert
 from .tools import clenshaw
 
 __all__ = [
@@ -9,4 +10,5 @@ __all__ = [
     "jacobi",
     "legendre",
     "clenshaw",
+    "convert",
 ]
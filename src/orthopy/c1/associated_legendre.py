@@ -74,14 +74,26 @@ class Eval:
     Computer Physics Communications,
     Volume 181, Issue 12, December 2010, Pages 2091-2097,
     <https://doi.org/10.1016/j.cpc.2010.08.038>.
+
+    `m_max` truncates the orders to |m| <= m_max. With `negative_orders=False`, only the
+    orders m >= 0 are computed; expand() gives the full level when needed.
     """
 
-    def __init__(self, X, scaling: str, symbolic: str | bool = "auto"):
+    def __init__(
+        self,
+        X,
+        scaling: str,
+        symbolic: str | bool = "auto",
+        m_max: int | None = None,
+        negative_orders: bool = True,
+    ):
         cls = {"classical": RCClassical, "normal": RCNormal}[scaling]
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
         rc = cls(symbolic)
-        self._eval135 = Eval135(rc, X, symbolic=symbolic)
+        self._eval135 = Eval135(
+            rc, X, symbolic=symbolic, m_max=m_max, negative_orders=negative_orders
+        )
 
     def __iter__(self):
         return self
@@ -89,6 +101,10 @@ class Eval:
     def __next__(self):
         return next(self._eval135)
 
+    def expand(self, values, L: int):
+        """All orders of the level L from its orders m >= 0, see Eval135.expand()."""
+        return self._eval135.expand(values, L)
+
 
 class RCClassical:
     def __init__(self, symbolic: bool):
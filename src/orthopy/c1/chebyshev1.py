@@ -1,6 +1,9 @@
+import math
+
 import numpy as np
 import sympy
 
+from ..helpers import Eval1D
 from . import gegenbauer
 
 
@@ -49,27 +52,152 @@ class Eval:
         8*sqrt(2)*x**4/sqrt(pi) - 8*sqrt(2)*x**2/sqrt(pi) + sqrt(2)/sqrt(pi)
         16*sqrt(2)*x**5/sqrt(pi) - 20*sqrt(2)*x**3/sqrt(pi) + 5*sqrt(2)*x/sqrt(pi)
 
-    Another common scaling is via the recurrence
-       1
-       x
-       2 * x * Tn(x) - T{n-1}(x)
+    scaling == "standard":
+        1
+        x
+        2*x**2 - 1
+        4*x**3 - 3*x
+        8*x**4 - 8*x**2 + 1
+        16*x**5 - 20*x**3 + 5*x
+
+    The standard scaling follows the recurrence
+
+       T_{n+1}(x) = 2 * x * T_n(x) - T_{n-1}(x),
+
     which leads to the equivalence
 
-       Tn(x) = cos(n arccos(x)).
+       T_n(x) = cos(n arccos(x)).
 
-    This isn't implemented here. It can be retrieved from monic scaling by multiplying
-    with 2 ** {n-1}. Perhaps this scaling should be added?
+    With method="trig", all scalings are evaluated via the latter, i.e., every degree is
+    computed directly from the angle and independently of the previous ones. This is
+    numerical only.
     """
 
-    def __init__(self, X, scaling: str, symbolic="auto"):
+    def __init__(self, X, scaling: str, symbolic="auto", method="recurrence"):
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
 
-        lmbda = -sympy.S(1) / 2 if symbolic else -0.5
-        self._gegenbauer_eval = gegenbauer.Eval(X, scaling, lmbda, symbolic)
+        self.method = method
+        if method == "trig":
+            assert not symbolic
+            self.scaling = scaling
+            self.theta, self.sign = _angle(X)
+            self.k = 0
+        else:
+            assert method == "recurrence"
+            if scaling == "standard":
+                self._eval = Eval1D(X, RecurrenceCoefficients(scaling, symbolic))
+            else:
+                lmbda = -sympy.S(1) / 2 if symbolic else -0.5
+                self._eval = gegenbauer.Eval(X, scaling, lmbda, symbolic)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return next(self._gegenbauer_eval)
+        if self.method == "recurrence":
+            return next(self._eval)
+
+        out = _scale(self.k, self.scaling) * self.sign ** self.k
+        out = out * _cos(self.k, self.theta)
+        self.k += 1
+        return out
+
+
+def evaluate(x, n, scaling="standard"):
+    """Evaluates the Chebyshev polynomial of degree `n` at `x` in O(1) via T_n(x) =
+    cos(n arccos(x)), without running through the lower degrees.
+    """
+    theta, sign = _angle(x)
+    return _scale(n, scaling) * sign ** n * _cos(n, theta)
+
+
+def tabulate(x, n, scaling="standard"):
+    """Evaluates all Chebyshev polynomials of degrees 0, ..., n at `x`, shape (n + 1,
+    *x.shape). For x in [-1, 1], all degrees come from one vectorized complex
+    exponential exp(i k arccos(x)).
+    """
+    theta, sign = _angle(x)
+    k = np.arange(n + 1)
+    scale = np.array([_scale(i, scaling) for i in k])
+    scale = scale.reshape((-1,) + (1,) * np.ndim(theta))
+    if np.iscomplexobj(theta):
+        sign = np.power.outer(sign, k).T
+        return scale * sign * np.cos(np.multiply.outer(k, theta)).real
+    return scale * _exp_powers(theta, sign, n).real
+
+
+class RecurrenceCoefficients:
+    """Recurrence coefficients of the Chebyshev polynomials of the first kind. The
+    standard scaling is handled here, all others are those of the Gegenbauer polynomials
+    with lambda = -1/2.
+    """
+
+    def __init__(self, scaling, symbolic):
+        pi = sympy.pi if symbolic else math.pi
+        self.int_1 = pi
+
+        self.scaling = scaling
+        if scaling == "standard":
+            self.p0 = 1
+            return
+
+        lmbda = -sympy.S(1) / 2 if symbolic else -0.5
+        self._gegenbauer_rc = gegenbauer.RecurrenceCoefficients(
+            scaling, lmbda, symbolic
+        )
+        self.p0 = self._gegenbauer_rc.p0
+
+    def __getitem__(self, N):
+        if self.scaling == "standard":
+            return (1 if N == 0 else 2), 0, (None if N == 0 else 1)
+        return self._gegenbauer_rc[N]
+
+
+def _angle(x):
+    """Returns theta = arccos(|x|) and the sign of x; the Chebyshev polynomials satisfy
+    P_n(-x) = (-1)^n P_n(x). theta is in [0, pi/2] where sin(theta) has full relative
+    accuracy. Outside of [-1, 1], theta is complex, but the polynomials are still real.
+    """
+    x = np.asarray(x, dtype=float)
+    sign = np.where(x < 0.0, -1.0, 1.0)
+    abs_x = np.abs(x)
+    if np.all(abs_x <= 1.0):
+        return np.arccos(abs_x), sign
+    return np.arccos(abs_x.astype(complex)), sign
+
+
+def _exp_powers(theta, sign, n, block=32):
+    """Returns (sign exp(i theta))^k for k = 0, ..., n, shape (n + 1, *theta.shape), for
+    real theta. The powers are formed by successive multiplication; to keep the rounding
+    errors from accumulating, every `block`-th one is computed directly.
+    """
+    z = sign * np.exp(1j * theta)
+    out = np.empty((n + 1,) + np.shape(theta), dtype=complex)
+    out[0] = 1.0
+    for k in range(1, n + 1):
+        if k % block == 0:
+            np.exp(1j * k * theta, out=out[k, ...])
+            if k % 2 == 1:
+                out[k, ...] *= sign
+        else:
+            np.multiply(out[k - 1], z, out=out[k, ...])
+    return out
+
+
+def _cos(n, theta):
+    out = np.cos(n * theta)
+    return out.real if np.iscomplexobj(out) else out
+
+
+def _scale(n, scaling):
+    """Ratio of the polynomial of degree n in the given scaling to T_n."""
+    if scaling == "standard":
+        return 1.0
+    if scaling == "monic":
+        return 1.0 if n == 0 else 2.0 ** (1 - n)
+    if scaling == "classical":
+        # binom(n - 1/2, n)
+        return math.exp(math.lgamma(n + 0.5) - math.lgamma(0.5) - math.lgamma(n + 1))
+    assert scaling == "normal", f"Unknown scaling '{scaling}'"
+    return 1 / math.sqrt(math.pi) if n == 0 else math.sqrt(2 / math.pi)
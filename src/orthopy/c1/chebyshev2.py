@@ -6,10 +6,14 @@ try:
 except ImportError:
     from typing_extensions import Literal
 
+import math
+
 import numpy as np
 import sympy
 
+from ..helpers import Eval1D
 from . import gegenbauer
+from .chebyshev1 import _angle, _exp_powers
 
 
 def plot(n, scaling):
@@ -56,17 +60,144 @@ class Eval:
         8*sqrt(2)*x**3/sqrt(pi) - 4*sqrt(2)*x/sqrt(pi)
         16*sqrt(2)*x**4/sqrt(pi) - 12*sqrt(2)*x**2/sqrt(pi) + sqrt(2)/sqrt(pi)
         32*sqrt(2)*x**5/sqrt(pi) - 32*sqrt(2)*x**3/sqrt(pi) + 6*sqrt(2)*x/sqrt(pi)
+
+    scaling == "standard":
+        1
+        2*x
+        4*x**2 - 1
+        8*x**3 - 4*x
+        16*x**4 - 12*x**2 + 1
+        32*x**5 - 32*x**3 + 6*x
+
+    The standard scaling follows the recurrence
+
+       U_{n+1}(x) = 2 * x * U_n(x) - U_{n-1}(x),
+
+    which leads to the equivalence
+
+       U_n(cos(theta)) = sin((n+1) theta) / sin(theta).
+
+    With method="trig", all scalings are evaluated via the latter, i.e., every degree is
+    computed directly from the angle and independently of the previous ones. This is
+    numerical only.
     """
 
-    def __init__(self, X, scaling: str, symbolic: Literal["auto"] | bool = "auto"):
+    def __init__(
+        self,
+        X,
+        scaling: str,
+        symbolic: Literal["auto"] | bool = "auto",
+        method: Literal["recurrence", "trig"] = "recurrence",
+    ):
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
 
-        lmbda = sympy.S(1) / 2 if symbolic else 0.5
-        self._gegenbauer_eval = gegenbauer.Eval(X, scaling, lmbda, symbolic)
+        self.method = method
+        if method == "trig":
+            assert not symbolic
+            self.scaling = scaling
+            self.theta, self.sign = _angle(X)
+            self.k = 0
+        else:
+            assert method == "recurrence"
+            if scaling == "standard":
+                self._eval = Eval1D(X, RecurrenceCoefficients(scaling, symbolic))
+            else:
+                lmbda = sympy.S(1) / 2 if symbolic else 0.5
+                self._eval = gegenbauer.Eval(X, scaling, lmbda, symbolic)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return next(self._gegenbauer_eval)
+        if self.method == "recurrence":
+            return next(self._eval)
+
+        out = _scale(self.k, self.scaling) * self.sign ** self.k
+        out = out * _sin_ratio(self.k, self.theta)
+        self.k += 1
+        return out
+
+
+def evaluate(x, n: int, scaling: str = "standard"):
+    """Evaluates the Chebyshev polynomial of degree `n` at `x` in O(1) via U_n(cos(theta))
+    = sin((n+1) theta) / sin(theta), without running through the lower degrees.
+    """
+    theta, sign = _angle(x)
+    return _scale(n, scaling) * sign ** n * _sin_ratio(n, theta)
+
+
+def tabulate(x, n: int, scaling: str = "standard"):
+    """Evaluates all Chebyshev polynomials of degrees 0, ..., n at `x`, shape (n + 1,
+    *x.shape). For x in [-1, 1], all degrees come from one vectorized complex
+    exponential exp(i (k+1) arccos(x)).
+    """
+    theta, sign = _angle(x)
+    k = np.arange(n + 1)
+    scale = np.array([_scale(i, scaling) for i in k])
+    scale = scale.reshape((-1,) + (1,) * np.ndim(theta))
+    if np.iscomplexobj(theta):
+        sign = np.power.outer(sign, k).T
+        return scale * sign * np.array([_sin_ratio(i, theta) for i in k])
+
+    # sign^(k+1) sin((k+1) theta) / (sign sin(theta))
+    sin_theta = sign * np.sin(theta)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = _exp_powers(theta, sign, n + 1)[1:].imag / sin_theta
+    # U_k(+-1) = (+-1)^k (k + 1)
+    is_pole = sin_theta == 0.0
+    if np.any(is_pole):
+        limit = (k + 1).reshape(scale.shape) * np.power.outer(sign, k).T
+        out = np.where(is_pole, limit, out)
+    return scale * out
+
+
+class RecurrenceCoefficients:
+    """Recurrence coefficients of the Chebyshev polynomials of the second kind. The
+    standard scaling is handled here, all others are those of the Gegenbauer polynomials
+    with lambda = +1/2.
+    """
+
+    def __init__(self, scaling: str, symbolic: bool):
+        pi = sympy.pi if symbolic else math.pi
+        self.int_1 = pi / 2
+
+        self.scaling = scaling
+        if scaling == "standard":
+            self.p0 = 1
+            return
+
+        lmbda = sympy.S(1) / 2 if symbolic else 0.5
+        self._gegenbauer_rc = gegenbauer.RecurrenceCoefficients(
+            scaling, lmbda, symbolic
+        )
+        self.p0 = self._gegenbauer_rc.p0
+
+    def __getitem__(self, N: int):
+        if self.scaling == "standard":
+            return 2, 0, (None if N == 0 else 1)
+        return self._gegenbauer_rc[N]
+
+
+def _sin_ratio(n: int, theta):
+    sin_theta = np.sin(theta)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.sin((n + 1) * theta) / sin_theta
+    # U_n(1) = n + 1
+    out = np.where(sin_theta == 0.0, n + 1, out)
+    return out.real if np.iscomplexobj(out) else out
+
+
+def _scale(n: int, scaling: str):
+    """Ratio of the polynomial of degree n in the given scaling to U_n."""
+    if scaling == "standard":
+        return 1.0
+    if scaling == "monic":
+        return 2.0 ** -n
+    if scaling == "classical":
+        # binom(n + 1/2, n) / (n + 1)
+        return math.exp(
+            math.lgamma(n + 1.5) - math.lgamma(1.5) - math.lgamma(n + 1)
+        ) / (n + 1)
+    assert scaling == "normal", f"Unknown scaling '{scaling}'"
+    return math.sqrt(2 / math.pi)
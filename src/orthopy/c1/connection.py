@@ -0,0 +1,283 @@
+"""Connection coefficients between the Jacobi-type families on [-1, 1].
+
+All families are Jacobi polynomials P_n^(alpha, beta) up to a factor per degree:
+
+  * jacobi(alpha, beta)
+  * gegenbauer(lambda) = jacobi(lambda, lambda)
+  * legendre = jacobi(0, 0)
+  * chebyshev1 = jacobi(-1/2, -1/2)
+  * chebyshev2 = jacobi(1/2, 1/2)
+
+so a conversion scales to classical Jacobi polynomials, changes the parameters, and
+scales back. The factors are the ratios of leading coefficients, p0 * prod_{j<k} a_j,
+which works for all scalings. Parameter changes go one at a time, beta via the symmetry
+P_n^(alpha, beta)(-x) = (-1)^n P_n^(beta, alpha)(x).
+
+Integer shifts of alpha use the two-term relation [DLMF 18.9.5]
+
+  (2n+alpha+beta+1) P_n^(alpha,beta)
+      = (n+alpha+beta+1) P_n^(alpha+1,beta) - (n+beta) P_{n-1}^(alpha+1,beta),
+
+i.e., O(n) per unit step. Other shifts s use the Toeplitz-dot-Hankel structure of the
+connection matrix [1]: For s > -1,
+
+  P_n^(gamma,beta) = sum_k C_{k,n} P_k^(gamma+s,beta),
+  C = D1 (T o H) D2,
+
+with the diagonals D1, D2, the upper triangular Toeplitz matrix T_{k,n} =
+(-s)_{n-k} / (n-k)!, and the positive semidefinite Hankel matrix H_{k,n} =
+Gamma(n+k+gamma+beta+1) / Gamma(n+k+gamma+s+beta+2). H has a numerical rank of O(log n)
+(pivoted Cholesky), and the Toeplitz products are FFTs, so the cost is O(n log^2 n).
+
+[1] A. Townsend, M. Webb, S. Olver,
+    Fast polynomial transforms based on Toeplitz and Hankel matrices,
+    Math. Comp. 87 (2018), 1913-1934,
+    <https://doi.org/10.1090/mcom/3277>.
+"""
+import math
+
+import numpy as np
+
+from . import chebyshev1, chebyshev2, gegenbauer, jacobi, legendre
+
+
+def convert(coeffs, from_family, to_family, tol=1.0e-14):
+    """Converts the coefficients `coeffs` (shape (n, ...)) of a series in the
+    polynomials `from_family` to those of the same function in the polynomials
+    `to_family`. Families are given as tuples of name and parameters, e.g.,
+
+        ("jacobi", "normal", 0.5, -0.5)
+        ("gegenbauer", "classical", 1.5)
+        ("legendre", "monic")
+        ("chebyshev1", "standard")
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    n = len(coeffs)
+    alpha0, beta0, rho0 = _jacobi_form(from_family, n)
+    alpha1, beta1, rho1 = _jacobi_form(to_family, n)
+
+    c = _scale(coeffs, rho0)
+    c = _shift_alpha(c, alpha0, alpha1, beta0, tol)
+    # beta via the symmetry
+    sign = (-1.0) ** np.arange(n)
+    c = _scale(_shift_alpha(_scale(c, sign), beta0, beta1, alpha1, tol), sign)
+    return _scale(c, 1 / rho1)
+
+
+def _jacobi_form(family, n):
+    """Jacobi parameters and the factors rho_k in P_k = rho_k P_k^(alpha, beta)."""
+    name, *params = family
+    module, alpha, beta = {
+        "jacobi": lambda: (jacobi, params[1], params[2]),
+        "gegenbauer": lambda: (gegenbauer, params[1], params[1]),
+        "legendre": lambda: (legendre, 0.0, 0.0),
+        "chebyshev1": lambda: (chebyshev1, -0.5, -0.5),
+        "chebyshev2": lambda: (chebyshev2, 0.5, 0.5),
+    }[name]()
+    rc = module.RecurrenceCoefficients(*params, symbolic=False)
+    ref = jacobi.RecurrenceCoefficients("classical", alpha, beta, symbolic=False)
+    # Take the ratio of the leading coefficients p0 * prod_{j<k} a_j in log space; the
+    # leading coefficients themselves overflow for large k.
+    sign, log = _log_leading(rc, n)
+    ref_sign, ref_log = _log_leading(ref, n)
+    return alpha, beta, sign * ref_sign * np.exp(log - ref_log)
+
+
+def _log_leading(rc, n):
+    a = np.array([float(rc.p0)] + [float(rc[k][0]) for k in range(n - 1)])
+    return np.cumprod(np.sign(a)), np.cumsum(np.log(np.abs(a)))
+
+
+def _scale(c, factors):
+    return c * factors.reshape((-1,) + (1,) * (c.ndim - 1))
+
+
+def _shift_alpha(c, alpha, target, beta, tol):
+    """Coefficients in P^(alpha, beta) -> coefficients in P^(target, beta)."""
+    s = target - alpha
+    if s == round(s):
+        m = int(round(s))
+    else:
+        # fractional part in (-1, 0), then integer steps up or down
+        f = s - math.ceil(s)
+        c = _fractional_step(c, alpha, alpha + f, beta, tol)
+        alpha += f
+        m = math.ceil(s)
+
+    for _ in range(m):
+        c = _raise(c, alpha, beta)
+        alpha += 1
+    for _ in range(-m):
+        c = _lower(c, alpha - 1, beta)
+        alpha -= 1
+    return c
+
+
+def _two_term(n, alpha, beta):
+    """d, e with P_k^(alpha,beta) = d_k P_k^(alpha+1,beta) - e_k P_{k-1}^(alpha+1,beta)."""
+    k = np.arange(n, dtype=float)
+    ab = alpha + beta
+    d = np.ones(n)
+    e = np.zeros(n)
+    d[1:] = (k[1:] + ab + 1) / (2 * k[1:] + ab + 1)
+    e[1:] = (k[1:] + beta) / (2 * k[1:] + ab + 1)
+    return d, e
+
+
+def _raise(c, alpha, beta):
+    d, e = _two_term(len(c), alpha, beta)
+    out = _scale(c, d)
+    out[:-1] -= _scale(c[1:], e[1:])
+    return out
+
+
+def _lower(c, alpha, beta):
+    # inverse of _raise by back substitution
+    d, e = _two_term(len(c), alpha, beta)
+    out = np.empty_like(c)
+    out[-1] = c[-1] / d[-1]
+    for k in range(len(c) - 2, -1, -1):
+        out[k] = (c[k] + e[k + 1] * out[k + 1]) / d[k]
+    return out
+
+
+def _fractional_step(c, gamma, alpha, beta, tol):
+    """Coefficients in P^(gamma, beta) -> coefficients in P^(alpha, beta) for
+    alpha - gamma > -1, in O(n log^2 n).
+    """
+    n = len(c)
+    s = alpha - gamma
+    assert s > -1
+    out = np.zeros_like(c)
+    # P_0 is the same in both families; the rest have n >= 1, which keeps the Hankel
+    # entries away from the poles of Gamma.
+    out[0] = c[0]
+    if n == 1:
+        return out
+
+    k = np.arange(n, dtype=float)
+
+    # D2 for the columns 1, ..., n-1
+    d2 = np.exp(_log_gamma_ratio(k[1:], beta + 1, gamma + beta + 1))
+    # D1; (2k+alpha+beta+1) Gamma(k+alpha+beta+1) = Gamma(alpha+beta+2) for k = 0
+    d1 = np.exp(_log_gamma_ratio(k, alpha + beta + 2, beta + 1))
+    d1[1:] *= (2 * k[1:] + alpha + beta + 1) / (k[1:] + alpha + beta + 1)
+
+    # Toeplitz symbol t_j = (-s)_j / j!
+    t = np.ones(n)
+    t[1:] = np.cumprod((k[:-1] - s) / (k[:-1] + 1))
+
+    # H_{k,m} = h(k + m + 1) for the columns m = n - 1 >= 0
+    j = np.arange(1, 2 * n, dtype=float)
+    h = np.empty(2 * n)
+    h[0] = math.nan  # unused
+    h[1:] = np.exp(_log_gamma_ratio(j, gamma + beta + 1, alpha + beta + 2))
+    # H = diag(1/sigma) Hs diag(1/sigma) with the unit diagonal Hs ~ sum_r u_r u_r^T;
+    # keeping the scaling in the outer diagonals balances the FFT inputs.
+    sigma = 1 / np.sqrt(h[1::2])
+    factors = _hankel_cholesky(h, sigma, tol)
+
+    size = 2 ** math.ceil(math.log2(2 * n - 1))
+    ft = np.fft.rfft(t, size)
+
+    y = _scale(c[1:], d2 / sigma[: n - 1])
+    acc = np.zeros_like(c)
+    for u in factors:
+        acc += _scale(_toeplitz_upper(ft, size, _scale(y, u[: n - 1])), u)
+    out += _scale(acc, d1 / sigma)
+    return out
+
+
+def _log_gamma_ratio(x, a, b):
+    """log(Gamma(x + a) / Gamma(x + b)) for x + a, x + b > 0 with full relative
+    accuracy; the difference of two lgamma values loses digits for large x. With the
+    integer part m of a - b split off,
+
+      Gamma(x + a) / Gamma(x + a - m) = prod_{i=1}^m (x + a - i),
+
+    the remaining ratio has |a - b| < 1. With y = x + (a + b) / 2 and d = (a - b) / 2,
+    it has the asymptotic expansion
+
+      2d log(y) + sum_k (-1)^(k+1) (B_{k+1}(d) - B_{k+1}(-d)) / (k (k+1) y^k)
+
+    with the Bernoulli polynomials B_k, used for large y.
+    """
+    if a < b:
+        return -_log_gamma_ratio(x, b, a)
+
+    x = np.asarray(x, dtype=float)
+    m = int(a - b)
+    out = np.zeros_like(x)
+    for i in range(1, m + 1):
+        out += np.log(x + a - i)
+    a -= m
+
+    y = x + (a + b) / 2
+    d = (a - b) / 2
+    large = y > 30
+    out[~large] += [math.lgamma(v + a) - math.lgamma(v + b) for v in x[~large]]
+    yl = y[large]
+    out[large] += 2 * d * np.log(yl)
+    for k, (pa, pb) in enumerate(zip(_bernoulli(d), _bernoulli(-d)), start=1):
+        out[large] += (-1) ** (k + 1) * (pa - pb) / (k * (k + 1) * yl ** k)
+    return out
+
+
+def _bernoulli(t):
+    """The Bernoulli polynomials B_2, ..., B_9 at t."""
+    return [
+        t ** 2 - t + 1 / 6,
+        t ** 3 - 3 / 2 * t ** 2 + t / 2,
+        t ** 4 - 2 * t ** 3 + t ** 2 - 1 / 30,
+        t ** 5 - 5 / 2 * t ** 4 + 5 / 3 * t ** 3 - t / 6,
+        t ** 6 - 3 * t ** 5 + 5 / 2 * t ** 4 - t ** 2 / 2 + 1 / 42,
+        t ** 7 - 7 / 2 * t ** 6 + 7 / 2 * t ** 5 - 7 / 6 * t ** 3 + t / 6,
+        t ** 8
+        - 4 * t ** 7
+        + 14 / 3 * t ** 6
+        - 7 / 3 * t ** 4
+        + 2 / 3 * t ** 2
+        - 1 / 30,
+        t ** 9
+        - 9 / 2 * t ** 8
+        + 6 * t ** 7
+        - 21 / 5 * t ** 5
+        + 2 * t ** 3
+        - 3 / 10 * t,
+    ]
+
+
+def _hankel_cholesky(h, sigma, tol):
+    """Low-rank factors u_r, Hs ~ sum_r u_r u_r^T, of the diagonally scaled positive
+    semidefinite n x n Hankel matrix Hs_ij = sigma_i h[i + j + 1] sigma_j with unit
+    diagonal by pivoted Cholesky. The error is relative to the entries.
+    """
+    n = len(sigma)
+    residual = np.ones(n)
+    factors = []
+    while len(factors) < n:
+        p = int(np.argmax(residual))
+        if residual[p] <= tol:
+            break
+        col = h[p + 1 : p + 1 + n] * sigma * sigma[p]
+        for u in factors:
+            col -= u * u[p]
+        u = col / math.sqrt(residual[p])
+        factors.append(u)
+        residual = np.maximum(residual - u ** 2, 0.0)
+        residual[p] = 0.0
+    return factors
+
+
+def _toeplitz_upper(ft, size, y):
+    """z_k = sum_{m >= k-1} t_{m+1-k} y_m, k = 0, ..., len(y), via FFT, given the FFT
+    `ft` of t_0, ..., t_len(y) of length `size` >= 2 len(y) + 1.
+
+    With y_m the (scaled) coefficient of degree m + 1, this is the upper triangular
+    Toeplitz product T_{k,n} = t_{n-k} with n = m + 1.
+    """
+    m = len(y)
+    fy = np.fft.rfft(y[::-1], size, axis=0)
+    conv = np.fft.irfft(fy * ft.reshape((-1,) + (1,) * (y.ndim - 1)), size, axis=0)
+    # conv[i] = sum_j t_j y_{m-1-i+j}, so z_k = conv[m - k]
+    return conv[m - np.arange(m + 1)]
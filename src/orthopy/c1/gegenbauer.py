@@ -35,6 +35,7 @@ class RecurrenceCoefficients:
         self._jacobi_rc = jacobi.RecurrenceCoefficients(
             scaling, lmbda, lmbda, symbolic=symbolic
         )
+        self.p0 = self._jacobi_rc.p0
         self.int_1 = self._jacobi_rc.int_1
 
     def __getitem__(self, N):
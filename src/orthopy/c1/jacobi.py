@@ -4,6 +4,7 @@ import numpy as np
 import sympy
 
 from ..helpers import Eval1D
+from ..plans import Plan1D
 
 
 def plot(n, *args, **kwargs):
@@ -65,6 +66,26 @@ class Eval:
         return next(self._eval_1d)
 
 
+class Plan(Plan1D):
+    """Reusable plan for the first `n` Jacobi polynomials at points of shape `shape`;
+    `plan(x, out=buf)` writes them into `buf` (shape `(n, *shape)`), see orthopy.plans.
+    """
+
+    def __init__(
+        self,
+        n,
+        scaling,
+        alpha,
+        beta,
+        shape,
+        dtype=float,
+        backend="auto",
+        parallel=False,
+    ):
+        rc = RecurrenceCoefficients(scaling, alpha, beta, symbolic=False)
+        super().__init__(rc, n, shape, dtype, backend, parallel)
+
+
 class RecurrenceCoefficients:
     def __init__(self, scaling, alpha, beta, symbolic):
         cls = {"monic": _RCMonic, "classical": _RCClassical, "normal": _RCNormal}[
@@ -0,0 +1,105 @@
+"""Opt-in LRU cache for evaluated trees.
+
+Evaluating the same basis at the same points (quadrature nodes of a reference element,
+a pupil grid, a sphere mesh) in different places of a pipeline repeats the full
+recurrence each time. A `TreeCache` stores the levels by family, parameters, and the
+content of the points:
+
+    cache = orthopy.cache.TreeCache(max_bytes=2 ** 28)
+    levels = cache(orthopy.s2.zernike.Eval, X, 10, "normal")
+
+The result is a list of read-only arrays, one per level, the same as
+`list(itertools.islice(Eval(X, "normal"), 10))`. They are the cached arrays themselves,
+never copies. Entries are evicted least recently used first once the cached arrays
+exceed `max_bytes`.
+"""
+import collections
+import hashlib
+import itertools
+
+import numpy as np
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "max_bytes", "nbytes"]
+)
+
+
+class TreeCache:
+    def __init__(self, max_bytes=2 ** 28):
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, Eval, X, n, *args, **kwargs):
+        """Levels 0, ..., n-1 of `Eval(X, *args, **kwargs)`. A cached entry with at
+        least n levels for the same key is a hit, too.
+        """
+        X = np.asarray(X)
+        key = (
+            Eval.__module__,
+            Eval.__qualname__,
+            _freeze(X),
+            _freeze(args),
+            _freeze(kwargs),
+        )
+
+        levels = self._entries.get(key)
+        if levels is not None and len(levels) >= n:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return levels[:n]
+
+        self._misses += 1
+        self._remove(key)
+        # Some iterators update the previous level in place, so store copies.
+        levels = [np.array(v) for v in itertools.islice(Eval(X, *args, **kwargs), n)]
+        for v in levels:
+            v.setflags(write=False)
+
+        nbytes = sum(v.nbytes for v in levels)
+        if nbytes <= self.max_bytes:
+            self._entries[key] = levels
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+        return list(levels)
+
+    def cache_info(self):
+        return CacheInfo(
+            self._hits, self._misses, self._evictions, self.max_bytes, self._nbytes
+        )
+
+    def clear(self):
+        self._entries.clear()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        levels = self._entries.pop(key, None)
+        if levels is not None:
+            self._nbytes -= sum(v.nbytes for v in levels)
+
+
+def _freeze(value):
+    """Hashable representation of `value`; arrays are represented by shape, dtype, and a
+    hash of their content.
+    """
+    if isinstance(value, np.ndarray):
+        assert value.dtype != object, "Can only cache numerical point sets."
+        data = np.ascontiguousarray(value).reshape(-1).view(np.uint8)
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return ("ndarray", value.shape, value.dtype.str, digest)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
@@ -2,17 +2,63 @@ import numpy as np
 import sympy
 
 from ..c1 import jacobi
-from ..helpers import ProductEval, ProductEvalWithDegrees
+from ..helpers import (
+    IndexSetEval,
+    ProductEval,
+    ProductEvalWithDegrees,
+    ProductGridEval,
+)
+from ..plans import ProductPlan
+from ..sparse_grid import SparseGrid
+from ..tools import quadrature
 
 
 class Eval:
-    def __init__(self, X, alpha=0, beta=0, symbolic="auto", return_degrees=False):
+    """Evaluates the tree of Jacobi product polynomials. If `index_set` is given (a
+    multi-index array or a spec like `("hyperbolic", n)`, see
+    helpers.multi_index_set()), only the members in that set are computed, and the
+    iteration stops after its largest total degree.
+    """
+
+    def __init__(
+        self,
+        X,
+        alpha=0,
+        beta=0,
+        symbolic="auto",
+        return_degrees=False,
+        index_set=None,
+    ):
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
 
         rc = jacobi.RecurrenceCoefficients("normal", alpha, beta, symbolic)
-        cls = ProductEvalWithDegrees if return_degrees else ProductEval
-        self._product_eval = cls(rc, 1, X)
+        if index_set is not None:
+            self._product_eval = IndexSetEval(rc, 1, X, index_set, return_degrees)
+        else:
+            cls = ProductEvalWithDegrees if return_degrees else ProductEval
+            self._product_eval = cls(rc, 1, X)
+        self.int_p0 = self._product_eval.int_p0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._product_eval)
+
+
+class EvalGrid:
+    """Same as Eval, but evaluated on the tensor-product grid axes[0] x ... x
+    axes[-1]. This is much cheaper than Eval at the corresponding meshgrid since the
+    univariate polynomials are evaluated only once per axis.
+    """
+
+    def __init__(self, axes, alpha=0, beta=0, symbolic="auto", return_degrees=False):
+        if symbolic == "auto":
+            symbolic = any(np.asarray(x).dtype == sympy.Basic for x in axes)
+
+        rc = jacobi.RecurrenceCoefficients("normal", alpha, beta, symbolic)
+        self._product_eval = ProductGridEval(rc, 1, axes, return_degrees)
         self.int_p0 = self._product_eval.int_p0
 
     def __iter__(self):
@@ -20,3 +66,46 @@ class Eval:
 
     def __next__(self):
         return next(self._product_eval)
+
+
+class Plan(ProductPlan):
+    """Reusable plan for the levels 0, ..., n-1 of the tree at points `X` of shape
+    `shape` (with `shape[0]` the dimension); `plan(X, out=buf)` writes all members into
+    `buf`, see orthopy.plans.
+    """
+
+    def __init__(
+        self, n, shape, alpha=0, beta=0, dtype=float, backend="auto", parallel=False
+    ):
+        rc = jacobi.RecurrenceCoefficients("normal", alpha, beta, symbolic=False)
+        super().__init__(rc, n, shape, dtype, backend, parallel)
+
+
+def sparse_grid(dim, level, rule="gauss", alpha=0, beta=0):
+    """Smolyak sparse grid for the weight function prod_i (1-x_i)^alpha (1+x_i)^beta on
+    [-1, 1]^dim, built from Gauss-Jacobi rules (`rule="gauss"`) or from the nested
+    weighted Leja sequence (`rule="leja"`).
+    """
+    rc = jacobi.RecurrenceCoefficients("normal", alpha, beta, symbolic=False)
+    int_1 = rc.int_1
+
+    if rule == "gauss":
+
+        def rule1d(m):
+            return quadrature.gauss(rc, m, int_1)
+
+    else:
+        assert rule == "leja"
+        candidates = np.linspace(-1.0, 1.0, 2001)
+        points, _ = quadrature.leja(
+            rc,
+            level + 1,
+            int_1,
+            lambda x: (1 - x) ** alpha * (1 + x) ** beta,
+            candidates,
+        )
+
+        def rule1d(m):
+            return points[:m], quadrature.interpolatory_weights(rc, points[:m], int_1)
+
+    return SparseGrid(rule1d, rc, dim, level)
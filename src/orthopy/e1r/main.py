@@ -37,16 +37,33 @@ class Eval:
         -x**5/120 + 5*x**4/24 - 5*x**3/3 + 5*x**2 - 5*x + 1
 
     The classical and normal standarizations differ for alpha != 0.
+
+    With functions=True, the Laguerre functions exp(-x/2) * L_n^alpha(x) are returned
+    instead. The exponential is folded into the recurrence (see helpers.ScaledWeight),
+    so neither the polynomials nor the exponential overflow or underflow; only results
+    below the normal float range lose precision.
     """
 
-    def __init__(self, X, *args, symbolic: Literal["auto"] | bool = "auto", **kwargs):
+    def __init__(
+        self,
+        X,
+        *args,
+        symbolic: Literal["auto"] | bool = "auto",
+        functions: bool = False,
+        **kwargs,
+    ):
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
 
         assert isinstance(symbolic, bool)
         rc = RecurrenceCoefficients(*args, symbolic=symbolic, **kwargs)
         self.int_p0 = rc.p0
-        self._eval_1d = Eval1D(X, rc)
+
+        log_factor = None
+        if functions:
+            assert not symbolic
+            log_factor = -0.5 * np.asarray(X, dtype=float)
+        self._eval_1d = Eval1D(X, rc, log_factor)
 
     def __iter__(self):
         return self
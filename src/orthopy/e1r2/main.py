@@ -55,15 +55,28 @@ class Eval:
             2*sqrt(3)*x**3/(3*pi**(1/4)) - sqrt(3)*x/pi**(1/4)
             sqrt(6)*x**4/(3*pi**(1/4)) - sqrt(6)*x**2/pi**(1/4) + sqrt(6)/(4*pi**(1/4))
             2*sqrt(15)*x**5/(15*pi**(1/4)) - 2*sqrt(15)*x**3/(3*pi**(1/4)) + sqrt(15)*x/(2*pi**(1/4))
+
+    With functions=True, the Hermite functions exp(-x**2/2) * H_n(x) (physicists) or
+    exp(-x**2/4) * He_n(x) (probabilists) are returned instead. The exponential is
+    folded into the recurrence (see helpers.ScaledWeight), so neither the polynomials
+    nor the exponential overflow or underflow; only results below the normal float
+    range lose precision. With the normal scaling, the physicists' functions are
+    orthonormal in L2(R).
     """
 
-    def __init__(self, X, *args, symbolic="auto", **kwargs):
+    def __init__(self, X, *args, symbolic="auto", functions=False, **kwargs):
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
 
         rc = RecurrenceCoefficients(*args, symbolic=symbolic, **kwargs)
         self.int_p0 = rc.p0 * rc.int_1
-        self._eval_1d = Eval1D(X, rc)
+
+        log_factor = None
+        if functions:
+            assert not symbolic
+            standardization = args[0] if args else kwargs["standardization"]
+            log_factor = log_weight_sqrt(X, standardization)
+        self._eval_1d = Eval1D(X, rc, log_factor)
 
     def __iter__(self):
         return self
@@ -72,6 +85,14 @@ class Eval:
         return next(self._eval_1d)
 
 
+def log_weight_sqrt(X, standardization):
+    """Logarithm of the square root of the exponential part of the weight function,
+    -x**2/2 (physicists) or -x**2/4 (probabilists).
+    """
+    X = np.asarray(X, dtype=float)
+    return {"physicists": -0.5, "probabilists": -0.25}[standardization] * X ** 2
+
+
 class RecurrenceCoefficients:
     def __init__(self, standardization, scaling, symbolic):
         self.rc = {
@@ -1,4 +1,4 @@
-from .main import Eval
+from .main import Eval, EvalGrid, Plan, sparse_grid
 from .tools import (
     plot_tree_1d,
     plot_tree_2d,
@@ -11,6 +11,9 @@ from .tools import (
 
 __all__ = [
     "Eval",
+    "EvalGrid",
+    "Plan",
+    "sparse_grid",
     "plot_tree_1d",
     "show_tree_1d",
     "savefig_tree_1d",
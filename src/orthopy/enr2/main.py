@@ -1,12 +1,38 @@
 import numpy as np
 import sympy
 
-from ..e1r2.main import RCPhysicistNormal, RCProbabilistNormal
-from ..helpers import ProductEval, ProductEvalWithDegrees
+from ..e1r2.main import RCPhysicistNormal, RCProbabilistNormal, log_weight_sqrt
+from ..helpers import (
+    IndexSetEval,
+    ProductEval,
+    ProductEvalWithDegrees,
+    ProductGridEval,
+)
+from ..plans import ProductPlan
+from ..sparse_grid import SparseGrid
+from ..tools import quadrature
 
 
 class Eval:
-    def __init__(self, X, standardization, symbolic="auto", return_degrees=False):
+    """Evaluates the tree of Hermite product polynomials. If `index_set` is given (a
+    multi-index array or a spec like `("hyperbolic", n)`, see
+    helpers.multi_index_set()), only the members in that set are computed, and the
+    iteration stops after its largest total degree.
+
+    With functions=True, the product Hermite functions, i.e., the polynomials times
+    exp(-r**2/2) (physicists) or exp(-r**2/4) (probabilists), are returned; see
+    e1r2.Eval.
+    """
+
+    def __init__(
+        self,
+        X,
+        standardization,
+        symbolic="auto",
+        return_degrees=False,
+        index_set=None,
+        functions=False,
+    ):
         if symbolic == "auto":
             symbolic = np.asarray(X).dtype == sympy.Basic
 
@@ -18,8 +44,60 @@ class Eval:
         pi = sympy.pi if symbolic else np.pi
         int_1 = sqrt(pi) if standardization == "physicists" else 1
 
-        cls = ProductEvalWithDegrees if return_degrees else ProductEval
-        self._product_eval = cls(rc, int_1, X)
+        log_factor = None
+        if functions:
+            assert not symbolic
+            log_factor = np.sum(log_weight_sqrt(X, standardization), axis=0)
+
+        if index_set is not None:
+            self._product_eval = IndexSetEval(
+                rc, int_1, X, index_set, return_degrees, log_factor
+            )
+        else:
+            cls = ProductEvalWithDegrees if return_degrees else ProductEval
+            self._product_eval = cls(rc, int_1, X, log_factor)
+        self.int_p0 = self._product_eval.int_p0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._product_eval)
+
+
+class EvalGrid:
+    """Same as Eval, but evaluated on the tensor-product grid axes[0] x ... x
+    axes[-1]. This is much cheaper than Eval at the corresponding meshgrid since the
+    univariate polynomials are evaluated only once per axis.
+    """
+
+    def __init__(
+        self,
+        axes,
+        standardization,
+        symbolic="auto",
+        return_degrees=False,
+        functions=False,
+    ):
+        if symbolic == "auto":
+            symbolic = any(np.asarray(x).dtype == sympy.Basic for x in axes)
+
+        rc = {"probabilists": RCProbabilistNormal, "physicists": RCPhysicistNormal}[
+            standardization
+        ](symbolic)
+
+        sqrt = sympy.sqrt if symbolic else np.sqrt
+        pi = sympy.pi if symbolic else np.pi
+        int_1 = sqrt(pi) if standardization == "physicists" else 1
+
+        log_factors = None
+        if functions:
+            assert not symbolic
+            log_factors = [log_weight_sqrt(x, standardization) for x in axes]
+
+        self._product_eval = ProductGridEval(
+            rc, int_1, axes, return_degrees, log_factors
+        )
         self.int_p0 = self._product_eval.int_p0
 
     def __iter__(self):
@@ -27,3 +105,50 @@ class Eval:
 
     def __next__(self):
         return next(self._product_eval)
+
+
+class Plan(ProductPlan):
+    """Reusable plan for the levels 0, ..., n-1 of the tree at points `X` of shape
+    `shape` (with `shape[0]` the dimension); `plan(X, out=buf)` writes all members into
+    `buf`, see orthopy.plans.
+    """
+
+    def __init__(
+        self, n, standardization, shape, dtype=float, backend="auto", parallel=False
+    ):
+        rc = {"probabilists": RCProbabilistNormal, "physicists": RCPhysicistNormal}[
+            standardization
+        ](False)
+        super().__init__(rc, n, shape, dtype, backend, parallel)
+
+
+def sparse_grid(dim, level, standardization, rule="gauss"):
+    """Smolyak sparse grid for the weight function exp(-r^2) ("physicists") or
+    exp(-r^2/2) / sqrt(2pi)^dim ("probabilists"), built from Gauss-Hermite rules
+    (`rule="gauss"`) or from the nested weighted Leja sequence (`rule="leja"`).
+    """
+    rc = {"probabilists": RCProbabilistNormal, "physicists": RCPhysicistNormal}[
+        standardization
+    ](False)
+    int_1 = np.sqrt(np.pi) if standardization == "physicists" else 1.0
+
+    if rule == "gauss":
+
+        def rule1d(m):
+            return quadrature.gauss(rc, m, int_1)
+
+    else:
+        assert rule == "leja"
+        # The Leja points grow like sqrt(n); the extreme nodes of a Gauss rule with
+        # twice as many points are a safe bound for the candidates.
+        x, _ = quadrature.gauss(rc, 2 * level + 10, int_1)
+        candidates = np.linspace(x[0], x[-1], 4001)
+        scale = 1.0 if standardization == "physicists" else 0.5
+        points, _ = quadrature.leja(
+            rc, level + 1, int_1, lambda x: np.exp(-scale * x ** 2), candidates
+        )
+
+        def rule1d(m):
+            return points[:m], quadrature.interpolatory_weights(rc, points[:m], int_1)
+
+    return SparseGrid(rule1d, rc, dim, level)
@@ -3,6 +3,9 @@ import itertools
 import numpy as np
 
 from ..e1r2 import plot as plot_hermite
+from ..helpers import product_degrees
+from ..tree_plot import plot_outlines, savefig_in_worker, tripcolor_tree
+from ..tree_writer import write_tree_mesh
 from .main import Eval
 
 
@@ -34,11 +37,17 @@ def show_tree_2d(*args, **kwargs):
     plt.close()
 
 
-def savefig_tree_2d(filename, *args, **kwargs):
+def savefig_tree_2d(filename, *args, executor=None, **kwargs):
     from matplotlib import pyplot as plt
 
+    savefig_kwargs = {"transparent": True, "bbox_inches": "tight"}
+    if executor is not None:
+        return executor.submit(
+            savefig_in_worker, plot_tree_2d, filename, args, kwargs, savefig_kwargs
+        )
+
     plot_tree_2d(*args, **kwargs)
-    plt.savefig(filename, transparent=True, bbox_inches="tight")
+    plt.savefig(filename, **savefig_kwargs)
     plt.close()
 
 
@@ -58,63 +67,38 @@ def plot_tree_2d(
     plt.gca().set_aspect("equal")
     plt.axis("off")
 
-    for k, (values, _) in enumerate(itertools.islice(evaluator, n + 1)):
-        for r, z in enumerate(values):
-            offset = [alpha * 2.8 * (r - k / 2), -alpha * 2.6 * k]
-            pts = points + offset
-
-            plt.tripcolor(pts[:, 0], pts[:, 1], cells, z, shading="flat")
-            plt.clim(clim)
-
-            # rectangle outlines
-            corners = np.array(
-                [
-                    [-alpha, alpha, alpha, -alpha, -alpha],
-                    [-alpha, -alpha, alpha, alpha, -alpha],
-                ]
-            )
-            corners = (corners.T + offset).T
-            plt.plot(corners[0], corners[1], "-k")
+    values = np.concatenate([vals for vals, _ in itertools.islice(evaluator, n + 1)])
+    shifts = alpha * np.array(
+        [[2.8 * (r - k / 2), -2.6 * k] for k in range(n + 1) for r in range(k + 1)]
+    )
+    tripcolor_tree(points, cells, shifts, values, clim, colorbar)
 
-    if colorbar:
-        plt.colorbar()
+    # rectangle outlines
+    corners = alpha * np.array([[-1, 1, 1, -1], [-1, -1, 1, 1]])
+    plot_outlines(corners, shifts, "-k")
 
 
 def write_tree_3d(filename, n, *args, res=20, alpha=2.0, **kwargs):
-    import meshio
     import meshzoo
 
     points, cells = meshzoo.cube(
         -alpha, alpha, -alpha, alpha, -alpha, alpha, res, res, res
     )
 
-    evaluator = Eval(points.T, *args, return_degrees=True, **kwargs)
-    meshes = []
-
     corners = np.array(
         [[np.cos(k * 2 * np.pi / 3), np.sin(k * 2 * np.pi / 3)] for k in range(3)]
     )
 
-    for L, (values, degrees) in enumerate(itertools.islice(evaluator, n)):
-        for vals, degs in zip(values, degrees):
-            offset = sum([corner * d for corner, d in zip(corners, degs)])
-            pts = points.copy()
-            pts[:, 0] += alpha * 2.0 * offset[0]
-            pts[:, 1] += alpha * 2.0 * offset[1]
-            pts[:, 2] -= alpha * 3.0 * L
-            meshes.append(meshio.Mesh(pts, {"tetra": cells}, point_data={"f": vals}))
-
-    # merge meshes
-    points = np.concatenate([mesh.points for mesh in meshes])
-    f_vals = np.concatenate([mesh.point_data["f"] for mesh in meshes])
-    #
-    cells = []
-    k = 0
-    for mesh in meshes:
-        cells.append(mesh.cells[0].data + k)
-        k += mesh.points.shape[0]
-    cells = np.concatenate(cells)
-
-    meshio.write_points_cells(
-        filename, points, {"tetra": cells}, point_data={"f": f_vals}
-    )
+    # The offsets only depend on the degrees, so they can be computed before any
+    # polynomial is evaluated.
+    shifts = []
+    for L, degrees in enumerate(product_degrees(3, n - 1)):
+        offsets = alpha * 2.0 * np.dot(degrees, corners)
+        shifts.append(
+            np.column_stack([offsets, np.full(len(degrees), -alpha * 3.0 * L)])
+        )
+    shifts = np.concatenate(shifts)
+
+    evaluator = Eval(points.T, *args, **kwargs)
+    values = itertools.chain.from_iterable(itertools.islice(evaluator, n))
+    write_tree_mesh(filename, points, cells, "tetra", shifts, values, "f")
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import sympy
 
@@ -10,12 +12,71 @@ def full_like(x, val):
     return x * 0 + val
 
 
+class ScaledWeight:
+    """Folds the factor exp(log_factor), e.g., the square root of a Gaussian weight
+    function, into the values of a tree without underflow or overflow.
+
+    All recurrences are linear and homogeneous in the values at one point, so the tree
+    can run on the plain polynomials, and the factor exp(log_factor) * 2^(SHIFT * j) is
+    only applied to the returned values. Whenever the values at a point exceed 2^SHIFT,
+    they (and those of the previous level) are scaled down by 2^-SHIFT and j is
+    increased. The factor is kept as mantissa * 2^exponent with a mantissa of about 1, so
+    it never underflows by itself (exp(-745) already would); only the final product is
+    rounded to a subnormal or zero if it is that small.
+    """
+
+    SHIFT = 256
+    # log(2) split such that e * LN2_HI is exact for |e| < 2^20 (Cody and Waite)
+    LN2_HI = 6.93147180369123816490e-01
+    LN2_LO = 1.90821492927058770002e-10
+
+    def __init__(self, log_factor):
+        self.log_factor = np.asarray(log_factor, dtype=float)
+        self.j = np.zeros(self.log_factor.shape, dtype=int)
+        self._set_factor()
+
+    def _set_factor(self):
+        e = np.floor(self.log_factor / math.log(2.0))
+        r = (self.log_factor - e * self.LN2_HI) - e * self.LN2_LO
+        self.mantissa = np.exp(r)
+        self.exponent = e.astype(int) + self.j * self.SHIFT
+
+    def rescale(self, values, last):
+        """Rescales the values of the current level (shape (..., *points)) and the
+        previous level `last` (or None) where necessary.
+        """
+        values = np.asarray(values)
+        if values.size == 0:
+            return values, last
+        axes = tuple(range(values.ndim - self.log_factor.ndim))
+        big = np.max(np.abs(values), axis=axes) > 2.0 ** self.SHIFT
+        if not np.any(big):
+            return values, last
+
+        scale = np.where(big, 2.0 ** -self.SHIFT, 1.0)
+        values = values * scale
+        if last is not None:
+            last = last * scale
+        self.j += big
+        self._set_factor()
+        return values, last
+
+    def __call__(self, values):
+        return np.ldexp(values * self.mantissa, self.exponent)
+
+
 class Eval1D:
-    def __init__(self, x, rc):
+    """Evaluates the polynomials with the recurrence coefficients `rc` at `x`, one degree
+    per call of next(). If `log_factor` is given, the values are multiplied by
+    exp(log_factor), see ScaledWeight.
+    """
+
+    def __init__(self, x, rc, log_factor=None):
         self.rc = rc
         self.x = x
         self.k = 0
         self.last = [None, None]
+        self.weight = None if log_factor is None else ScaledWeight(log_factor)
 
     def __iter__(self):
         return self
@@ -29,10 +90,113 @@ class Eval1D:
             if self.k > 1:
                 out -= self.last[1] * c
 
+        if self.weight is not None:
+            out, self.last[0] = self.weight.rescale(out, self.last[0])
+
         self.last[1] = self.last[0]
         self.last[0] = out
         self.k += 1
-        return out
+        return out if self.weight is None else self.weight(out)
+
+
+def next_product_degrees(last):
+    """Given the multi-indices `last` of one level of a product tree, returns those of
+    the next level, in the same order in which ProductEvalWithDegrees produces them.
+    """
+    dim = last.shape[1]
+    mask = np.ones(len(last), dtype=bool)
+    level = []
+    for i in range(dim):
+        deg = last[mask]
+        deg[:, i] += 1
+        level.append(deg)
+        mask &= last[:, i] == 0
+    return np.concatenate(level)
+
+
+def product_degrees(dim, n):
+    """Returns the multi-indices of the levels 0, ..., n of a `dim`-dimensional product
+    tree, in the same order in which ProductEvalWithDegrees produces them. No
+    polynomials are evaluated.
+    """
+    levels = [np.zeros((1, dim), dtype=int)]
+    for _ in range(n):
+        levels.append(next_product_degrees(levels[-1]))
+    return levels
+
+
+def multi_index_set(dim, kind, n, weights=None):
+    """Returns the multi-indices of the downward closed set
+
+      * "total":       sum(alpha) <= n
+      * "max":         max(alpha) <= n
+      * "hyperbolic":  prod(alpha + 1) <= n + 1  (hyperbolic cross)
+      * "anisotropic": sum(weights * alpha) <= n
+
+    in `dim` dimensions, sorted by total degree and, within each degree, in the order in
+    which ProductEvalWithDegrees produces them.
+    """
+    if kind == "total":
+        weights = [1] * dim
+        kind = "anisotropic"
+
+    if kind == "anisotropic":
+        assert len(weights) == dim
+        assert all(w > 0 for w in weights)
+
+        def admissible(cost, i, k):
+            return cost + weights[i] * k <= n
+
+        def update(cost, i, k):
+            return cost + weights[i] * k
+
+        cost0 = 0
+    elif kind == "max":
+
+        def admissible(cost, i, k):
+            return k <= n
+
+        def update(cost, i, k):
+            return cost
+
+        cost0 = 0
+    else:
+        assert kind == "hyperbolic"
+
+        def admissible(cost, i, k):
+            return cost * (k + 1) <= n + 1
+
+        def update(cost, i, k):
+            return cost * (k + 1)
+
+        cost0 = 1
+
+    # depth-first enumeration; all sets are downward closed, so a partial multi-index
+    # (with all remaining entries 0) can be discarded as soon as it isn't admissible
+    out = []
+    stack = [((), cost0)]
+    while stack:
+        alpha, cost = stack.pop()
+        i = len(alpha)
+        if i == dim:
+            out.append(alpha)
+            continue
+        k = 0
+        while admissible(cost, i, k):
+            stack.append((alpha + (k,), update(cost, i, k)))
+            k += 1
+
+    return sort_product_degrees(np.array(out, dtype=int).reshape(-1, dim))
+
+
+def sort_product_degrees(degrees):
+    """Sorts the multi-indices `degrees` like the members of a product tree: by total
+    degree and, within each degree, reverse-lexicographically.
+    """
+    degrees = np.asarray(degrees, dtype=int)
+    keys = [-degrees[:, i] for i in reversed(range(degrees.shape[1]))]
+    idx = np.lexsort(keys + [np.sum(degrees, axis=1)])
+    return degrees[idx]
 
 
 class ProductEvalWithDegrees:
@@ -71,10 +235,14 @@ class ProductEvalWithDegrees:
          third entry.
 
     In the same manner this can be repeated for `dim` dimensions.
+
+    If `log_factor` (shape X.shape[1:]) is given, all values are multiplied by
+    exp(log_factor), see ScaledWeight.
     """
 
-    def __init__(self, rc, int_1, X):
+    def __init__(self, rc, int_1, X, log_factor=None):
         self.rc = rc
+        self.weight = None if log_factor is None else ScaledWeight(log_factor)
 
         self.a = None
         self.b = None
@@ -142,6 +310,11 @@ class ProductEvalWithDegrees:
             values = np.concatenate(values)
             degrees = np.concatenate(degrees)
 
+        if self.weight is not None:
+            values, self.last_values[0] = self.weight.rescale(
+                values, self.last_values[0]
+            )
+
         self.last_values[1] = self.last_values[0]
         self.last_values[0] = values
 
@@ -149,6 +322,8 @@ class ProductEvalWithDegrees:
         self.last_degrees[0] = degrees
         self.L += 1
 
+        if self.weight is not None:
+            values = self.weight(values)
         return values, degrees
 
 
@@ -163,6 +338,199 @@ class ProductEval(ProductEvalWithDegrees):
         return vals
 
 
+class ProductGridEval:
+    """Evaluates the same tree as ProductEvalWithDegrees, but on the tensor-product grid
+    axes[0] x axes[1] x ... x axes[dim-1].
+
+    Instead of running the multivariate recurrence on all prod(len(axes[i])) points, the
+    univariate polynomials are evaluated once per axis (with cost sum(len(axes[i])) per
+    level), and each member of the tree is formed as the outer product of its factors.
+    The values of level L have the shape (num_members, len(axes[0]), ...,
+    len(axes[dim-1])), just like with ProductEval at the corresponding meshgrid (with
+    indexing="ij").
+
+    If `log_factors` (one array per axis) are given, the univariate values on axis i
+    are multiplied by exp(log_factors[i]), see ScaledWeight.
+    """
+
+    def __init__(self, rc, int_1, axes, return_degrees=False, log_factors=None):
+        self.dim = len(axes)
+        self.p0n = rc.p0 ** self.dim
+        self.int_p0 = self.p0n * int_1 ** self.dim
+        self.return_degrees = return_degrees
+
+        if log_factors is None:
+            log_factors = [None] * self.dim
+        self._axes_evals = [
+            Eval1D(np.asarray(x), rc, lf) for x, lf in zip(axes, log_factors)
+        ]
+        # The univariate values for all degrees so far, one list per axis
+        self.axes_values = [[] for _ in range(self.dim)]
+        self.L = 0
+        self.last_degrees = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for evaluator, vals in zip(self._axes_evals, self.axes_values):
+            vals.append(next(evaluator))
+
+        if self.L == 0:
+            degrees = np.zeros((1, self.dim), dtype=int)
+        else:
+            degrees = next_product_degrees(self.last_degrees)
+
+        values = None
+        for i, vals in enumerate(self.axes_values):
+            # gather only the degrees needed, no copy of the whole table per level
+            factor = np.stack([vals[d] for d in degrees[:, i]])
+            # move the axis of factor to position i + 1
+            shape = [len(degrees)] + [1] * self.dim
+            shape[i + 1] = -1
+            factor = factor.reshape(shape)
+            values = factor if values is None else values * factor
+
+        self.last_degrees = degrees
+        self.L += 1
+
+        if self.return_degrees:
+            return values, degrees
+        return values
+
+
+class IndexSetEval:
+    """Evaluates the members of a product tree that belong to the multi-index set
+    `index_set`, given either explicitly as an integer array of shape (m, dim) or as a
+    tuple `(kind, n[, weights])` for multi_index_set().
+
+    Just like ProductEval, the k-th call to next() returns the members with total degree
+    k (in the same order); the iteration stops after the largest degree in the set.
+
+    Only the members required for the set are computed. Each member P_alpha is obtained
+    from the three-term recurrence in its first nonzero index i,
+
+      P_alpha = (a[k-1] x_i - b[k-1]) P_{alpha - e_i} - c[k-1] P_{alpha - 2 e_i},
+      k = alpha_i,
+
+    so the dependencies form a DAG over the set's closure, and only the last two levels
+    of that closure are kept in memory.
+
+    If `log_factor` (shape X.shape[1:]) is given, all values are multiplied by
+    exp(log_factor), see ScaledWeight.
+    """
+
+    def __init__(self, rc, int_1, X, index_set, return_degrees=False, log_factor=None):
+        self.weight = None if log_factor is None else ScaledWeight(log_factor)
+        X = np.asarray(X)
+        self.X = X
+        self.dim = X.shape[0]
+        self.p0n = rc.p0 ** self.dim
+        self.int_p0 = self.p0n * int_1 ** self.dim
+        self.return_degrees = return_degrees
+
+        if isinstance(index_set, tuple) and isinstance(index_set[0], str):
+            index_set = multi_index_set(self.dim, *index_set)
+        degrees = sort_product_degrees(np.unique(np.asarray(index_set), axis=0))
+        assert degrees.ndim == 2 and degrees.shape[1] == self.dim
+        assert np.all(degrees >= 0)
+        self.degrees = degrees
+
+        # dependency closure
+        closure = set(map(tuple, degrees))
+        stack = list(closure)
+        while stack:
+            alpha = stack.pop()
+            i = next((j for j, k in enumerate(alpha) if k > 0), None)
+            if i is None:
+                continue
+            for s in [1, 2] if alpha[i] > 1 else [1]:
+                beta = alpha[:i] + (alpha[i] - s,) + alpha[i + 1 :]
+                if beta not in closure:
+                    closure.add(beta)
+                    stack.append(beta)
+        closure = sort_product_degrees(list(closure))
+        total = np.sum(closure, axis=1)
+        self.max_degree = total[-1]
+
+        # recurrence coefficients up to max_degree
+        abc = [rc[k] for k in range(self.max_degree)]
+        # keep sympy coefficients exact
+        self.a = np.array([c[0] for c in abc] or [0], dtype=object)
+        self.b = np.array([c[1] for c in abc] or [0], dtype=object)
+        self.c = np.array([c[2] for c in abc] or [0], dtype=object)
+        if X.dtype != object:
+            self.a = self.a.astype(float)
+            self.b = self.b.astype(float)
+            self.c = self.c.astype(float)
+
+        self.levels = [closure[total == k] for k in range(self.max_degree + 1)]
+        requested = set(map(tuple, degrees))
+        self.masks = [
+            np.array([tuple(alpha) in requested for alpha in level], dtype=bool)
+            for level in self.levels
+        ]
+
+        self.L = 0
+        self.last_values = [None, None]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.L > self.max_degree:
+            raise StopIteration
+
+        X = self.X
+        level = self.levels[self.L]
+
+        if self.L == 0:
+            values = np.array([X[0] * 0 + self.p0n])
+        elif len(level) == 0:
+            values = np.empty((0,) + X.shape[1:], dtype=X.dtype)
+        else:
+            # first nonzero index and its value
+            i = np.argmax(level > 0, axis=1)
+            k = level[np.arange(len(level)), i]
+
+            idx1 = self._index_of(self.levels[self.L - 1], level, i, 1)
+            a = self.a[k - 1]
+            b = self.b[k - 1]
+            values = self.last_values[0][idx1] * (X[i].T * a - b).T
+
+            has2 = k > 1
+            if np.any(has2):
+                idx2 = self._index_of(self.levels[self.L - 2], level[has2], i[has2], 2)
+                values[has2] -= (self.last_values[1][idx2].T * self.c[k[has2] - 1]).T
+
+        if self.weight is not None:
+            values, self.last_values[0] = self.weight.rescale(
+                values, self.last_values[0]
+            )
+
+        self.last_values[1] = self.last_values[0]
+        self.last_values[0] = values
+
+        mask = self.masks[self.L]
+        degrees = level[mask]
+        self.L += 1
+
+        if self.weight is not None:
+            values = self.weight(values)
+
+        if self.return_degrees:
+            return values[mask], degrees
+        return values[mask]
+
+    @staticmethod
+    def _index_of(haystack, alphas, i, s):
+        """Positions of `alphas - s * e_i` in the (sorted) `haystack`."""
+        needles = alphas.copy()
+        needles[np.arange(len(needles)), i] -= s
+        lookup = {tuple(alpha): j for j, alpha in enumerate(haystack)}
+        return np.array([lookup[tuple(alpha)] for alpha in needles], dtype=int)
+
+
 class Eval135:
     """Evaluates a 1-3-5-tree as seen with associated Legendre polynomials and spherical
     harmonics.
@@ -179,9 +547,17 @@ class Eval135:
                     (-1, 1)   (0, 1)   (1, 1)
           (-2, 2)   (-1, 2)   (0, 2)   (1, 2)   (2, 2)
             ...       ...       ...     ...       ...
+
+    With `m_max`, only the orders |m| <= m_max are computed, so level k has
+    2 * min(k, m_max) + 1 members. With `negative_orders=False`, only the orders m >= 0
+    are computed; expand() reconstructs the negative orders of a level from those. They
+    differ by a constant factor (and complex conjugation if the two `xi` differ, i.e.,
+    are conjugates).
     """
 
-    def __init__(self, rc, x, xi=None, symbolic=False):
+    def __init__(
+        self, rc, x, xi=None, symbolic=False, m_max=None, negative_orders=True
+    ):
         self.rc = rc
 
         self.k = 0
@@ -201,28 +577,108 @@ class Eval135:
         else:
             self.xi = xi
 
+        self.m_max = m_max
+        self.negative_orders = negative_orders
+        self.conjugate = self.xi[0] is not self.xi[1]
+        # value(-m) / value(m) for m = 1, ..., per level
+        self._ratios = []
+
         self.last = [None, None]
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if self.k == 0:
+        L = self.k
+        M = L if self.m_max is None else min(L, self.m_max)
+        if L == 0:
             out = np.array([full_like(self.x, self.rc.p0)])
+            ratios = []
         else:
-            z0, z1, c0, c1 = self.rc[self.k]
-            out = np.concatenate(
-                [
-                    [self.last[0][0] * (self.xi[0] * z0)],
-                    self.last[0] * np.multiply.outer(c0, self.x),
-                    [self.last[0][-1] * (self.xi[1] * z1)],
+            z0, z1, c0, c1 = self.rc[L]
+            # the orders lo, ..., M; the previous level has the orders prev_lo, ..., Mp
+            lo = -M if self.negative_orders else 0
+            Mp = min(L - 1, M)
+            prev_lo = -Mp if self.negative_orders else 0
+
+            parts = [
+                self.last[0] * np.multiply.outer(c0[prev_lo + L - 1 : Mp + L], self.x)
+            ]
+            if M == L:
+                left, right = self._outermost(z0, z1)
+                parts = ([[left]] if self.negative_orders else []) + parts + [[right]]
+            out = np.concatenate(parts)
+
+            if L > 1:
+                Mpp = min(L - 2, M)
+                prev2_lo = -Mpp if self.negative_orders else 0
+                i = prev2_lo - lo
+                c1 = c1[prev2_lo + L - 2 : Mpp + L - 1]
+                out[i : i + len(self.last[1])] -= (self.last[1].T * c1).T
+
+            ratios = []
+            if not self.negative_orders:
+                prev_ratios = self._ratios[-1]
+                ratios = [
+                    r * (c0[L - 1 - m] / c0[L - 1 + m])
+                    for m, r in zip(range(1, Mp + 1), prev_ratios)
                 ]
-            )
-
-            if self.k > 1:
-                out[2:-2] -= (self.last[1].T * c1).T
+                if M == L:
+                    ratios.append((prev_ratios[-1] if L > 1 else 1) * (z0 / z1))
 
+        self._ratios.append(ratios)
         self.last[1] = self.last[0]
         self.last[0] = out
         self.k += 1
         return out
+
+    def _outermost(self, z0, z1):
+        """The members -L and L of the level L from the previous level."""
+        left = self.last[0][0] * (self.xi[0] * z0) if self.negative_orders else None
+        return left, self.last[0][-1] * (self.xi[1] * z1)
+
+    def expand(self, values, L):
+        """The level L with the orders -M, ..., M from `values`, its orders 0, ..., M
+        as computed with `negative_orders=False`.
+        """
+        assert not self.negative_orders
+        assert L < len(self._ratios)
+        positive = values[1:]
+        if self.conjugate:
+            positive = np.conj(positive)
+        negative = (positive.T * np.array(self._ratios[L])).T
+        return np.concatenate([negative[::-1], values])
+
+
+class EvalReal135(Eval135):
+    """The 1-3-5 tree of Eval135 with the real parts of the complex members in place of
+    the members m > 0 and the imaginary parts in place of the members -m, both times
+    sqrt(2), computed in real arithmetic. Here,
+
+      xi[0] == sqrt(1 - x**2) * cos(phi)
+      xi[1] == sqrt(1 - x**2) * sin(phi)
+
+    The pair (m, -m) of the outermost members evolves like the complex member m,
+
+      C + i S  <-  z1 * (xi[0] + i xi[1]) * (C + i S),
+
+    which is the Chebyshev recurrence for cos(m phi) and sin(m phi). The recurrence in
+    the degree for fixed m is the same as in Eval135 since its coefficients are
+    symmetric in m. The members -m are independent of the members m here, so all orders
+    are computed.
+    """
+
+    def __init__(self, rc, x, xi, symbolic=False, m_max=None):
+        super().__init__(rc, x, xi, symbolic, m_max)
+        self.sqrt2 = sympy.sqrt(2) if symbolic else math.sqrt(2)
+
+    def _outermost(self, z0, z1):
+        if self.k == 1:
+            p0 = self.last[0][0] * (z1 * self.sqrt2)
+            return p0 * self.xi[1], p0 * self.xi[0]
+        C = self.last[0][-1]
+        S = self.last[0][0]
+        return (
+            z1 * (self.xi[1] * C + self.xi[0] * S),
+            z1 * (self.xi[0] * C - self.xi[1] * S),
+        )
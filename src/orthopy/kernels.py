@@ -0,0 +1,432 @@
+"""Fused kernels that evaluate all levels 0, ..., n-1 of a recurrence at once.
+
+The iterators (Eval) make a handful of NumPy calls per level, which is cheap for many
+points but dominated by interpreter overhead for few points and high degrees. The
+kernels here run the entire recurrence in one loop over the points instead. If numba is
+installed, they are JIT-compiled (optionally with `parallel=True`, which distributes the
+points over threads); otherwise, the NumPy fallback runs one vectorized pass per level,
+writing into the output array in place.
+
+The coefficients are packed into flat float arrays once (see the pack_* functions), and
+the results are written into a caller-provided array `out` of shape (num_members,
+num_points), where the members of all levels are stored one after another.
+
+Three recurrence types are covered:
+
+  * 1D three-term recurrences (Eval1D; c1, e1r, e1r2), one member per level
+  * the 1-3-5 tree (Eval135; associated Legendre, u3), 2k+1 members in level k
+  * the triangle tree (t2, s2.xu), k+1 members in level k
+
+The iterators don't dispatch to the kernels. Kernel sets up a kernel from an iterator;
+the plans (orthopy.plans) are built on the kernels as well.
+"""
+import importlib.util
+
+import numpy as np
+
+# numba is only imported once a numba kernel is needed, see _kernel()
+prange = range
+
+
+def has_numba():
+    return importlib.util.find_spec("numba") is not None
+
+
+def _resolve(backend):
+    if backend == "auto":
+        return "numba" if has_numba() else "numpy"
+    assert backend in ["numpy", "numba"]
+    if backend == "numba" and not has_numba():
+        raise ImportError("The numba backend requires numba to be installed.")
+    return backend
+
+
+def num_members_135(n):
+    """Number of members in the levels 0, ..., n-1 of a 1-3-5 tree."""
+    return n ** 2
+
+
+def num_members_triangle(n):
+    """Number of members in the levels 0, ..., n-1 of a triangle tree."""
+    return n * (n + 1) // 2
+
+
+# packing of the recurrence coefficients
+def pack_1d(rc, n):
+    """a, b, c for the levels 1, ..., n-1 of an Eval1D recurrence (rc[k-1] creates level
+    k), as float arrays of length n-1; c[0] is unused.
+    """
+    abc = np.zeros((3, max(n - 1, 0)))
+    for k in range(n - 1):
+        a, b, c = rc[k]
+        abc[0, k] = a
+        abc[1, k] = b
+        abc[2, k] = 0.0 if k == 0 else c
+    return abc[0], abc[1], abc[2]
+
+
+def pack_135(rc, n):
+    """z0, z1 (length n), c0 (level k contributes 2k-1 entries), and c1 (level k
+    contributes 2k-3 entries) of an Eval135 recurrence (rc[k] creates level k).
+    """
+    z0 = np.zeros(n)
+    z1 = np.zeros(n)
+    c0 = []
+    c1 = []
+    for k in range(1, n):
+        z0k, z1k, c0k, c1k = rc[k]
+        z0[k] = z0k
+        z1[k] = z1k
+        c0.append(np.broadcast_to(np.asarray(c0k, dtype=float), (2 * k - 1,)))
+        if k > 1:
+            c1.append(np.broadcast_to(np.asarray(c1k, dtype=float), (2 * k - 3,)))
+    c0 = np.concatenate(c0) if c0 else np.zeros(0)
+    c1 = np.concatenate(c1) if c1 else np.zeros(0)
+    return z0, z1, c0, c1
+
+
+def pack_triangle(coefficients, n):
+    """alpha, beta (level k contributes k entries), gamma (level k contributes k-1
+    entries), delta, epsilon (length n) of the triangle recurrence
+
+      out[:-1] = last[0] * (alpha * s - beta)
+      out[-1] = delta * last[0][-1] * t
+      out[:-2] -= gamma * last[1]
+      out[-1] -= epsilon * last[1][-1] * q
+
+    `coefficients(k)` returns the tuple (alpha, beta, gamma, delta, epsilon) for level
+    k.
+    """
+    alpha = []
+    beta = []
+    gamma = []
+    delta = np.zeros(n)
+    epsilon = np.zeros(n)
+    for k in range(1, n):
+        a, b, g, d, e = coefficients(k)
+        alpha.append(np.broadcast_to(np.asarray(a, dtype=float), (k,)))
+        beta.append(np.broadcast_to(np.asarray(b, dtype=float), (k,)))
+        delta[k] = d
+        if k > 1:
+            gamma.append(np.broadcast_to(np.asarray(g, dtype=float), (k - 1,)))
+            epsilon[k] = e
+    alpha = np.concatenate(alpha) if alpha else np.zeros(0)
+    beta = np.concatenate(beta) if beta else np.zeros(0)
+    gamma = np.concatenate(gamma) if gamma else np.zeros(0)
+    return alpha, beta, gamma, delta, epsilon
+
+
+# point-wise loops, compiled with numba; the points are processed in blocks such that
+# the innermost loops run over contiguous memory
+BLOCK_SIZE = 64
+
+
+def _loop_1d(x, a, b, c, p0, out):
+    n = out.shape[0]
+    m = x.shape[0]
+    for blk in prange((m + BLOCK_SIZE - 1) // BLOCK_SIZE):
+        i0 = blk * BLOCK_SIZE
+        i1 = min(i0 + BLOCK_SIZE, m)
+        for i in range(i0, i1):
+            out[0, i] = p0
+        for k in range(1, n):
+            for i in range(i0, i1):
+                out[k, i] = (a[k - 1] * x[i] - b[k - 1]) * out[k - 1, i]
+            if k > 1:
+                for i in range(i0, i1):
+                    out[k, i] -= c[k - 1] * out[k - 2, i]
+
+
+def _loop_135(x, xi0, xi1, z0, z1, c0, c1, p0, n, out):
+    m = x.shape[0]
+    for blk in prange((m + BLOCK_SIZE - 1) // BLOCK_SIZE):
+        i0 = blk * BLOCK_SIZE
+        i1 = min(i0 + BLOCK_SIZE, m)
+        for i in range(i0, i1):
+            out[0, i] = p0
+        for k in range(1, n):
+            r0 = k * k
+            r1 = (k - 1) * (k - 1)
+            for i in range(i0, i1):
+                out[r0, i] = out[r1, i] * xi0[i] * z0[k]
+            for j in range(2 * k - 1):
+                cc = c0[r1 + j]
+                for i in range(i0, i1):
+                    out[r0 + 1 + j, i] = out[r1 + j, i] * cc * x[i]
+            for i in range(i0, i1):
+                out[r0 + 2 * k, i] = out[r1 + 2 * k - 2, i] * xi1[i] * z1[k]
+            if k > 1:
+                r2 = (k - 2) * (k - 2)
+                for j in range(2 * k - 3):
+                    cc = c1[r2 + j]
+                    for i in range(i0, i1):
+                        out[r0 + 2 + j, i] -= out[r2 + j, i] * cc
+
+
+def _loop_triangle(s, t, q, alpha, beta, gamma, delta, epsilon, p0, n, out):
+    m = s.shape[0]
+    for blk in prange((m + BLOCK_SIZE - 1) // BLOCK_SIZE):
+        i0 = blk * BLOCK_SIZE
+        i1 = min(i0 + BLOCK_SIZE, m)
+        for i in range(i0, i1):
+            out[0, i] = p0
+        for k in range(1, n):
+            r0 = k * (k + 1) // 2
+            r1 = (k - 1) * k // 2
+            for j in range(k):
+                aa = alpha[r1 + j]
+                bb = beta[r1 + j]
+                for i in range(i0, i1):
+                    out[r0 + j, i] = out[r1 + j, i] * (aa * s[i] - bb)
+            for i in range(i0, i1):
+                out[r0 + k, i] = delta[k] * out[r1 + k - 1, i] * t[i]
+            if k > 1:
+                r2 = (k - 2) * (k - 1) // 2
+                for j in range(k - 1):
+                    gg = gamma[r2 + j]
+                    for i in range(i0, i1):
+                        out[r0 + j, i] -= gg * out[r2 + j, i]
+                for i in range(i0, i1):
+                    out[r0 + k, i] -= epsilon[k] * out[r2 + k - 2, i] * q[i]
+
+
+_loops = {"1d": _loop_1d, "135": _loop_135, "triangle": _loop_triangle}
+_compiled = {}
+
+
+def _kernel(name, parallel):
+    global prange
+    if (name, parallel) not in _compiled:
+        import numba
+
+        # the loops pick up numba.prange when they are compiled
+        prange = numba.prange
+        _compiled[name, parallel] = numba.njit(cache=True, parallel=parallel)(
+            _loops[name]
+        )
+    return _compiled[name, parallel]
+
+
+# NumPy fallbacks, one vectorized pass per level
+def _numpy_1d(x, a, b, c, p0, out, work):
+    n = out.shape[0]
+    out[0] = p0
+    for k in range(1, n):
+        np.multiply(x, a[k - 1], out=out[k])
+        out[k] -= b[k - 1]
+        out[k] *= out[k - 1]
+        if k > 1:
+            np.multiply(out[k - 2], c[k - 1], out=work)
+            out[k] -= work
+
+
+def _numpy_135(x, xi0, xi1, z0, z1, c0, c1, p0, n, out, work):
+    out[0] = p0
+    for k in range(1, n):
+        r0 = k * k
+        r1 = (k - 1) * (k - 1)
+        lvl = out[r0 : r0 + 2 * k + 1]
+        last = out[r1 : r1 + 2 * k - 1]
+
+        np.multiply(last[0], xi0, out=lvl[0])
+        lvl[0] *= z0[k]
+
+        o0 = (k - 1) * (k - 1)
+        np.multiply(last, x, out=lvl[1:-1])
+        lvl[1:-1] *= c0[o0 : o0 + 2 * k - 1, None]
+
+        np.multiply(last[-1], xi1, out=lvl[-1])
+        lvl[-1] *= z1[k]
+
+        if k > 1:
+            r2 = (k - 2) * (k - 2)
+            o1 = (k - 2) * (k - 2)
+            w = work[: 2 * k - 3]
+            np.multiply(out[r2 : r2 + 2 * k - 3], c1[o1 : o1 + 2 * k - 3, None], out=w)
+            lvl[2:-2] -= w
+
+
+def _numpy_triangle(s, t, q, alpha, beta, gamma, delta, epsilon, p0, n, out, work):
+    out[0] = p0
+    for k in range(1, n):
+        r0 = k * (k + 1) // 2
+        r1 = (k - 1) * k // 2
+        lvl = out[r0 : r0 + k + 1]
+        last = out[r1 : r1 + k]
+
+        o0 = (k - 1) * k // 2
+        np.multiply.outer(alpha[o0 : o0 + k], s, out=lvl[:-1])
+        lvl[:-1] -= beta[o0 : o0 + k, None]
+        lvl[:-1] *= last
+
+        np.multiply(last[-1], t, out=lvl[-1])
+        lvl[-1] *= delta[k]
+
+        if k > 1:
+            r2 = (k - 2) * (k - 1) // 2
+            o1 = (k - 2) * (k - 1) // 2
+            w = work[: k - 1]
+            np.multiply(out[r2 : r2 + k - 1], gamma[o1 : o1 + k - 1, None], out=w)
+            lvl[:-2] -= w
+
+            np.multiply(out[r2 + k - 2], q, out=work[0])
+            work[0] *= epsilon[k]
+            lvl[-1] -= work[0]
+
+
+def _work(out, rows):
+    return np.empty((rows,) + out.shape[1:], dtype=out.dtype)
+
+
+# dispatch
+def eval_1d(x, coefficients, p0, out, backend="auto", parallel=False, work=None):
+    """Writes the levels 0, ..., len(out)-1 of a three-term recurrence with the packed
+    coefficients `(a, b, c)` (see pack_1d()) at the points `x` (shape (num_points,))
+    into `out` (shape (n, num_points)).
+    """
+    a, b, c = coefficients
+    if _resolve(backend) == "numba":
+        _kernel("1d", parallel)(x, a, b, c, p0, out)
+    else:
+        _numpy_1d(x, a, b, c, p0, out, _work(out, 1)[0] if work is None else work[0])
+    return out
+
+
+def eval_135(
+    x, xi, coefficients, p0, n, out, backend="auto", parallel=False, work=None
+):
+    """Writes the levels 0, ..., n-1 of a 1-3-5 tree with the packed coefficients
+    `(z0, z1, c0, c1)` (see pack_135()) into `out` (shape (n ** 2, num_points)); level k
+    occupies the rows k ** 2, ..., (k + 1) ** 2 - 1.
+    """
+    z0, z1, c0, c1 = coefficients
+    if _resolve(backend) == "numba":
+        _kernel("135", parallel)(x, xi[0], xi[1], z0, z1, c0, c1, p0, n, out)
+    else:
+        if work is None:
+            work = _work(out, max(2 * n - 3, 1))
+        _numpy_135(x, xi[0], xi[1], z0, z1, c0, c1, p0, n, out, work)
+    return out
+
+
+def eval_triangle(
+    s, t, q, coefficients, p0, n, out, backend="auto", parallel=False, work=None
+):
+    """Writes the levels 0, ..., n-1 of a triangle tree with the packed coefficients (see
+    pack_triangle()) into `out` (shape (n * (n + 1) // 2, num_points)); level k
+    occupies the rows k * (k + 1) // 2, ..., (k + 1) * (k + 2) // 2 - 1.
+    """
+    alpha, beta, gamma, delta, epsilon = coefficients
+    if _resolve(backend) == "numba":
+        _kernel("triangle", parallel)(
+            s, t, q, alpha, beta, gamma, delta, epsilon, p0, n, out
+        )
+    else:
+        if work is None:
+            work = _work(out, max(n - 1, 1))
+        _numpy_triangle(s, t, q, alpha, beta, gamma, delta, epsilon, p0, n, out, work)
+    return out
+
+
+def split_levels(out, level_sizes):
+    """Splits the packed array `out` into a list of views, one per level."""
+    return np.split(out, np.cumsum(level_sizes)[:-1])
+
+
+def _unwrap(evaluator):
+    # the family iterators delegate to one of the generic ones
+    for attr in [
+        "_eval",
+        "_eval_1d",
+        "_jacobi_eval",
+        "_gegenbauer_eval",
+        "_eval135",
+        "_eval_135",
+    ]:
+        if hasattr(evaluator, attr):
+            return _unwrap(getattr(evaluator, attr))
+    return evaluator
+
+
+class Kernel:
+    """Fused evaluation of the levels 0, ..., n-1 of the recurrence behind the iterator
+    `evaluator`, at the iterator's points. Supported are the 1D iterators (c1, e1r,
+    e1r2, without the function modes), the 1-3-5 trees (c1.associated_legendre, u3,
+    complex-valued, all orders), t2.Eval, and s2.xu.Eval. The coefficients are packed
+    once; `kernel(out)` writes into `out` of shape (kernel.num_members, *point_shape).
+    """
+
+    def __init__(self, evaluator, n, backend="auto", parallel=False):
+        from .helpers import Eval1D, Eval135
+        from .s2.xu import Eval as XuEval
+        from .t2 import Eval as T2Eval
+
+        ev = _unwrap(evaluator)
+        self.n = n
+        self.backend = backend
+        self.parallel = parallel
+
+        if isinstance(ev, Eval1D):
+            assert ev.weight is None, "The function modes aren't supported."
+            x = np.asarray(ev.x)
+            self.kind = "1d"
+            self.points = (x.reshape(-1),)
+            self.coefficients = pack_1d(ev.rc, n)
+            self.num_members = n
+            dtype = float
+        elif type(ev) is Eval135:
+            assert ev.m_max is None and ev.negative_orders, "All orders are needed."
+            x = np.asarray(ev.x)
+            xi = [np.asarray(v).reshape(-1) for v in ev.xi]
+            self.kind = "135"
+            self.points = (x.reshape(-1), xi)
+            self.coefficients = pack_135(ev.rc, n)
+            self.num_members = num_members_135(n)
+            dtype = np.result_type(float, *xi)
+        elif isinstance(ev, T2Eval):
+            u, v, w = (np.asarray(c) for c in ev.bary)
+            x = u
+            self.kind = "triangle"
+            self.points = tuple(a.reshape(-1) for a in [1 - 2 * w, u - v, (u + v) ** 2])
+            self.coefficients = pack_triangle(lambda k: ev.rc[k], n)
+            self.num_members = num_members_triangle(n)
+            dtype = float
+        elif isinstance(ev, XuEval):
+            x = np.asarray(ev.X[0])
+
+            def coefficients(k):
+                alpha, beta, gamma, delta = ev.rc[k]
+                return alpha, 0.0, gamma, beta, delta
+
+            self.kind = "triangle"
+            self.points = tuple(
+                np.asarray(a).reshape(-1) for a in [ev.X[0], ev.X[1], ev.one_min_x2]
+            )
+            self.coefficients = pack_triangle(coefficients, n)
+            self.num_members = num_members_triangle(n)
+            dtype = float
+        else:
+            raise TypeError(f"No kernel for {type(evaluator).__name__}.")
+
+        self.p0 = float(ev.rc.p0)
+        self.point_shape = x.shape
+        self.dtype = np.dtype(dtype)
+        self.out_shape = (self.num_members,) + self.point_shape
+
+    def empty(self):
+        """Allocates an output array for this kernel."""
+        return np.empty(self.out_shape, dtype=self.dtype)
+
+    def __call__(self, out=None):
+        if out is None:
+            out = self.empty()
+        assert out.shape == self.out_shape
+        flat = out.reshape(self.num_members, -1)
+        args = (self.backend, self.parallel)
+        if self.kind == "1d":
+            eval_1d(*self.points, self.coefficients, self.p0, flat, *args)
+        elif self.kind == "135":
+            eval_135(*self.points, self.coefficients, self.p0, self.n, flat, *args)
+        else:
+            eval_triangle(*self.points, self.coefficients, self.p0, self.n, flat, *args)
+        return out
@@ -0,0 +1,123 @@
+"""Polynomial chaos expansions in the orthonormal product bases of cn and enr2.
+
+All statistics are taken with respect to the probability measure that is proportional to
+the weight function of the family, e.g., the uniform distribution on [-1, 1]^d for cn
+with alpha = beta = 0, or the standard normal distribution for enr2 with
+standardization="probabilists". Since the basis is orthonormal, mean, variance, and
+Sobol indices follow directly from the coefficients and the degree table.
+"""
+import numpy as np
+
+from . import cn, enr2
+from .helpers import multi_index_set, sort_product_degrees
+
+
+class PCE:
+    """Polynomial chaos expansion
+
+        f(x) = sum_alpha c_alpha P_alpha(x)
+
+    over the multi-index set `index_set`, either given explicitly as an integer array of
+    shape (m, dim) or as a spec like `("total", n)` (see helpers.multi_index_set()).
+    `family` is "cn" or "enr2"; further keyword arguments (`alpha`, `beta`,
+    `standardization`) are passed on to the respective Eval.
+
+    Samples are stored along the last axis, just like the points in Eval: `X` has shape
+    (dim, num_samples), the model outputs `Y` have shape (..., num_samples). All outputs
+    are fitted at once; the coefficients have shape (num_basis, ...).
+    """
+
+    def __init__(self, family, dim, index_set, **kwargs):
+        self._eval = {"cn": cn.Eval, "enr2": enr2.Eval}[family]
+        self.kwargs = kwargs
+        self.dim = dim
+
+        if isinstance(index_set, tuple) and isinstance(index_set[0], str):
+            index_set = multi_index_set(dim, *index_set)
+        self.degrees = sort_product_degrees(np.unique(np.asarray(index_set), axis=0))
+        assert self.degrees.shape[1] == dim
+
+        # The basis is orthonormal, so P_0 = 1 / sqrt(W) with the total mass W of the
+        # weight function.
+        p0 = next(self._eval(np.zeros((dim, 1)), **kwargs))[0, 0]
+        self.weight_mass = 1 / p0 ** 2
+
+        self.coefficients = None
+
+    def basis(self, X):
+        """Returns the values of all basis functions at `X`, shape (num_basis,
+        num_samples).
+        """
+        evaluator = self._eval(np.asarray(X), index_set=self.degrees, **self.kwargs)
+        return np.concatenate(list(evaluator))
+
+    def fit(self, X, Y, rcond=None):
+        """Least-squares fit of the coefficients to the samples `(X, Y)`. One
+        factorization is shared by all outputs.
+        """
+        V = self.basis(X)
+        Y = np.asarray(Y)
+        rhs = Y.reshape(-1, Y.shape[-1]).T
+        c, _, _, _ = np.linalg.lstsq(V.T, rhs, rcond=rcond)
+        self.coefficients = c.reshape(c.shape[:1] + Y.shape[:-1])
+        return self
+
+    def project(self, X, weights, Y):
+        """Computes the coefficients by discrete projection, c_alpha = sum_j weights[j]
+        P_alpha(X[:, j]) Y[..., j], with a quadrature rule `(X, weights)` for the weight
+        function of the family.
+        """
+        V = self.basis(X)
+        Y = np.asarray(Y)
+        rhs = Y.reshape(-1, Y.shape[-1]).T
+        c = (V * weights) @ rhs
+        self.coefficients = c.reshape(c.shape[:1] + Y.shape[:-1])
+        return self
+
+    def __call__(self, X):
+        """Evaluates the expansion at `X`; the result has the shape (..., num_samples)."""
+        return np.tensordot(self.coefficients, self.basis(X), axes=([0], [0]))
+
+    @property
+    def _partial_variances(self):
+        # Var[c_alpha P_alpha] = c_alpha^2 / W for alpha != 0
+        c = np.asarray(self.coefficients)
+        return np.moveaxis(c ** 2, 0, -1) / self.weight_mass
+
+    @property
+    def mean(self):
+        is_zero = np.all(self.degrees == 0, axis=1)
+        if not np.any(is_zero):
+            return np.zeros(np.shape(self.coefficients)[1:])
+        # E[P_0] = P_0 = 1 / sqrt(W), E[P_alpha] = 0 otherwise
+        return self.coefficients[np.argmax(is_zero)] / np.sqrt(self.weight_mass)
+
+    @property
+    def variance(self):
+        is_nonzero = np.any(self.degrees > 0, axis=1)
+        return np.sum(self._partial_variances[..., is_nonzero], axis=-1)
+
+    @property
+    def sobol_first(self):
+        """First-order Sobol indices, shape (dim, ...). S_i is the variance fraction
+        of all terms that only depend on x_i.
+        """
+        return self._sobol(
+            [
+                (self.degrees[:, i] > 0)
+                & (np.sum(self.degrees, axis=1) == self.degrees[:, i])
+                for i in range(self.dim)
+            ]
+        )
+
+    @property
+    def sobol_total(self):
+        """Total Sobol indices, shape (dim, ...). T_i is the variance fraction of all
+        terms that depend on x_i.
+        """
+        return self._sobol([self.degrees[:, i] > 0 for i in range(self.dim)])
+
+    def _sobol(self, masks):
+        pv = self._partial_variances
+        var = self.variance
+        return np.array([np.sum(pv[..., mask], axis=-1) / var for mask in masks])
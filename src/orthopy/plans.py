@@ -0,0 +1,172 @@
+"""Reusable evaluation plans.
+
+A plan fixes the family, the number of levels `n`, and the shape and dtype of the point
+array. All recurrence coefficients are computed and packed once on construction, and all
+intermediate buffers are owned by the plan, so a call
+
+    plan(X, out=buf)
+
+does no coefficient work and, with the numba backend, no allocations; the NumPy backend
+only allocates a few temporary Python objects (views), never point-sized arrays.
+
+The result holds the members of the levels 0, ..., n-1 one after another, shape
+(num_members, *shape_of_one_coordinate); `plan.levels(out)` splits it into views, one
+per level, just like the iterators would produce them.
+"""
+import numpy as np
+
+from . import kernels
+from .helpers import product_degrees
+
+
+class PlanBase:
+    """Output allocation, validation, and level splitting shared by all plans."""
+
+    def __init__(self, n, point_shape, dtype, level_sizes):
+        self.n = n
+        self.point_shape = tuple(point_shape)
+        self.num_points = int(np.prod(self.point_shape))
+        self.dtype = np.dtype(dtype)
+        self.level_sizes = level_sizes
+        self.num_members = int(sum(level_sizes))
+        self.out_shape = (self.num_members,) + self.point_shape
+
+    def empty(self):
+        """Allocates an output array for this plan."""
+        return np.empty(self.out_shape, dtype=self.dtype)
+
+    def levels(self, out):
+        """Splits the output `out` into a list of views, one per level."""
+        return kernels.split_levels(out, self.level_sizes)
+
+    def _check_out(self, out):
+        if out is None:
+            return self.empty()
+        assert out.shape == self.out_shape
+        assert out.dtype == self.dtype
+        assert out.flags.c_contiguous
+        return out
+
+    def _flat(self, out):
+        return out.reshape(self.num_members, self.num_points)
+
+    def _points(self, x):
+        # a view for contiguous input
+        return np.ascontiguousarray(x, dtype=float).reshape(-1)
+
+
+class Plan1D(PlanBase):
+    """Plan for the 1D three-term recurrence with the coefficients `rc`, at points of
+    shape `shape`.
+    """
+
+    def __init__(self, rc, n, shape, dtype=float, backend="auto", parallel=False):
+        super().__init__(n, shape, dtype, [1] * n)
+        self.coefficients = kernels.pack_1d(rc, n)
+        self.p0 = float(rc.p0)
+        self.backend = backend
+        self.parallel = parallel
+        self._work = np.empty((1, self.num_points), dtype=self.dtype)
+
+    def __call__(self, x, out=None):
+        out = self._check_out(out)
+        kernels.eval_1d(
+            self._points(x),
+            self.coefficients,
+            self.p0,
+            self._flat(out),
+            self.backend,
+            self.parallel,
+            self._work,
+        )
+        return out
+
+
+class Plan135(PlanBase):
+    """Plan for the 1-3-5 tree with the coefficients `rc`. Calls take `x` and the pair
+    `xi` (see helpers.Eval135).
+    """
+
+    def __init__(self, rc, n, shape, dtype=float, backend="auto", parallel=False):
+        super().__init__(n, shape, dtype, [2 * k + 1 for k in range(n)])
+        self.coefficients = kernels.pack_135(rc, n)
+        self.p0 = float(rc.p0)
+        self.backend = backend
+        self.parallel = parallel
+        self._work = np.empty((max(2 * n - 3, 1), self.num_points), dtype=self.dtype)
+
+    def __call__(self, x, xi, out=None):
+        out = self._check_out(out)
+        kernels.eval_135(
+            self._points(x),
+            [np.asarray(v, dtype=self.dtype).reshape(-1) for v in xi],
+            self.coefficients,
+            self.p0,
+            self.n,
+            self._flat(out),
+            self.backend,
+            self.parallel,
+            self._work,
+        )
+        return out
+
+
+class PlanTriangle(PlanBase):
+    """Plan for the triangle tree (see kernels.pack_triangle()). Calls take the three
+    auxiliary arrays `s`, `t`, `q`.
+    """
+
+    def __init__(
+        self, coefficients, p0, n, shape, dtype=float, backend="auto", parallel=False
+    ):
+        super().__init__(n, shape, dtype, [k + 1 for k in range(n)])
+        self.coefficients = kernels.pack_triangle(coefficients, n)
+        self.p0 = float(p0)
+        self.backend = backend
+        self.parallel = parallel
+        self._work = np.empty((max(n - 1, 1), self.num_points), dtype=self.dtype)
+
+    def __call__(self, s, t, q, out=None):
+        out = self._check_out(out)
+        kernels.eval_triangle(
+            self._points(s),
+            self._points(t),
+            self._points(q),
+            self.coefficients,
+            self.p0,
+            self.n,
+            self._flat(out),
+            self.backend,
+            self.parallel,
+            self._work,
+        )
+        return out
+
+
+class ProductPlan(PlanBase):
+    """Plan for the product tree of dimension `shape[0]` with the 1D coefficients `rc`,
+    same ordering as helpers.ProductEvalWithDegrees. The 1D polynomials are evaluated per
+    coordinate; the members are then formed by gathering and multiplying.
+    """
+
+    def __init__(self, rc, n, shape, dtype=float, backend="auto", parallel=False):
+        self.dim = shape[0]
+        degrees = product_degrees(self.dim, n - 1)
+        super().__init__(n, shape[1:], dtype, [len(d) for d in degrees])
+        self.degrees = np.concatenate(degrees)
+
+        self._plan_1d = Plan1D(rc, n, shape[1:], dtype, backend, parallel)
+        self._values_1d = np.empty((self.dim, n, self.num_points), dtype=self.dtype)
+        self._gather = np.empty((self.num_members, self.num_points), dtype=self.dtype)
+
+    def __call__(self, X, out=None):
+        out = self._check_out(out)
+        flat = self._flat(out)
+        V = self._values_1d
+        for i in range(self.dim):
+            self._plan_1d(X[i], out=V[i].reshape(self._plan_1d.out_shape))
+        np.take(V[0], self.degrees[:, 0], axis=0, out=flat, mode="clip")
+        for i in range(1, self.dim):
+            np.take(V[i], self.degrees[:, i], axis=0, out=self._gather, mode="clip")
+            flat *= self._gather
+        return out
@@ -2,6 +2,8 @@ import itertools
 
 import numpy as np
 
+from ..tree_plot import savefig_in_worker, tripcolor_tree
+
 
 def plot_single(
     name,
@@ -49,11 +51,17 @@ def plot_single(
     )
 
 
-def savefig_tree(filename, *args, dpi=None, **kwargs):
+def savefig_tree(filename, *args, dpi=None, executor=None, **kwargs):
     from matplotlib import pyplot as plt
 
+    savefig_kwargs = {"dpi": dpi, "transparent": True, "bbox_inches": "tight"}
+    if executor is not None:
+        return executor.submit(
+            savefig_in_worker, plot_tree, filename, args, kwargs, savefig_kwargs
+        )
+
     plot_tree(*args, **kwargs)
-    plt.savefig(filename, dpi=dpi, transparent=True, bbox_inches="tight")
+    plt.savefig(filename, **savefig_kwargs)
 
 
 def show_tree(*args, **kwargs):
@@ -79,33 +87,31 @@ def plot_tree(
     import matplotx
     import meshzoo
     from matplotlib import pyplot as plt
+    from matplotlib.collections import PatchCollection
 
     plt.style.use(matplotx.styles.dufte)
 
     points, cells = meshzoo.disk(6, res)
     evaluator = evaluator(points.T, scaling)
+    # copy each level; zernike.Eval rescales a member of the previous level in place
+    values = np.concatenate([np.array(v) for v in itertools.islice(evaluator, n + 1)])
 
     plt.set_cmap(cmap)
     plt.gca().set_aspect("equal")
     plt.axis("off")
 
-    for k, level in enumerate(itertools.islice(evaluator, n + 1)):
-        for r, z in enumerate(level):
-            pts = points.copy()
-            offset = [2.6 * (r - k / 2), -2.3 * k]
-
-            pts[:, 0] += offset[0]
-            pts[:, 1] += offset[1]
-
-            plt.tripcolor(pts[:, 0], pts[:, 1], cells, z, shading="flat")
-            plt.clim(clim)
-
-            # circle outline
-            circle = plt.Circle(offset, 1.0, edgecolor="k", fill=False)
-            plt.gca().add_patch(circle)
+    shifts = np.array(
+        [[2.6 * (r - k / 2), -2.3 * k] for k in range(n + 1) for r in range(k + 1)]
+    )
+    tripcolor_tree(points, cells, shifts, values, clim, colorbar)
 
-    if colorbar:
-        plt.colorbar()
+    # circle outlines
+    circles = PatchCollection(
+        [plt.Circle(offset, 1.0) for offset in shifts],
+        edgecolor="k",
+        facecolor="none",
+    )
+    plt.gca().add_collection(circles)
 
     if show_title:
         plt.title(f"{name} orthogonal polynomials on the disk ({scaling})")
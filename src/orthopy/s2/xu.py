@@ -4,6 +4,8 @@ import numpy as np
 import sympy
 from numpy.typing import ArrayLike
 
+from ..plans import PlanTriangle
+
 try:
     # Python 3.8+
     from typing import Literal
@@ -31,11 +33,19 @@ def plot_single(*args, **kwargs):
     ps("Xu", Eval, *args, **kwargs)
 
 
-def savefig_tree(filename, *args, **kwargs):
+def savefig_tree(filename, *args, executor=None, **kwargs):
     from matplotlib import pyplot as plt
 
+    from ..tree_plot import savefig_in_worker
+
+    savefig_kwargs = {"transparent": True, "bbox_inches": "tight"}
+    if executor is not None:
+        return executor.submit(
+            savefig_in_worker, plot_tree, filename, args, kwargs, savefig_kwargs
+        )
+
     plot_tree(*args, **kwargs)
-    plt.savefig(filename, transparent=True, bbox_inches="tight")
+    plt.savefig(filename, **savefig_kwargs)
 
 
 def show_tree(*args, **kwargs):
@@ -119,6 +129,31 @@ class Eval:
         return out
 
 
+class Plan(PlanTriangle):
+    """Reusable plan for the levels 0, ..., n-1 of the tree at points of shape `shape`
+    (with `shape[0] == 2`); `plan(X, out=buf)` writes all members into `buf`, see
+    orthopy.plans.
+    """
+
+    def __init__(self, n, scaling, shape, dtype=float, backend="auto", parallel=False):
+        assert shape[0] == 2
+        rc = {"classical": RCClassical, "monic": RCMonic, "normal": RCNormal}[scaling](
+            False
+        )
+
+        def coefficients(k):
+            alpha, beta, gamma, delta = rc[k]
+            return alpha, 0.0, gamma, beta, delta
+
+        super().__init__(coefficients, rc.p0, n, shape[1:], dtype, backend, parallel)
+        self._one_min_x2 = np.empty(shape[1:])
+
+    def __call__(self, X, out=None):
+        np.multiply(X[0], X[0], out=self._one_min_x2)
+        np.subtract(1.0, self._one_min_x2, out=self._one_min_x2)
+        return super().__call__(X[0], X[1], self._one_min_x2, out)
+
+
 class RCClassical:
     """The maximum values (which are attained at (1, 0) for the first and (0, 1) for the
     last polynomial in each level) is 1.
@@ -3,6 +3,11 @@ import math
 import numpy as np
 import sympy
 
+from ..c1 import jacobi
+from ..helpers import Eval1D
+from ..plans import PlanBase
+from ..tools import quadrature
+
 
 def savefig_single(filename, *args, **kwargs):
     from matplotlib import pyplot as plt
@@ -24,11 +29,19 @@ def plot_single(*args, **kwargs):
     ps("Zernike", Eval, *args, **kwargs)
 
 
-def savefig_tree(filename, *args, dpi=None, **kwargs):
+def savefig_tree(filename, *args, dpi=None, executor=None, **kwargs):
     from matplotlib import pyplot as plt
 
+    from ..tree_plot import savefig_in_worker
+
+    savefig_kwargs = {"dpi": dpi, "transparent": True, "bbox_inches": "tight"}
+    if executor is not None:
+        return executor.submit(
+            savefig_in_worker, plot_tree, filename, args, kwargs, savefig_kwargs
+        )
+
     plot_tree(*args, **kwargs)
-    plt.savefig(filename, dpi=dpi, transparent=True, bbox_inches="tight")
+    plt.savefig(filename, **savefig_kwargs)
 
 
 def show_tree(*args, **kwargs):
@@ -111,6 +124,174 @@ class Eval:
         return out
 
 
+class Plan(PlanBase):
+    """Reusable plan for the levels 0, ..., n-1 of the tree at points of shape `shape`
+    (with `shape[0] == 2`); `plan(X, out=buf)` writes all members into `buf`, see
+    orthopy.plans. Always uses NumPy.
+    """
+
+    def __init__(self, n, scaling, shape, dtype=float):
+        assert shape[0] == 2
+        super().__init__(n, shape[1:], dtype, [k + 1 for k in range(n)])
+        rc = {"classical": RCClassical, "normal": RCNormal}[scaling](False)
+        self.p0 = float(rc.p0)
+        self.coefficients = [None] + [rc[k] for k in range(1, n)]
+        m = max(n - 1, 1)
+        # Eval scales the central member of the previous level in place; the plan
+        # works on (alternating) scaled copies instead.
+        self._scaled = np.empty((2, m, self.num_points), dtype=self.dtype)
+        self._last_X = np.empty((m, self.num_points), dtype=self.dtype)
+        self._last_Y = np.empty((m, self.num_points), dtype=self.dtype)
+
+    def __call__(self, X, out=None):
+        out = self._check_out(out)
+        flat = self._flat(out)
+        x = self._points(X[0])
+        y = self._points(X[1])
+
+        flat[0] = self.p0
+        for L in range(1, self.n):
+            alpha, beta, gamma = self.coefficients[L]
+            lvl = flat[L * (L + 1) // 2 : (L + 1) * (L + 2) // 2]
+            n = L + 1
+            half = n // 2
+
+            last = self._scaled[L % 2, :L]
+            last[...] = flat[(L - 1) * L // 2 : L * (L + 1) // 2]
+            if n % 2 == 0 and n > 2:
+                last[half - 1] *= beta
+
+            last_X = self._last_X[:L]
+            last_Y = self._last_Y[:L]
+            np.multiply(last, x, out=last_X)
+            last_X *= alpha
+            np.multiply(last, y, out=last_Y)
+            last_Y *= alpha
+
+            lvl[...] = 0.0
+            lvl[:-1] += last_X
+            lvl[:-1] += last_Y[::-1]
+            lvl[1:] += last_X
+            lvl[1:] -= last_Y[::-1]
+
+            if n % 2 == 0:
+                lvl[half - 1] -= last_X[half - 1]
+                lvl[half] += last_Y[half - 1]
+            else:
+                lvl[half] += last_X[half]
+                lvl[half] += last_Y[half - 1]
+
+            if L > 1:
+                last1 = self._scaled[(L - 1) % 2, : L - 1]
+                np.multiply(last1, gamma, out=last_X[: L - 1])
+                lvl[1:-1] -= last_X[: L - 1]
+
+            if n % 2 == 1:
+                lvl[half] *= 1 / beta
+        return out
+
+
+def polar_grid(num_rho):
+    """Gauss rule with `num_rho` rings for int_0^1 f(rho) rho drho; returns the radii
+    and the weights. Together with `num_theta` equispaced angles, the polar grid
+    integrates all products of members of the levels 0, ..., n-1 exactly if
+    2 * num_rho >= n and num_theta >= 2 * n - 1.
+    """
+    # t = 2 rho^2 - 1, rho drho = dt / 4
+    rc = jacobi.RecurrenceCoefficients("monic", 0, 0, symbolic=False)
+    t, weights = quadrature.gauss(rc, num_rho, rc.int_1)
+    return np.sqrt((1 + t) / 2), weights / 4
+
+
+def polar_synthesize(coeffs, scaling, rho, num_theta):
+    """Values of the expansions in the members of Eval with the coefficients `coeffs`,
+    shape (num_members, ...), on the polar grid of the radii `rho` and the angles
+    theta_j = 2 pi j / num_theta. The trailing axes of `coeffs` are a batch.
+
+    The members are R_k^|m|(rho) cos(m theta) (m >= 0) and R_k^|m|(rho) sin(|m| theta)
+    (m < 0), so the radial polynomials are computed once per ring and the angular sums
+    are done with one FFT per ring. Returns the shape (len(rho), num_theta, ...).
+    """
+    coeffs = np.asarray(coeffs)
+    n = _num_levels(len(coeffs))
+    rho = np.asarray(rho)
+    batch_shape = coeffs.shape[1:]
+    c = coeffs.reshape(len(coeffs), -1)
+
+    spectrum = np.zeros((len(rho), num_theta, c.shape[1]), dtype=complex)
+    for m, R, cos_idx, sin_idx in _radial(scaling, n, rho):
+        spectrum[:, m % num_theta] += R.T @ c[cos_idx]
+        if m > 0:
+            spectrum[:, m % num_theta] -= 1j * (R.T @ c[sin_idx])
+
+    values = num_theta * np.fft.ifft(spectrum, axis=1).real
+    return values.reshape((len(rho), num_theta) + batch_shape)
+
+
+def polar_analyze(values, scaling, n, rho, rho_weights):
+    """Coefficients of the levels 0, ..., n-1 of the L2-projection of the function with
+    the `values` on the polar grid, shape (len(rho), num_theta, ...), see
+    polar_synthesize(). `rho_weights` are the weights of a rule for
+    int_0^1 f(rho) rho drho at `rho`, e.g., from polar_grid(). Returns the shape
+    (num_members, ...).
+    """
+    values = np.asarray(values)
+    rho = np.asarray(rho)
+    num_theta = values.shape[1]
+    batch_shape = values.shape[2:]
+    f = values.reshape(len(rho), num_theta, -1)
+
+    # int_0^2pi f cos(m theta) = a_m, int_0^2pi f sin(m theta) = b_m
+    F = 2 * np.pi / num_theta * np.fft.fft(f, axis=1)
+
+    coeffs = np.zeros((n * (n + 1) // 2, f.shape[2]))
+    for m, R, cos_idx, sin_idx in _radial(scaling, n, rho):
+        Rw = R * rho_weights
+        # the squared norms of the members
+        k = np.arange(m, n, 2)
+        norms = _scale(scaling, k, m) ** 2 * np.pi / (2 * k + 2)
+        if m == 0:
+            norms *= 2
+        coeffs[cos_idx] = (Rw @ F[:, m % num_theta].real) / norms[:, None]
+        if m > 0:
+            coeffs[sin_idx] = (Rw @ -F[:, m % num_theta].imag) / norms[:, None]
+    return coeffs.reshape((len(coeffs),) + batch_shape)
+
+
+def _num_levels(num_members):
+    n = int(round((math.sqrt(8 * num_members + 1) - 1) / 2))
+    assert n * (n + 1) // 2 == num_members
+    return n
+
+
+def _scale(scaling, k, m):
+    """Factor between the members of the given scaling and R_k^m cos(m theta)."""
+    if scaling == "classical":
+        return np.ones(len(k))
+    assert scaling == "normal"
+    return np.sqrt((2 * k + 2) / (np.pi * (2 if m == 0 else 1)))
+
+
+def _radial(scaling, n, rho):
+    """For m = 0, ..., n-1, the scaled radial polynomials of the levels k = m, m+2, ...,
+    shape (num_k, len(rho)), with the indices of their cos and sin members in the tree.
+    The radial polynomials are
+
+      R_k^m(rho) = rho^m P_{(k-m)/2}^{(0, m)}(2 rho^2 - 1)
+
+    with the Jacobi polynomials in the classical scaling.
+    """
+    t = 2 * rho ** 2 - 1
+    for m in range(n):
+        k = np.arange(m, n, 2)
+        # not RecurrenceCoefficients, its int_1 overflows for large m
+        evaluator = Eval1D(t, jacobi._RCClassical(0, m, symbolic=False))
+        R = np.array([next(evaluator) for _ in range(len(k))]) * rho ** m
+        R *= _scale(scaling, k, m)[:, None]
+        first = k * (k + 1) // 2
+        yield m, R, first + (k + m) // 2, first + (k - m) // 2
+
+
 class RCClassical:
     def __init__(self, symbolic):
         self.p0 = 1
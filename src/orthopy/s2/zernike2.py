@@ -12,6 +12,7 @@ import numpy as np
 import sympy
 from numpy.typing import ArrayLike
 
+from ..plans import PlanBase
 from .tools import plot_single as ps
 
 
@@ -33,11 +34,19 @@ def plot_single(*args, **kwargs):
     ps("Zernike-2", Eval, *args, **kwargs)
 
 
-def savefig_tree(filename, *args, **kwargs):
+def savefig_tree(filename, *args, executor=None, **kwargs):
     from matplotlib import pyplot as plt
 
+    from ..tree_plot import savefig_in_worker
+
+    savefig_kwargs = {"transparent": True, "bbox_inches": "tight"}
+    if executor is not None:
+        return executor.submit(
+            savefig_in_worker, plot_tree, filename, args, kwargs, savefig_kwargs
+        )
+
     plot_tree(*args, **kwargs)
-    plt.savefig(filename, transparent=True, bbox_inches="tight")
+    plt.savefig(filename, **savefig_kwargs)
 
 
 def show_tree(*args, **kwargs):
@@ -106,6 +115,59 @@ class Eval:
         return out
 
 
+class Plan(PlanBase):
+    """Reusable plan for the levels 0, ..., n-1 of the tree at points of shape `shape`
+    (with `shape[0] == 2`); `plan(X, out=buf)` writes all members into `buf`, see
+    orthopy.plans. Always uses NumPy.
+    """
+
+    def __init__(self, n: int, scaling: str, shape, dtype=float):
+        assert shape[0] == 2
+        super().__init__(n, shape[1:], dtype, [k + 1 for k in range(n)])
+        rc = {"classical": RCClassical, "monic": RCMonic, "normal": RCNormal}[scaling](
+            False
+        )
+        self.p0 = float(rc.p0)
+        # per-member coefficients as columns
+        self.coefficients = [None] + [
+            tuple(
+                None if c is None else np.broadcast_to(np.asarray(c, dtype=float), (m,))
+                for c, m in zip(rc[k], [k, k, k - 1])
+            )
+            for k in range(1, n)
+        ]
+        self._last_X = np.empty((max(n - 1, 1), self.num_points), dtype=self.dtype)
+        self._last_Y = np.empty((max(n - 1, 1), self.num_points), dtype=self.dtype)
+
+    def __call__(self, X, out=None):
+        out = self._check_out(out)
+        flat = self._flat(out)
+        x = self._points(X[0])
+        y = self._points(X[1])
+
+        flat[0] = self.p0
+        for L in range(1, self.n):
+            alpha, beta, gamma = self.coefficients[L]
+            lvl = flat[L * (L + 1) // 2 : (L + 1) * (L + 2) // 2]
+            last = flat[(L - 1) * L // 2 : L * (L + 1) // 2]
+            last_X = self._last_X[:L]
+            last_Y = self._last_Y[:L]
+            np.multiply(last, x, out=last_X)
+            np.multiply(last, y, out=last_Y)
+
+            np.add(last_X, last_Y[::-1], out=lvl[1:])
+            lvl[1:] *= alpha[:, None]
+            lvl[0] = 0.0
+            np.subtract(last_X, last_Y[::-1], out=last_X)
+            last_X *= beta[:, None]
+            lvl[:-1] += last_X
+            if L > 1:
+                last1 = flat[(L - 2) * (L - 1) // 2 : (L - 1) * L // 2]
+                np.multiply(last1, gamma[:, None], out=last_Y[: L - 1])
+                lvl[1:-1] -= last_Y[: L - 1]
+        return out
+
+
 class RCClassical:
     def __init__(self, _):
         self.p0 = 1
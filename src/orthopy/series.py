@@ -0,0 +1,221 @@
+"""Expansions
+
+    f(x) = sum_k c_k P_k(x)
+
+in the orthogonal polynomials of a 1D family, with arithmetic and calculus in
+coefficient space.
+"""
+import functools
+import importlib
+import numbers
+
+import numpy as np
+
+from .helpers import Eval1D
+from .tools.quadrature import gauss
+
+
+class Series:
+    """Series in the polynomials of `family` ("c1.jacobi", "c1.legendre",
+    "c1.gegenbauer", "c1.chebyshev1", "c1.chebyshev2", "e1r", "e1r2") with the
+    parameters `params` of the family's RecurrenceCoefficients, e.g.,
+
+        orthopy.Series("c1.jacobi", ("normal", 0.5, 0.5), coeffs)
+
+    `coeffs` has the shape (n, ...); the trailing axes hold a batch of series, all
+    operations act on all of them at once.
+    """
+
+    def __init__(self, family, params, coeffs):
+        self.family = family
+        self.params = tuple(params)
+        self.coeffs = np.asarray(coeffs)
+        assert self.coeffs.ndim >= 1
+
+    @property
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    @property
+    def batch_shape(self):
+        return self.coeffs.shape[1:]
+
+    def __call__(self, x):
+        """Values at `x` with Clenshaw's algorithm,
+
+          y_k = c_k + (a_k x - b_k) y_{k+1} - c_{k+1} y_{k+2},  f(x) = p_0 y_0,
+
+        shape (*batch_shape, *x.shape). Only two arrays of that size are kept.
+        """
+        x = np.asarray(x)
+        n = len(self.coeffs)
+        abc = _table(self.family, self.params, n)
+        coeffs = self.coeffs.reshape(self.coeffs.shape + (1,) * x.ndim)
+
+        y1 = np.zeros(self.batch_shape + x.shape, dtype=np.result_type(coeffs, x))
+        y2 = np.zeros_like(y1)
+        for k in range(n - 1, -1, -1):
+            a, b, _ = abc[k]
+            y = coeffs[k] + (a * x - b) * y1
+            if k < n - 2:
+                y -= abc[k + 1, 2] * y2
+            y1, y2 = y, y1
+        return _p0(self.family, self.params) * y1
+
+    def truncate(self, n):
+        """The first n terms."""
+        return self._new(self.coeffs[:n])
+
+    def deriv(self, m=1):
+        """The m-th derivative."""
+        coeffs = self.coeffs
+        for _ in range(m):
+            n = len(coeffs)
+            if n == 1:
+                coeffs = np.zeros_like(coeffs)
+                continue
+            D = _derivative_matrix(self.family, self.params, n)
+            coeffs = np.tensordot(D[:-1], coeffs, axes=(1, 0))
+        return self._new(coeffs)
+
+    def integ(self, m=1, k=(), lbnd=0):
+        """The m-th antiderivative. As in numpy.polynomial, the value of the j-th
+        integral at lbnd is k[j] (padded with zeros; a number if m == 1).
+        """
+        k = list(np.atleast_1d(k)) + [0] * (m - len(np.atleast_1d(k)))
+        series = self
+        for j in range(m):
+            c = series.coeffs
+            n = len(c)
+            D = _derivative_matrix(self.family, self.params, n + 1)
+            # D[:n, 1:] is upper triangular: back substitution
+            out = np.zeros((n + 1,) + c.shape[1:], dtype=np.result_type(c, float))
+            for i in range(n - 1, -1, -1):
+                rhs = c[i] - np.tensordot(D[i, i + 2 :], out[i + 2 :], axes=(0, 0))
+                out[i + 1] = rhs / D[i, i + 1]
+            series = self._new(out)
+            # fix the constant
+            out[0] = (k[j] - series(lbnd)) / _p0(self.family, self.params)
+        return series
+
+    def __neg__(self):
+        return self._new(-self.coeffs)
+
+    def __add__(self, other):
+        if isinstance(other, numbers.Number):
+            coeffs = self.coeffs.astype(np.result_type(self.coeffs, other), copy=True)
+            coeffs[0] += other / _p0(self.family, self.params)
+            return self._new(coeffs)
+        self._check(other)
+        n = max(len(self.coeffs), len(other.coeffs))
+        return self._new(_pad(self.coeffs, n) + _pad(other.coeffs, n))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        """Products with numbers or other series; the latter are linearized by the
+        transform to values at the Gauss points of the family and back, which is exact.
+        """
+        if isinstance(other, numbers.Number):
+            return self._new(self.coeffs * other)
+        self._check(other)
+        n = len(self.coeffs) + len(other.coeffs) - 1
+        points, weights = _gauss(self.family, self.params, n)
+        V = _vandermonde(self.family, self.params, n)
+        n1 = len(self.coeffs)
+        n2 = len(other.coeffs)
+        values = np.tensordot(V[:n1], self.coeffs, axes=(0, 0)) * np.tensordot(
+            V[:n2], other.coeffs, axes=(0, 0)
+        )
+        # coefficient k = <f, P_k> / <P_k, P_k>
+        norms = V ** 2 @ weights
+        coeffs = np.tensordot(V * weights / norms[:, None], values, axes=(1, 0))
+        return self._new(coeffs)
+
+    __rmul__ = __mul__
+
+    def _new(self, coeffs):
+        return Series(self.family, self.params, coeffs)
+
+    def _check(self, other):
+        assert isinstance(other, Series)
+        assert (self.family, self.params) == (other.family, other.params)
+
+
+def _pad(coeffs, n):
+    out = np.zeros((n,) + coeffs.shape[1:], dtype=coeffs.dtype)
+    out[: len(coeffs)] = coeffs
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def _recurrence_coefficients(family, params):
+    module = importlib.import_module(f"orthopy.{family}")
+    return module.RecurrenceCoefficients(*params, symbolic=False)
+
+
+def _p0(family, params):
+    return float(_recurrence_coefficients(family, params).p0)
+
+
+@functools.lru_cache(maxsize=64)
+def _table(family, params, n):
+    """Float table of rc[k] = (a_k, b_k, c_k), k < n. c_0 is never used; set it to 0."""
+    rc = _recurrence_coefficients(family, params)
+    table = np.zeros((n, 3))
+    for k in range(n):
+        a, b, c = rc[k]
+        table[k] = [a, b, 0.0 if k == 0 else c]
+    return table
+
+
+@functools.lru_cache(maxsize=64)
+def _derivative_matrix(family, params, n):
+    """n x n matrix D with P_k' = sum_i D[i, k] P_i, from
+
+      P_{k+1}' = a_k P_k + (a_k x - b_k) P_k' - c_k P_{k-1}'
+
+    and the multiplication by x in coefficient space,
+
+      x P_j = (P_{j+1} + b_j P_j + c_j P_{j-1}) / a_j.
+    """
+    abc = _table(family, params, n)
+    a, b, c = abc.T
+    D = np.zeros((n, n))
+    for k in range(n - 1):
+        v = D[:, k]
+        # x * v (v has entries below k only)
+        xv = np.zeros(n)
+        xv[1 : k + 1] += v[:k] / a[:k]
+        xv[: k + 1] += v[: k + 1] * b[: k + 1] / a[: k + 1]
+        xv[:k] += v[1 : k + 1] * c[1 : k + 1] / a[1 : k + 1]
+
+        col = a[k] * xv - b[k] * v
+        col[k] += a[k]
+        if k > 0:
+            col -= c[k] * D[:, k - 1]
+        D[:, k + 1] = col
+    D.setflags(write=False)
+    return D
+
+
+@functools.lru_cache(maxsize=64)
+def _gauss(family, params, n):
+    # The weights are only needed up to a constant factor.
+    return gauss(_recurrence_coefficients(family, params), n, 1.0)
+
+
+@functools.lru_cache(maxsize=64)
+def _vandermonde(family, params, n):
+    """Values of P_0, ..., P_{n-1} at the n Gauss points, shape (n, n)."""
+    points, _ = _gauss(family, params, n)
+    evaluator = Eval1D(points, _recurrence_coefficients(family, params))
+    V = np.array([next(evaluator) for _ in range(n)])
+    V.setflags(write=False)
+    return V
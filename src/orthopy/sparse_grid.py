@@ -0,0 +1,123 @@
+"""Smolyak sparse grids for the product domains cn and enr2.
+
+With 1D rules Q_m of m = l + 1 points at level l, the level-q Smolyak rule is the
+combination
+
+  sum_{q - d + 1 <= |l| <= q} (-1)^(q - |l|) binom(d - 1, q - |l|) Q_{l_1} x ... x Q_{l_d},
+
+which needs far fewer points than the full tensor rule. With Gauss rules, it integrates
+all polynomials of total degree 2q + 1 exactly; with nested (Leja) rules, it interpolates
+in the total-degree space of degree q.
+"""
+import math
+
+import numpy as np
+
+from .helpers import Eval1D, multi_index_set
+
+
+class SparseGrid:
+    """Smolyak sparse grid in `dim` dimensions of level `level` built from the 1D rules
+    `rule(m) -> (points, weights)`. `rc` are the recurrence coefficients of the
+    (normalized) 1D basis, such that the interpolation operator maps onto the same
+    product basis as the respective Eval.
+
+    Duplicate nodes of the tensor grids are merged (after rounding to `decimals`), their
+    weights added up. Attributes:
+
+      * points:  shape (dim, num_points)
+      * weights: shape (num_points,)
+      * degrees: the multi-indices of the interpolation basis, (num_basis, dim), in the
+        order of the product tree
+      * interpolation_matrix: shape (num_basis, num_points); maps function values at the
+        points to coefficients in the product basis
+    """
+
+    def __init__(self, rule, rc, dim, level, decimals=12):
+        self.dim = dim
+        self.level = level
+
+        rules = [rule(m) for m in range(1, level + 2)]
+        # inverse transposed 1D Vandermonde matrices: values at the nodes -> coefficients
+        inv_vt = []
+        for x, _ in rules:
+            evaluator = Eval1D(np.asarray(x), rc)
+            V = np.array([next(evaluator) for _ in range(len(x))])
+            inv_vt.append(np.linalg.inv(V.T))
+
+        self.degrees = multi_index_set(dim, "total", level)
+        basis_index = {tuple(alpha): k for k, alpha in enumerate(self.degrees)}
+
+        levels = multi_index_set(dim, "total", level)
+        levels = levels[np.sum(levels, axis=1) >= level - dim + 1]
+
+        all_points = []
+        all_weights = []
+        blocks = []
+        offset = 0
+        for ell in levels:
+            k = level - np.sum(ell)
+            coeff = (-1) ** k * _binom(dim - 1, k)
+
+            pts = [rules[i][0] for i in ell]
+            wts = [rules[i][1] for i in ell]
+            grid = np.array(np.meshgrid(*pts, indexing="ij")).reshape(dim, -1)
+            weights = coeff * _outer(wts)
+            all_points.append(grid)
+            all_weights.append(weights)
+
+            A = _kron([inv_vt[i] for i in ell])
+            rows = [basis_index[alpha] for alpha in np.ndindex(*(ell + 1))]
+            cols = offset + np.arange(grid.shape[1])
+            blocks.append((rows, cols, coeff * A))
+            offset += grid.shape[1]
+
+        all_points = np.concatenate(all_points, axis=1)
+        all_weights = np.concatenate(all_weights)
+
+        # merge duplicates
+        _, idx, inv = np.unique(
+            np.round(all_points, decimals).T,
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        inv = inv.reshape(-1)
+        self.points = all_points[:, idx]
+        self.weights = np.bincount(inv, weights=all_weights, minlength=len(idx))
+
+        self.interpolation_matrix = np.zeros((len(self.degrees), len(idx)))
+        for rows, cols, A in blocks:
+            self.interpolation_matrix[np.ix_(rows, inv[cols])] += A
+
+    def integrate(self, values):
+        """Integrates the function with values `values` (shape (..., num_points)) at the
+        points against the weight function.
+        """
+        return np.dot(values, self.weights)
+
+    def interpolate(self, values):
+        """Coefficients in the product basis (shape (num_basis, ...)) of the Smolyak
+        approximation to the function values `values` (shape (..., num_points)). For
+        nested rules, this is the sparse interpolant.
+        """
+        values = np.asarray(values)
+        return np.tensordot(self.interpolation_matrix, values, axes=([1], [-1]))
+
+
+def _binom(n, k):
+    return math.factorial(n) // (math.factorial(k) * math.factorial(n - k))
+
+
+def _outer(vectors):
+    out = np.ones(1)
+    for v in vectors:
+        out = np.multiply.outer(out, v).reshape(-1)
+    return out
+
+
+def _kron(matrices):
+    out = np.ones((1, 1))
+    for M in matrices:
+        out = np.kron(out, M)
+    return out
@@ -0,0 +1,163 @@
+"""Persistent, memory-mapped tabulations.
+
+`tabulate()` evaluates a tree once and streams the levels to a directory
+
+    path/meta.json    family, parameters, dtype, level shapes, and offsets
+    path/points.npy   the points
+    path/values.bin   all members of all levels, one after another, C order
+
+without holding more than the iterator's own levels in memory. `open()` maps the values
+read-only, so any number of processes share one copy in the page cache:
+
+    orthopy.store.tabulate("u3.EvalSpherical", ("quantum mechanic",), X, 513, path)
+    ...
+    store = orthopy.store.open(path)
+    store.level(512)    # shape (1025, num_points), no copy
+    store[512, 3]       # member 3 of level 512, i.e., m = -509
+
+`store.data` has the shape (num_members, *point_shape); the rows of level k start at
+`store.offsets[k]`. For the 1-3-5 trees (c1.associated_legendre, u3), member i of level
+l is m = i - l; for the product trees (cn, enr2), the members are ordered as in
+helpers.product_degrees().
+"""
+import io
+import json
+import os
+import pathlib
+
+import numpy as np
+
+FORMAT = "orthopy-store"
+VERSION = 1
+
+
+def tabulate(family, params, X, n, path):
+    """Writes the levels 0, ..., n-1 of `family(X, *params)` to the directory `path` and
+    returns the opened store. `family` is an Eval class from orthopy or its name
+    relative to orthopy, e.g., "t2.Eval" or "c1.jacobi.Eval"; `params` are the
+    positional parameters (JSON-serializable).
+    """
+    name = _family_name(family)
+    Eval = _resolve(name)
+    params = list(params)
+
+    path = pathlib.Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    meta_file = path / "meta.json"
+    if meta_file.exists():
+        # invalidate before writing
+        meta_file.unlink()
+
+    X = np.asarray(X)
+    np.save(path / "points.npy", X)
+
+    level_shapes = []
+    with io.open(path / "values.bin", "wb") as f:
+        evaluator = Eval(X, *params)
+        levels = [np.array(next(evaluator)) for _ in range(min(n, 2))]
+        # level 0 may be real while the others are complex
+        dtype = np.result_type(*levels)
+        assert dtype != object, "Can only store numerical values."
+        for k in range(n):
+            values = levels[k] if k < len(levels) else np.asarray(next(evaluator))
+            assert np.can_cast(values.dtype, dtype)
+            level_shapes.append(list(values.shape))
+            np.ascontiguousarray(values, dtype=dtype).tofile(f)
+
+    # 1D families yield levels of the shape of the points, trees (num_members, ...);
+    # level 0 has exactly one member
+    first = tuple(level_shapes[0])
+    point_shape = first if first == X.shape else first[1:]
+    num_points = int(np.prod(point_shape))
+    sizes = [int(np.prod(s)) // num_points for s in level_shapes]
+
+    meta = {
+        "format": FORMAT,
+        "version": VERSION,
+        "family": name,
+        "params": params,
+        "n": n,
+        "dtype": np.dtype(dtype).str,
+        "point_shape": list(point_shape),
+        "level_shapes": level_shapes,
+        "offsets": np.concatenate([[0], np.cumsum(sizes)]).tolist(),
+    }
+    # written last and atomically, so readers never see a partial store
+    tmp = path / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta, indent=2))
+    os.replace(tmp, meta_file)
+
+    return open(path)
+
+
+def open(path):
+    """Opens a store written by tabulate(), read-only and memory-mapped."""
+    return Store(path)
+
+
+class Store:
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        meta = json.loads((self.path / "meta.json").read_text())
+        assert meta["format"] == FORMAT
+        assert meta["version"] == VERSION
+
+        self.family = meta["family"]
+        self.params = meta["params"]
+        self.n = meta["n"]
+        self.dtype = np.dtype(meta["dtype"])
+        self.point_shape = tuple(meta["point_shape"])
+        self.level_shapes = [tuple(s) for s in meta["level_shapes"]]
+        self.offsets = meta["offsets"]
+
+        self.points = np.load(self.path / "points.npy", mmap_mode="r")
+        self.data = np.memmap(
+            self.path / "values.bin",
+            dtype=self.dtype,
+            mode="r",
+            shape=(self.offsets[-1],) + self.point_shape,
+        )
+
+    def __len__(self):
+        return self.n
+
+    def level(self, k):
+        """The values of level k, shape as yielded by the iterator (view)."""
+        return self.data[self.offsets[k] : self.offsets[k + 1]].reshape(
+            self.level_shapes[k]
+        )
+
+    def levels(self):
+        return [self.level(k) for k in range(self.n)]
+
+    def __getitem__(self, index):
+        """`store[k, i]`: member i of level k (view)."""
+        k, i = index
+        assert 0 <= i < self.offsets[k + 1] - self.offsets[k]
+        return self.data[self.offsets[k] + i]
+
+
+def _family_name(family):
+    if isinstance(family, str):
+        return family
+    module = family.__module__
+    assert module.startswith("orthopy.")
+    # the public name, e.g., orthopy.c1.jacobi.main.Eval -> c1.jacobi.Eval
+    parts = module.split(".")[1:]
+    for k in range(1, len(parts) + 1):
+        name = ".".join(parts[:k] + [family.__name__])
+        try:
+            if _resolve(name) is family:
+                return name
+        except AttributeError:
+            pass
+    raise ValueError(f"{family} is not a public orthopy evaluator.")
+
+
+def _resolve(name):
+    import orthopy
+
+    obj = orthopy
+    for part in name.split("."):
+        obj = getattr(obj, part)
+    return obj
@@ -1,4 +1,5 @@
-from .main import Eval
+from .collapsed import analyze, collapsed_grid, synthesize
+from .main import Eval, Plan
 from .tools import (
     plot_single,
     plot_tree,
@@ -10,6 +11,10 @@ from .tools import (
 
 __all__ = [
     "Eval",
+    "Plan",
+    "collapsed_grid",
+    "synthesize",
+    "analyze",
     "plot_single",
     "show_single",
     "savefig_single",
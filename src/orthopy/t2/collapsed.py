@@ -0,0 +1,168 @@
+"""Sum factorization on collapsed tensor grids.
+
+With the Duffy coordinates
+
+    s = (u - v) / (u + v),   x = 1 - 2 w,
+
+the members of the tree factor as
+
+    P_{k, r} = A_r(s) * (u + v)^r * B_{k, r}(x),
+
+where A_r is (a multiple of) the Legendre polynomial of degree r and B_{k, r} is a Jacobi
+polynomial of degree k - r in x with the weight (1+x)^(2r+1). Both follow from the
+recurrence of the tree itself, A_r from the diagonal (delta, epsilon), B_{k, r} from
+(alpha[r], beta[r], gamma[r]), so all scalings of Eval are supported.
+
+On the tensor grid of Gauss-Legendre points in s and Gauss-Jacobi points in x, synthesis
+(coefficients -> values) and analysis (values -> coefficients) then cost O(n^3) instead
+of O(n^4) for n levels and n x n points. The area element is
+
+    dA = (1 + x) / 8 ds dx,
+
+so an n x n grid integrates all products of members of the levels 0, ..., n-1 exactly.
+"""
+import functools
+
+import numpy as np
+
+from ..c1 import jacobi
+from ..tools import quadrature
+from .main import RCClassical, RCMonic, RCNormal
+
+
+def collapsed_grid(n):
+    """Gauss-Jacobi x Gauss-Legendre grid with n x n points. Returns the barycentric
+    coordinates, shape (3, n, n), and the weights, shape (n, n), such that sum(weights *
+    f(bary)) is the integral of f over the triangle. Axis 1 runs along x = 1 - 2w, axis 2
+    along s = (u - v) / (u + v).
+    """
+    (s, _), (x, _) = _rules(n)
+    w = (1 - x) / 2
+    u = np.multiply.outer(1 - w, (1 + s) / 2)
+    v = np.multiply.outer(1 - w, (1 - s) / 2)
+    bary = np.array([u, v, np.multiply.outer(w, np.ones(n))])
+    return bary, _weights(n)
+
+
+def synthesize(coeffs, scaling, num_points=None):
+    """Values of the expansions sum_{k, r} c_{k, r} P_{k, r} on the collapsed grid with
+    `num_points` x `num_points` points (default: the number of levels). `coeffs` has the
+    shape (num_members, ...), members ordered as in Eval; the trailing axes are a batch,
+    e.g., of elements. Returns the shape (num_points, num_points, ...).
+    """
+    coeffs = np.asarray(coeffs)
+    n = _num_levels(len(coeffs))
+    if num_points is None:
+        num_points = n
+    A, C = _factors(scaling, n, num_points)
+    batch_shape = coeffs.shape[1:]
+
+    # padded[r, m] = c_{r + m, r}
+    padded = np.zeros((n, n, int(np.prod(batch_shape))), dtype=coeffs.dtype)
+    r, m = _triangle_indices(n)
+    padded[r, m] = coeffs.reshape(len(coeffs), -1)
+
+    # sum over the Jacobi degree, then over the Legendre degree
+    tmp = np.matmul(C.transpose(0, 2, 1), padded)
+    values = np.tensordot(A, tmp, axes=(0, 0))
+    # (s, x, batch) -> (x, s, batch)
+    return values.transpose(1, 0, 2).reshape((num_points, num_points) + batch_shape)
+
+
+def analyze(values, scaling, n):
+    """Coefficients of the levels 0, ..., n-1 of the L2-projection of the function with
+    the `values` on the collapsed grid, shape (num_points, num_points, ...), the trailing
+    axes being a batch. The projection is exact for num_points >= n. Returns the shape
+    (num_members, ...).
+    """
+    values = np.asarray(values)
+    num_points = values.shape[0]
+    assert values.shape[1] == num_points
+    A, C = _factors(scaling, n, num_points)
+    (_, ws), (_, wx) = _rules(num_points)
+    batch_shape = values.shape[2:]
+
+    f = values.reshape(num_points, num_points, -1)
+    # integrate over s, then over x
+    tmp = np.tensordot(A * ws, f, axes=(1, 1))
+    projections = np.matmul(C * (wx / 8), tmp)
+
+    r, m = _triangle_indices(n)
+    coeffs = projections[r, m] / _norms(scaling, n)[:, None]
+    return coeffs.reshape((len(r),) + batch_shape)
+
+
+def _num_levels(num_members):
+    n = int(round((np.sqrt(8 * num_members + 1) - 1) / 2))
+    assert n * (n + 1) // 2 == num_members
+    return n
+
+
+def _triangle_indices(n):
+    """(r, m) of the members of the levels 0, ..., n-1 in tree order, k = r + m."""
+    r = np.concatenate([np.arange(k + 1) for k in range(n)])
+    k = np.repeat(np.arange(n), np.arange(1, n + 1))
+    return r, k - r
+
+
+@functools.lru_cache(maxsize=None)
+def _rules(n):
+    legendre = jacobi.RecurrenceCoefficients("monic", 0, 0, symbolic=False)
+    jacobi01 = jacobi.RecurrenceCoefficients("monic", 0, 1, symbolic=False)
+    return (
+        quadrature.gauss(legendre, n, legendre.int_1),
+        quadrature.gauss(jacobi01, n, jacobi01.int_1),
+    )
+
+
+def _weights(n):
+    (_, ws), (_, wx) = _rules(n)
+    return np.multiply.outer(wx, ws) / 8
+
+
+@functools.lru_cache(maxsize=32)
+def _factors(scaling, n, num_points):
+    """A[r, i] = A_r(s_i), shape (n, num_points), and
+    C[r, m, j] = (u + v)^r B_{r + m, r}(x_j) at the grid points, shape
+    (n, n, num_points), zero for r + m >= n.
+    """
+    rc = {"classical": RCClassical, "monic": RCMonic, "normal": RCNormal}[scaling](
+        False
+    )
+    (s, _), (x, _) = _rules(num_points)
+    one_minus_w = (1 + x) / 2
+
+    # the diagonal P_{k, k} = (u + v)^k A_k(s)
+    A = np.empty((n, num_points))
+    A[0] = float(rc.p0)
+    for k in range(1, n):
+        _, _, _, delta, epsilon = rc[k]
+        A[k] = delta * s * A[k - 1]
+        if k > 1:
+            A[k] -= epsilon * A[k - 2]
+
+    C = np.zeros((n, n, num_points))
+    C[:, 0] = 1.0
+    for k in range(1, n):
+        alpha, beta, gamma, _, _ = rc[k]
+        # all r < k at once
+        r = np.arange(k)
+        C[r, k - r] = np.multiply.outer(alpha, x) - beta[:, None]
+        C[r, k - r] *= C[r, k - r - 1]
+        if k > 1:
+            r = np.arange(k - 1)
+            C[r, k - r] -= gamma[:, None] * C[r, k - r - 2]
+    C *= one_minus_w ** np.arange(n)[:, None, None]
+
+    A.setflags(write=False)
+    C.setflags(write=False)
+    return A, C
+
+
+@functools.lru_cache(maxsize=32)
+def _norms(scaling, n):
+    """Squared norms of the members of the levels 0, ..., n-1, exact on the n x n grid."""
+    A, C = _factors(scaling, n, n)
+    (_, ws), (_, wx) = _rules(n)
+    r, m = _triangle_indices(n)
+    return (A ** 2 @ ws)[r] * (C ** 2 @ (wx / 8))[r, m]
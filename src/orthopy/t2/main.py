@@ -1,6 +1,8 @@
 import numpy as np
 import sympy
 
+from ..plans import PlanTriangle
+
 
 class Eval:
     """Evaluates orthogonal polynomials on the triangle.
@@ -66,6 +68,31 @@ class Eval:
         return out
 
 
+class Plan(PlanTriangle):
+    """Reusable plan for the levels 0, ..., n-1 of the tree at barycentric coordinates
+    of shape `shape` (with `shape[0] == 3`); `plan(bary, out=buf)` writes all members
+    into `buf`, see orthopy.plans.
+    """
+
+    def __init__(self, n, scaling, shape, dtype=float, backend="auto", parallel=False):
+        assert shape[0] == 3
+        rc = {"classical": RCClassical, "monic": RCMonic, "normal": RCNormal}[scaling](
+            False
+        )
+        super().__init__(lambda k: rc[k], rc.p0, n, shape[1:], dtype, backend, parallel)
+        self._stq = np.empty(shape)
+
+    def __call__(self, bary, out=None):
+        u, v, w = bary
+        s, t, q = self._stq
+        np.multiply(w, -2.0, out=s)
+        s += 1.0
+        np.subtract(u, v, out=t)
+        np.add(u, v, out=q)
+        q *= q
+        return super().__call__(s, t, q, out)
+
+
 class RCClassical:
     def __init__(self, symbolic):
         self.S = sympy.S if symbolic else lambda x: x
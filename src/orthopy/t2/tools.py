@@ -2,6 +2,7 @@ import itertools
 
 import numpy as np
 
+from ..tree_plot import plot_outlines, savefig_in_worker, tripcolor_tree
 from .main import Eval
 
 
@@ -63,11 +64,17 @@ def plot_single(
     )
 
 
-def savefig_tree(filename, *args, **kwargs):
+def savefig_tree(filename, *args, executor=None, **kwargs):
     from matplotlib import pyplot as plt
 
+    savefig_kwargs = {"transparent": True, "bbox_inches": "tight"}
+    if executor is not None:
+        return executor.submit(
+            savefig_in_worker, plot_tree, filename, args, kwargs, savefig_kwargs
+        )
+
     plot_tree(*args, **kwargs)
-    plt.savefig(filename, transparent=True, bbox_inches="tight")
+    plt.savefig(filename, **savefig_kwargs)
 
 
 def show_tree(*args, **kwargs):
@@ -88,25 +95,20 @@ def plot_tree(n, res=100, scaling="normal", colorbar=False, cmap="RdBu_r", clim=
 
     bary, cells = meshzoo.triangle(res)
     evaluator = Eval(bary, scaling)
+    values = np.concatenate(list(itertools.islice(evaluator, n + 1)))
 
     plt.set_cmap(cmap)
     plt.gca().set_aspect("equal")
     plt.axis("off")
 
-    for k, level in enumerate(itertools.islice(evaluator, n + 1)):
-        for r, z in enumerate(level):
-            alpha = np.pi * np.array([7.0 / 6.0, 11.0 / 6.0, 3.0 / 6.0])
-            corners = np.array([np.cos(alpha), np.sin(alpha)])
-            corners[0] += 2.1 * (r - k / 2)
-            corners[1] -= 1.9 * k
-            x, y = np.dot(corners, bary)
+    alpha = np.pi * np.array([7.0 / 6.0, 11.0 / 6.0, 3.0 / 6.0])
+    corners = np.array([np.cos(alpha), np.sin(alpha)])
+    points = np.dot(corners, bary).T
 
-            plt.tripcolor(x, y, cells, z, shading="flat")
-            plt.clim(clim)
-
-            # triangle outlines
-            X = np.column_stack([corners, corners[:, 0]])
-            plt.plot(X[0], X[1], "-k")
+    shifts = np.array(
+        [[2.1 * (r - k / 2), -1.9 * k] for k in range(n + 1) for r in range(k + 1)]
+    )
+    tripcolor_tree(points, cells, shifts, values, clim, colorbar)
 
-    if colorbar:
-        plt.colorbar()
+    # triangle outlines
+    plot_outlines(corners, shifts, "-k")
@@ -1,15 +1,27 @@
+from . import quadrature
 from .generate_rc import (
     chebyshev,
     chebyshev_modified,
+    discretized_stieltjes,
     gautschi_test_3,
     golub_welsch,
+    lanczos,
+    mcdis,
+    modify,
     stieltjes,
+    stieltjes_exact,
 )
 
 __all__ = [
     "golub_welsch",
     "stieltjes",
+    "stieltjes_exact",
     "chebyshev",
     "chebyshev_modified",
     "gautschi_test_3",
+    "discretized_stieltjes",
+    "lanczos",
+    "mcdis",
+    "modify",
+    "quadrature",
 ]
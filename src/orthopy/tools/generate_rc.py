@@ -20,12 +20,21 @@
     BIT Numerical Mathematics,
     June 1983, Volume 23, Issue 2, pp 209–216,
     <https://doi.org/10.1007/BF02218441>.
+
+[4] W. Gautschi,
+    Orthogonal Polynomials: Computation and Approximation,
+    Oxford University Press, 2004,
+    sections 2.2.3 (discretization methods), 2.2.4 (Stieltjes, Lanczos), and 2.4
+    (modification algorithms).
 """
 import math
+from fractions import Fraction
 
 import numpy as np
 import sympy
 
+from .quadrature import jacobi_matrix
+
 
 def golub_welsch(moments):
     """Given moments
@@ -36,22 +45,68 @@ def golub_welsch(moments):
     coefficients of the corresponding orthogonal polynomials, see section 4
     ("Determining the Three Term Relationship from the Moments") in Golub-Welsch [1].
     Numerically unstable, see [2].
-    """
-    assert len(moments) % 2 == 1
-    n = (len(moments) - 1) // 2
-
-    M = np.array([[moments[i + j] for j in range(n + 1)] for i in range(n + 1)])
-    R = np.linalg.cholesky(M).T
 
+    `moments` can also be a stack of moment vectors of shape (batch, 2N+1). Then,
+    alpha, beta have shape (batch, N), int_1 has shape (batch,), and a fourth return
+    value `failed` marks the rows whose Hankel matrix is not (numerically) positive
+    definite; their coefficients are NaN.
+    """
+    moments = np.asarray(moments, dtype=float)
+    assert moments.shape[-1] % 2 == 1
+    n = (moments.shape[-1] - 1) // 2
+
+    if moments.ndim == 1:
+        R = np.linalg.cholesky(_hankel(moments, n + 1)).T
+        return _golub_welsch_from_cholesky(R)
+
+    assert moments.ndim == 2
+    L = np.full((moments.shape[0], n + 1, n + 1), math.nan)
+    failed = np.zeros(moments.shape[0], dtype=bool)
+    _batched_cholesky(_hankel(moments, n + 1), L, failed, np.arange(len(failed)))
+    alpha, beta, int_1 = _golub_welsch_from_cholesky(np.swapaxes(L, -1, -2))
+    return alpha, beta, int_1, failed
+
+
+def _hankel(moments, m):
+    """Read-only view of the m x m Hankel matrices H_ij = moments[..., i + j]."""
+    moments = np.ascontiguousarray(moments)
+    stride = moments.strides[-1]
+    return np.lib.stride_tricks.as_strided(
+        moments,
+        shape=moments.shape[:-1] + (m, m),
+        strides=moments.strides[:-1] + (stride, stride),
+        writeable=False,
+    )
+
+
+def _batched_cholesky(H, L, failed, idx):
+    """Cholesky factors of the stack H[idx] into L[idx]. A LinAlgError anywhere in the
+    stack fails the whole call, so the stack is bisected until the offending rows are
+    isolated; the cost is O(log(batch)) extra calls per failure.
+    """
+    try:
+        L[idx] = np.linalg.cholesky(H[idx])
+    except np.linalg.LinAlgError:
+        if len(idx) == 1:
+            failed[idx] = True
+            return
+        mid = len(idx) // 2
+        _batched_cholesky(H, L, failed, idx[:mid])
+        _batched_cholesky(H, L, failed, idx[mid:])
+
+
+def _golub_welsch_from_cholesky(R):
     # (upper) diagonal
-    Rd = R.diagonal()
-    q = R.diagonal(1) / Rd[:-1]
+    Rd = np.diagonal(R, axis1=-2, axis2=-1)
+    q = np.diagonal(R, 1, axis1=-2, axis2=-1) / Rd[..., :-1]
 
     alpha = q.copy()
-    alpha[+1:] -= q[:-1]
+    alpha[..., 1:] -= q[..., :-1]
 
-    beta = np.hstack([math.nan, Rd[1:-1] / Rd[:-2]]) ** 2
-    int_1 = Rd[0]
+    beta = np.empty_like(q)
+    beta[..., 0] = math.nan
+    beta[..., 1:] = (Rd[..., 1:-1] / Rd[..., :-2]) ** 2
+    int_1 = Rd[..., 0]
     return alpha, beta, int_1
 
 
@@ -88,6 +143,320 @@ def stieltjes(integrate, n):
     return alpha, beta, int_1
 
 
+def stieltjes_exact(moments, n):
+    """Exact Stieltjes procedure from the moments mu_k = int t^k w(t) dt, given as a
+    callable `moments(k)` or as a sequence of (at least) 2n values. No integrals are
+    computed: The monic orthogonal polynomials are represented by their coefficient
+    vectors, and all inner products are dot products with the moments. Since p_k is
+    orthogonal to all polynomials of lower degree,
+
+      <p_k, p_k> = <p_k, t^k>,
+      <t p_k, p_k> = <p_k, t^{k+1}> + c_{k,k-1} <p_k, t^k>,
+
+    with c_{k,k-1} the second-highest coefficient of p_k, so every step only costs
+    O(k). Integer moments are turned into Fractions, so the results are exact for
+    rational (and, with sympy, for symbolic) moments. Returns alpha, beta (lists, with
+    beta[0] = None), and int_1, just like stieltjes().
+    """
+    if not callable(moments):
+        assert len(moments) >= 2 * n
+        table = moments
+
+        def moments(k):
+            return table[k]
+
+    mu = [_exact(moments(k)) for k in range(2 * n)]
+
+    alpha = n * [None]
+    beta = n * [None]
+    int_1 = mu[0]
+
+    # coefficient vectors (lowest degree first) of p_{k-1} and p_k
+    p_prev = []
+    p = [1]
+    norm_prev = None
+    for k in range(n):
+        norm = sum(c * mu[i + k] for i, c in enumerate(p))
+        tk1 = sum(c * mu[i + k + 1] for i, c in enumerate(p))
+        second = p[k - 1] if k > 0 else 0
+        alpha[k] = (tk1 + second * norm) / norm
+        if k > 0:
+            beta[k] = norm / norm_prev
+
+        # p_{k+1} = (t - alpha_k) p_k - beta_k p_{k-1}
+        p_next = [0] + p
+        for i, c in enumerate(p):
+            p_next[i] -= alpha[k] * c
+        if k > 0:
+            for i, c in enumerate(p_prev):
+                p_next[i] -= beta[k] * c
+
+        p_prev, p = p, p_next
+        norm_prev = norm
+
+    return alpha, beta, int_1
+
+
+def _exact(value):
+    # avoid float division for integer moments
+    if isinstance(value, (int, np.integer)):
+        return Fraction(int(value))
+    return value
+
+
+def discretized_stieltjes(nodes, weights, n):
+    """Recurrence coefficients alpha_k, beta_k, k = 0, ..., n-1, of the monic polynomials
+    orthogonal with respect to the discrete measure sum_j weights[j] delta(nodes[j]), via
+    the Stieltjes procedure [4]. All inner products are sums over the nodes, so the cost
+    is O(N n) for N nodes. Use this for empirical or tabulated weight functions, or with
+    a quadrature rule that discretizes a continuous weight (see mcdis()).
+
+    The polynomial values are rescaled at every step (which doesn't change the
+    coefficients), so they never over- or underflow. beta_0 is NaN; `int_1` is the total
+    mass sum(weights).
+    """
+    x = np.asarray(nodes, dtype=float)
+    w = np.asarray(weights, dtype=float)
+    assert x.shape == w.shape
+    assert n <= len(x)
+
+    alpha = np.empty(n)
+    beta = np.empty(n)
+    int_1 = np.sum(w)
+
+    p_prev = np.zeros_like(x)
+    p = np.ones_like(x)
+    for k in range(n):
+        wp = w * p
+        norm = np.dot(wp, p)
+        alpha[k] = np.dot(wp, x * p) / norm
+        # the norm of p_prev has been scaled to 1
+        beta[k] = math.nan if k == 0 else norm
+
+        p_next = (x - alpha[k]) * p
+        if k > 0:
+            p_next -= beta[k] * p_prev
+        # rescale such that the current norm is 1
+        scale = 1 / math.sqrt(norm)
+        p_prev = p * scale
+        p = p_next * scale
+
+    return alpha, beta, int_1
+
+
+def lanczos(nodes, weights, n, reorthogonalize=False):
+    """Same as discretized_stieltjes(), but via the Lanczos process: The Jacobi matrix is
+    the tridiagonalization of diag(nodes) with the starting vector sqrt(weights),
+    built from orthonormal vectors q_k = sqrt(weights) p_k / ||p_k|| (modified
+    Gram-Schmidt). The cost is O(N n).
+
+    With reorthogonalize=True, every new vector is additionally orthogonalized against
+    all previous ones. This costs O(N n^2), but remains accurate when n gets close to
+    the number of nodes N, where the plain recurrences lose orthogonality.
+    """
+    x = np.asarray(nodes, dtype=float)
+    w = np.asarray(weights, dtype=float)
+    assert x.shape == w.shape
+    assert n <= len(x)
+
+    alpha = np.empty(n)
+    beta = np.empty(n)
+    int_1 = np.sum(w)
+    beta[0] = math.nan
+
+    Q = np.empty((n, len(x))) if reorthogonalize else None
+    q_prev = np.zeros_like(x)
+    q = np.sqrt(w) / math.sqrt(int_1)
+    b = 0.0
+    for k in range(n):
+        if reorthogonalize:
+            Q[k] = q
+        v = x * q
+        if k > 0:
+            v -= b * q_prev
+        alpha[k] = np.dot(q, v)
+        v -= alpha[k] * q
+        if reorthogonalize:
+            v -= Q[: k + 1].T @ (Q[: k + 1] @ v)
+        if k == n - 1:
+            break
+        b = np.linalg.norm(v)
+        beta[k + 1] = b ** 2
+        q_prev = q
+        q = v / b
+
+    return alpha, beta, int_1
+
+
+def mcdis(
+    weight,
+    intervals,
+    n,
+    tol=1.0e-12,
+    point_masses=None,
+    method="stieltjes",
+    max_points=2 ** 20,
+):
+    """Multiple-component discretization [4] for the weight function `weight` (a
+    vectorized callable) on the union of `intervals`, a list of `(a, b)` with possibly
+    infinite ends. Optionally, a discrete part `point_masses = (nodes, masses)` is
+    added.
+
+    Every component is discretized with an M-point Gauss-Legendre rule (after mapping
+    infinite intervals to (-1, 1)), and the recurrence coefficients of the discrete
+    measure are computed with discretized_stieltjes() or lanczos(). M is doubled until
+    the relative change of all beta_k (including int_1) falls below `tol`.
+    """
+    fun = {"stieltjes": discretized_stieltjes, "lanczos": lanczos}[method]
+
+    m = 2 * n + 10
+    last = None
+    while m <= max_points:
+        x, w = _discretize(weight, intervals, m)
+        if point_masses is not None:
+            x = np.concatenate([x, np.asarray(point_masses[0], dtype=float)])
+            w = np.concatenate([w, np.asarray(point_masses[1], dtype=float)])
+
+        alpha, beta, int_1 = fun(x, w, n)
+        b = np.concatenate([[int_1], beta[1:]])
+        if last is not None and np.all(np.abs(b - last) <= tol * np.abs(b)):
+            return alpha, beta, int_1
+        last = b
+        m *= 2
+
+    raise RuntimeError(f"mcdis didn't converge with {max_points} points per interval.")
+
+
+def _discretize(weight, intervals, m):
+    """Gauss-Legendre discretization of the weight function on the intervals. Infinite
+    intervals are mapped to (-1, 1) as in [4]: x = t / (1 - t^2) for (-inf, inf),
+    x = a + (1 + t) / (1 - t) for (a, inf), and x = b - (1 - t) / (1 + t) for
+    (-inf, b).
+    """
+    t, v = np.polynomial.legendre.leggauss(m)
+    nodes = []
+    weights = []
+    for a, b in intervals:
+        if np.isfinite(a) and np.isfinite(b):
+            x = (b - a) / 2 * t + (a + b) / 2
+            dx = (b - a) / 2 * np.ones_like(t)
+        elif np.isfinite(a):
+            x = a + (1 + t) / (1 - t)
+            dx = 2 / (1 - t) ** 2
+        elif np.isfinite(b):
+            x = b - (1 - t) / (1 + t)
+            dx = 2 / (1 + t) ** 2
+        else:
+            x = t / (1 - t ** 2)
+            dx = (1 + t ** 2) / (1 - t ** 2) ** 2
+        nodes.append(x)
+        weights.append(v * dx * weight(x))
+    return np.concatenate(nodes), np.concatenate(weights)
+
+
+def modify(rc, n, int_1, multiply_by_roots=(), divide_by_poles=(), tol=1.0e-15):
+    """Recurrence coefficients alpha_k, beta_k, k = 0, ..., n-1, of the monic
+    polynomials orthogonal with respect to the modified weight function
+
+      w(x) * prod_i |x - z_i| / prod_j |x - y_j|,
+
+    where w is the weight function of the recurrence coefficients `rc` (in any scaling,
+    with the total mass `int_1`), the z_i are `multiply_by_roots`, and the y_j are
+    `divide_by_poles`. All z_i, y_j must be real and lie outside of the support of w.
+    Returns alpha, beta (with beta_0 = NaN), and the mass of the modified weight
+    function.
+
+    Multiplication by a linear factor (Christoffel) is one step of the LR algorithm on
+    the Jacobi matrix J: With the Cholesky factorization
+
+      J - zI = L L^T  (or zI - J = L L^T for z to the right of the support),
+
+    the new Jacobi matrix is L^T L + zI (or zI - L^T L), see [4]. Division by a linear
+    factor (Uvarov) uses the ratios r_k = rho_k / rho_{k-1} of the Cauchy integrals
+    rho_k = int p_k(x) w(x) / (x - y) dx, the minimal solution of the three-term
+    recurrence, which are computed stably by a backward continued fraction. Then
+
+      alpha'_k = alpha_k - r_k + r_{k+1},  beta'_k = beta_{k-1} r_k / r_{k-1}.
+
+    Each factor costs O(n); for the poles, the continued fraction is started further
+    out until the results agree to `tol`.
+    """
+    roots = [float(z) for z in multiply_by_roots]
+    poles = [float(y) for y in divide_by_poles]
+
+    # every Christoffel step uses up one coefficient
+    m = n + len(roots)
+    tail = 0 if not poles else m + 50
+    last = None
+    while True:
+        diag, offdiag = jacobi_matrix(rc, m + tail + 1)
+        alpha = diag
+        beta = np.concatenate([[math.nan], offdiag ** 2])
+        mass = float(int_1)
+        for y in poles:
+            alpha, beta, mass = _divide_by_linear(alpha, beta, mass, y)
+        for z in roots:
+            alpha, beta, mass = _multiply_by_linear(alpha, beta, mass, z)
+        alpha = alpha[:n]
+        beta = beta[:n]
+        if not poles:
+            break
+        current = np.concatenate([alpha, beta[1:], [mass]])
+        if last is not None and np.all(
+            np.abs(current - last) <= tol * np.abs(current) + tol
+        ):
+            break
+        last = current
+        tail *= 2
+
+    return alpha, beta, mass
+
+
+def _multiply_by_linear(alpha, beta, int_1, z):
+    """Christoffel modification with |x - z|; returns one coefficient less."""
+    sign = 1.0 if alpha[0] > z else -1.0
+    d = sign * (alpha - z)
+    e = np.sqrt(beta[1:])
+    m = len(alpha)
+    # bidiagonal Cholesky factor: diagonal l, subdiagonal s
+    l2 = np.empty(m)
+    s2 = np.empty(m - 1)
+    l2[0] = d[0]
+    for k in range(m - 1):
+        assert l2[k] > 0.0, f"The root {z} lies within the support."
+        s2[k] = e[k] ** 2 / l2[k]
+        l2[k + 1] = d[k + 1] - s2[k]
+
+    new_alpha = z + sign * (l2[:-1] + s2)
+    new_beta = np.empty(m - 1)
+    new_beta[0] = math.nan
+    new_beta[1:] = l2[1:-1] * s2[:-1]
+    return new_alpha, new_beta, int_1 * d[0]
+
+
+def _divide_by_linear(alpha, beta, int_1, y):
+    """Uvarov modification with 1 / |x - y|; returns one coefficient less (the last one
+    merely starts the continued fraction).
+    """
+    m = len(alpha)
+    # r_k = beta_k / (y - alpha_k - r_{k+1}), k = m-1, ..., 1, starting with r_m = 0
+    r = np.zeros(m + 1)
+    for k in range(m - 1, 0, -1):
+        r[k] = beta[k] / (y - alpha[k] - r[k + 1])
+
+    rho0 = int_1 / (r[1] - y + alpha[0])
+    assert rho0 != 0.0
+
+    new_alpha = alpha[:-1] - r[:-2] + r[1:-1]
+    new_beta = np.empty(m - 1)
+    new_beta[0] = math.nan
+    if m > 2:
+        new_beta[1] = beta[1] + r[1] * (new_alpha[1] - alpha[0])
+    new_beta[2:] = beta[1:-2] * r[2:-2] / r[1:-3]
+    # sign such that the mass is positive
+    return new_alpha, new_beta, abs(rho0)
+
+
 def chebyshev(moments):
     """Given the first 2n moments `int t^k dt`, this method uses the Chebyshev algorithm
     (see, e.g., [2]) for computing the associated recurrence coefficients.
@@ -107,70 +476,150 @@ def chebyshev_modified(nu, recurrence_coefficients):
     orthogonal polynomials with recurrence coefficients a, b, this method implements the
     modified Chebyshev algorithm (see, e.g., [2]) for computing the associated
     recurrence coefficients.
+
+    `recurrence_coefficients` are those of the monic p_k, either as an object with
+    `rc[k] = (1, a_k, b_k)` or as a precomputed table of shape (2n, 3) (or longer) with
+    these rows. Batches of moment vectors (e.g., for many weight functions at once) are
+    stacked along the trailing axes, `nu.shape == (2n, ...)`; alpha and beta then have
+    the shape (n, ...).
     """
+    nu = np.asarray(nu)
     m = len(nu)
     assert m % 2 == 0, "Need an even number of moments."
 
-    n = m // 2
-
-    alpha = []
-    beta = []
-    sigma = [None, None, None]
+    a, b = _rc_table(recurrence_coefficients, m)
+    alpha, beta = _chebyshev_modified(nu, a, b)
     int_1 = nu[0]
+    if len(beta) > 0:
+        beta[0] = math.nan
+    return alpha, beta, int_1
 
-    if n > 0:
-        k = 0
-        sigma[0] = np.asarray(nu)
-        _, a0, _ = recurrence_coefficients[0]
-        alpha.append(a0 + nu[1] / nu[0])
-        beta.append(math.nan)
 
-    for k in range(1, n):
-        sigma[2], sigma[1] = sigma[1], sigma[0]
+def _rc_table(recurrence_coefficients, m):
+    """Returns the columns a_k, b_k, k = 0, ..., m-1, of the monic recurrence
+    coefficients. b_0 isn't used by the algorithm and set to 0.
+    """
+    if isinstance(recurrence_coefficients, np.ndarray):
+        assert len(recurrence_coefficients) >= m
+        table = recurrence_coefficients[:m]
+    else:
+        table = [recurrence_coefficients[k] for k in range(m)]
+        table = np.array([[0 if v is None else v for v in row] for row in table])
+    a = table[:, 1].copy()
+    b = table[:, 2].copy()
+    if m > 0:
+        b[0] = 0
+    return a, b
+
 
-        _, aL, bL = np.array(
-            [recurrence_coefficients[i] for i in range(k, 2 * n - k)]
-        ).T
-        sigma[0] = (
-            sigma[0][2:] - (alpha[k - 1] - aL) * sigma[0][1:-1] + bL * sigma[1][:-2]
-        )
-        if k > 1:
-            sigma[0] -= beta[k - 1] * sigma[2][2:-2]
+def _chebyshev_modified(nu, a, b):
+    """Modified Chebyshev algorithm on the moments `nu` (shape (2n, ...)) with the
+    monic recurrence coefficients a_k, b_k of the p_k. Returns alpha and beta with
+    beta_0 = nu_0.
 
-        ak = aL[0]
-        alpha.append(ak + sigma[0][1] / sigma[0][0] - sigma[1][1] / sigma[1][0])
-        beta.append(sigma[0][0] / sigma[1][0])
+    The mixed moments sigma_{k,l} = int pi_k p_l satisfy
 
-    return np.asarray(alpha), np.asarray(beta), int_1
+      sigma_{k,l} = sigma_{k-1,l+1} - (alpha_{k-1} - a_l) sigma_{k-1,l}
+                    + b_l sigma_{k-1,l-1} - beta_{k-1} sigma_{k-2,l},
+
+    and beta_k = sigma_{k,k} / sigma_{k-1,k-1}. The rows sigma_k over- or underflow just
+    like Hankel determinants, so the normalized rows tau_k = sigma_k / sigma_{k,k} are
+    carried instead. With beta_{k-1} = sigma_{k-1,k-1} / sigma_{k-2,k-2}, the last
+    factor drops out:
+
+      u_l = tau_{k-1,l+1} - (alpha_{k-1} - a_l) tau_{k-1,l} + b_l tau_{k-1,l-1}
+            - tau_{k-2,l},
+
+      beta_k = u_k,  tau_k = u / beta_k,  alpha_k = a_k + tau_{k,k+1} - tau_{k-1,k}.
+
+    Two rows of length 2n are kept; row k overwrites row k-2 in place.
+    """
+    m = len(nu)
+    n = m // 2
+    batch = nu.shape[1:]
+
+    dtype = np.result_type(nu, a, b, float)
+    alpha = np.empty((n,) + batch, dtype=dtype)
+    beta = np.empty((n,) + batch, dtype=dtype)
+    if n == 0:
+        return alpha, beta
+
+    # for broadcasting against the batch dimensions
+    a = a.reshape((-1,) + (1,) * len(batch))
+    b = b.reshape((-1,) + (1,) * len(batch))
+
+    tau1 = np.array(nu, dtype=dtype)
+    tau1 /= nu[0]
+    tau2 = np.zeros_like(tau1)
+    work = np.empty_like(tau1)
+
+    beta[0] = nu[0]
+    alpha[0] = a[0] + tau1[1]
+    for k in range(1, n):
+        # valid range of row k: l = k, ..., m-1-k
+        lo, hi = k, m - k
+        u = tau2[lo:hi]
+        w = work[: hi - lo]
+        np.negative(u, out=u)
+        u += tau1[lo + 1 : hi + 1]
+        np.subtract(alpha[k - 1], a[lo:hi], out=w)
+        w *= tau1[lo:hi]
+        u -= w
+        np.multiply(b[lo:hi], tau1[lo - 1 : hi - 1], out=w)
+        u += w
+
+        beta[k] = u[0]
+        u /= beta[k]
+        alpha[k] = a[k] + u[1] - tau1[k]
+        tau1, tau2 = tau2, tau1
+
+    return alpha, beta
 
 
 def gautschi_test_3(moments, alpha, beta):
     """In his article [3], Walter Gautschi suggests a method for checking if a
-    quadrature rule is sane. This method implements test #3 for the article.
+    quadrature rule is sane. This method implements test #3 for the article, i.e., it
+    compares the recurrence coefficients with their expressions
+
+      alpha_k = D'_{k+1} / D_{k+1} - D'_k / D_k,
+      beta_k = D_{k+1} D_{k-1} / D_k^2
+
+    in terms of the Hankel determinants D_k = det(mu_{i+j})_{i,j<k} of the moments (and
+    D'_k, the same with the last column shifted by one).
+
+    The determinants themselves quickly over- or underflow, so they are never formed.
+    Only their ratios enter, and those come out of the incremental elimination of the
+    Hankel matrix (an LDL^T decomposition in disguise, see _hankel_ratios()) in O(n^2)
+    operations.
+
+    The first 2n moments are used, where n = len(alpha). They may be float, sympy, or
+    mpmath numbers, and batches of moment vectors are stacked along the trailing axes,
+    shape (2n, ...). `alpha` and `beta` (shape (n, ...)) can hold many candidate sets
+    at once; they are broadcast against the moments. Returns the absolute errors of
+    alpha and beta, shape (n, ...).
     """
     n = len(alpha)
     assert len(beta) == n
+    assert len(moments) >= 2 * n
 
-    D = np.empty(n + 1)
-    Dp = np.empty(n + 1)
-    D[0] = 1.0
-    D[1] = moments[0]
-    Dp[0] = 0.0
-    Dp[1] = moments[1]
-    for k in range(2, n + 1):
-        A = np.array([moments[i : i + k] for i in range(k)])
-        D[k] = np.linalg.det(A)
-        #
-        A[:, -1] = moments[k : 2 * k]
-        Dp[k] = np.linalg.det(A)
-
-    errors_alpha = np.zeros(n)
-    errors_beta = np.zeros(n)
-
-    errors_alpha[0] = abs(alpha[0] - (Dp[1] / D[1] - Dp[0] / D[0]))
-    errors_beta[0] = abs(beta[0] - D[1])
-    for k in range(1, n):
-        errors_alpha[k] = abs(alpha[k] - (Dp[k + 1] / D[k + 1] - Dp[k] / D[k]))
-        errors_beta[k] = abs(beta[k] - D[k + 1] * D[k - 1] / D[k] ** 2)
+    ref_alpha, ref_beta = _hankel_ratios(moments[: 2 * n])
+
+    # align all arrays at the leading (degree) axis
+    arrays = [np.asarray(alpha), np.asarray(beta), ref_alpha, ref_beta]
+    ndim = max(a.ndim for a in arrays)
+    alpha, beta, ref_alpha, ref_beta = [
+        a.reshape(a.shape + (1,) * (ndim - a.ndim)) for a in arrays
+    ]
+
+    return np.abs(alpha - ref_alpha), np.abs(beta - ref_beta)
 
-    return errors_alpha, errors_beta
+
+def _hankel_ratios(moments):
+    """Given the 2n moments mu_0, ..., mu_{2n-1} (shape (2n, ...)), returns alpha_k =
+    D'_{k+1} / D_{k+1} - D'_k / D_k and beta_k = D_{k+1} D_{k-1} / D_k^2 (with beta_0 =
+    D_1 = mu_0) for k = 0, ..., n-1. This is the (unmodified) Chebyshev algorithm, where
+    sigma_{k,k} = D_{k+1} / D_k; see _chebyshev_modified().
+    """
+    moments = np.asarray(moments)
+    zeros = np.zeros(len(moments), dtype=moments.dtype)
+    return _chebyshev_modified(moments, zeros, zeros)
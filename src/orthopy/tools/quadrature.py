@@ -0,0 +1,92 @@
+"""1D quadrature rules built from recurrence coefficients `rc` as used by the
+evaluators, `rc[k] = (a, b, c)` with
+
+  p_{k+1} = (a x - b) p_k - c p_{k-1},
+
+in any scaling. `int_1` is the integral of the weight function over the domain.
+"""
+import numpy as np
+
+
+def jacobi_matrix(rc, n):
+    """Returns the diagonal and the off-diagonal of the symmetric n x n Jacobi matrix,
+    i.e., the recurrence coefficients of the orthonormal polynomials.
+    """
+    # c_0 is unused (and None or NaN for some families)
+    abc = np.array(
+        [
+            [float(rc[k][0]), float(rc[k][1]), float(rc[k][2]) if k > 0 else 0.0]
+            for k in range(n)
+        ]
+    )
+    a, b, c = abc.T
+    # monic: alpha_k = b_k / a_k, beta_k = c_k / (a_k a_{k-1})
+    diag = b / a
+    offdiag = np.sqrt(c[1:] / (a[1:] * a[:-1]))
+    return diag, offdiag
+
+
+def gauss(rc, n, int_1):
+    """n-point Gauss rule via the eigen-decomposition of the Jacobi matrix
+    (Golub-Welsch).
+    """
+    diag, offdiag = jacobi_matrix(rc, n)
+    J = np.diag(diag) + np.diag(offdiag, 1) + np.diag(offdiag, -1)
+    points, v = np.linalg.eigh(J)
+    weights = float(int_1) * v[0] ** 2
+    return points, weights
+
+
+def leja(rc, n, int_1, weight, candidates):
+    """The first n points of the weighted Leja sequence, i.e., the greedy maximizers of
+
+      sqrt(weight(x)) * prod_i |x - x_i|
+
+    over `candidates`, starting at the 1-point Gauss node. The sequence is nested: The
+    points of the n-point rule are the first n points of the (n+1)-point rule. The
+    weights are the interpolatory ones, i.e., the rule is exact for polynomials of
+    degree n-1.
+    """
+    candidates = np.asarray(candidates, dtype=float)
+    with np.errstate(divide="ignore"):
+        sqrt_w = np.sqrt(weight(candidates))
+    sqrt_w[~np.isfinite(sqrt_w)] = 0.0
+
+    points = [gauss(rc, 1, int_1)[0][0]]
+    objective = sqrt_w * np.abs(candidates - points[0])
+    for _ in range(1, n):
+        k = np.argmax(objective)
+        points.append(candidates[k])
+        objective *= np.abs(candidates - points[-1])
+        # keep the objective O(1)
+        objective /= np.max(objective)
+    points = np.array(points)
+    return points, interpolatory_weights(rc, points, int_1)
+
+
+def interpolatory_weights(rc, points, int_1):
+    """Weights of the interpolatory rule with the given (distinct) points, i.e., the rule
+    that is exact for all polynomials of degree len(points) - 1.
+    """
+    # sum_j w_j p_k(x_j) = int p_k omega = delta_k0 * int_1 with the polynomials p_k
+    # orthonormal with respect to omega / int_1
+    n = len(points)
+    diag, offdiag = jacobi_matrix(rc, n)
+    V = _orthonormal_vandermonde(diag, offdiag, np.asarray(points, dtype=float))
+    rhs = np.zeros(n)
+    rhs[0] = float(int_1)
+    return np.linalg.solve(V, rhs)
+
+
+def _orthonormal_vandermonde(diag, offdiag, x):
+    """Values of the orthonormal polynomials (with p_0 = 1) of degrees 0, ..., len(diag)
+    - 1 at x, shape (len(diag), len(x)).
+    """
+    n = len(diag)
+    V = np.empty((n, len(x)))
+    V[0] = 1.0
+    if n > 1:
+        V[1] = (x - diag[0]) * V[0] / offdiag[0]
+    for k in range(1, n - 1):
+        V[k + 1] = ((x - diag[k]) * V[k] - offdiag[k - 1] * V[k - 1]) / offdiag[k]
+    return V
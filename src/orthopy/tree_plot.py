@@ -0,0 +1,78 @@
+"""Helpers for plotting trees of bivariate orthogonal polynomials, i.e., many translated
+copies of one base mesh with the values of one member each.
+"""
+import numpy as np
+
+
+def tripcolor_tree(points, cells, shifts, values, clim=None, colorbar=False):
+    """Plots `len(shifts)` copies of the triangle mesh `(points, cells)` as one single
+    merged triangulation, the `k`th copy translated by `shifts[k]` and colored by
+    `values[k]`.
+
+    If `clim` is None, every copy is colored according to its own value range, just like
+    separate `tripcolor()` calls would do. A colorbar then only spans each member's
+    minimum to maximum and is labeled accordingly; with `clim`, it shows the values.
+    """
+    from matplotlib import pyplot as plt
+
+    points = np.asarray(points)
+    shifts = np.asarray(shifts)
+    values = np.asarray(values, dtype=float)
+    num_points = points.shape[0]
+
+    pts = (points[None, :, :2] + shifts[:, None, :]).reshape(-1, 2)
+    offsets = num_points * np.arange(len(shifts))
+    cls = (cells[None] + offsets[:, None, None]).reshape(-1, cells.shape[1])
+
+    normalized = clim is None
+    if normalized:
+        vmin = values.min(axis=1, keepdims=True)
+        vmax = values.max(axis=1, keepdims=True)
+        # avoid division by zero for constant functions
+        width = np.where(vmax > vmin, vmax - vmin, 1.0)
+        values = (values - vmin) / width
+        clim = (0.0, 1.0)
+
+    out = plt.tripcolor(pts[:, 0], pts[:, 1], cls, values.reshape(-1), shading="flat")
+    plt.clim(clim)
+
+    if colorbar:
+        cb = plt.colorbar(out)
+        if normalized:
+            cb.set_ticks([0.0, 1.0])
+            cb.set_ticklabels(["min", "max"])
+            cb.set_label("value range of each member")
+    return out
+
+
+def plot_outlines(outline, shifts, *args, **kwargs):
+    """Plots the closed polyline `outline` (shape `(2, m)`) translated by all of `shifts`
+    in one `plot()` call; the individual outlines are separated by NaNs.
+    """
+    from matplotlib import pyplot as plt
+
+    outline = np.asarray(outline)
+    shifts = np.asarray(shifts)
+
+    closed = np.column_stack([outline, outline[:, 0]])
+    lines = np.full((len(shifts), 2, closed.shape[1] + 1), np.nan)
+    lines[:, :, :-1] = closed[None] + shifts[:, :, None]
+    lines = lines.transpose(1, 0, 2).reshape(2, -1)
+    return plt.plot(lines[0], lines[1], *args, **kwargs)
+
+
+def savefig_in_worker(plot, filename, args, kwargs, savefig_kwargs):
+    """Renders `plot(*args, **kwargs)` with the non-interactive Agg backend and writes
+    it to `filename`. Meant to be submitted to a (process pool) executor such that many
+    figures can be rendered in parallel.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    plt.figure()
+    plot(*args, **kwargs)
+    plt.savefig(filename, **savefig_kwargs)
+    plt.close()
+    return filename
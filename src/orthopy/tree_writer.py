@@ -0,0 +1,192 @@
+"""Writers for tree meshes, i.e., many translated copies of one base mesh, each
+carrying the values of one member of an orthogonal polynomial tree.
+
+The VTK formats (legacy `.vtk` and XML `.vtu` with appended raw data) are streamed to
+disk copy by copy: The offsets of all blocks are known from the sizes of the base mesh,
+so neither the merged points nor the merged cells or point data are ever held in memory.
+All other formats are handed to meshio with the merged arrays allocated exactly once.
+"""
+import itertools
+import pathlib
+
+import numpy as np
+
+# <https://vtk.org/doc/nightly/html/vtkCellType_8h_source.html>
+_vtk_type = {"triangle": 5, "tetra": 10}
+
+
+def write_tree_mesh(filename, points, cells, cell_type, shifts, values, name):
+    """Writes `len(shifts)` copies of the mesh `(points, cells)` to `filename`, the
+    `k`th copy translated by `shifts[k]` and carrying the point data `k`th item of the
+    iterable `values` under the name `name`. `values` is consumed lazily.
+    """
+    points = np.asarray(points, dtype=float)
+    cells = np.asarray(cells)
+    shifts = np.asarray(shifts, dtype=float)
+
+    # peek at the first item to get the number of components
+    values = iter(values)
+    first = np.asarray(next(values), dtype=float)
+    values = itertools.chain([first], values)
+    num_components = 1 if first.ndim == 1 else first.shape[1]
+
+    suffix = pathlib.Path(filename).suffix
+    if suffix == ".vtk":
+        _write_vtk(
+            filename, points, cells, cell_type, shifts, values, name, num_components
+        )
+    elif suffix == ".vtu":
+        _write_vtu(
+            filename, points, cells, cell_type, shifts, values, name, num_components
+        )
+    else:
+        _write_meshio(
+            filename, points, cells, cell_type, shifts, values, name, num_components
+        )
+
+
+def _write_vtk(
+    filename, points, cells, cell_type, shifts, values, name, num_components
+):
+    num_copies = len(shifts)
+    num_points = num_copies * len(points)
+    num_cells = num_copies * len(cells)
+    nodes_per_cell = cells.shape[1]
+
+    with open(filename, "wb") as f:
+        f.write(b"# vtk DataFile Version 4.2\n")
+        f.write(b"written by orthopy\n")
+        f.write(b"BINARY\n")
+        f.write(b"DATASET UNSTRUCTURED_GRID\n")
+
+        f.write(f"POINTS {num_points} double\n".encode())
+        for shift in shifts:
+            (points + shift).astype(">f8").tofile(f)
+        f.write(b"\n")
+
+        f.write(f"CELLS {num_cells} {num_cells * (nodes_per_cell + 1)}\n".encode())
+        block = np.empty((len(cells), nodes_per_cell + 1), dtype=">i4")
+        block[:, 0] = nodes_per_cell
+        for k in range(num_copies):
+            block[:, 1:] = cells + k * len(points)
+            block.tofile(f)
+        f.write(b"\n")
+
+        f.write(f"CELL_TYPES {num_cells}\n".encode())
+        block = np.full(len(cells), _vtk_type[cell_type], dtype=">i4")
+        for _ in range(num_copies):
+            block.tofile(f)
+        f.write(b"\n")
+
+        f.write(f"POINT_DATA {num_points}\n".encode())
+        f.write(b"FIELD FieldData 1\n")
+        f.write(f"{name} {num_components} {num_points} double\n".encode())
+        for vals in itertools.islice(values, num_copies):
+            np.asarray(vals).astype(">f8").tofile(f)
+        f.write(b"\n")
+
+
+def _write_vtu(
+    filename, points, cells, cell_type, shifts, values, name, num_components
+):
+    num_copies = len(shifts)
+    num_points = num_copies * len(points)
+    num_cells = num_copies * len(cells)
+    nodes_per_cell = cells.shape[1]
+
+    # The byte sizes of all appended arrays are known in advance; each array is
+    # preceded by a UInt64 header holding its size.
+    sizes = [
+        num_points * 3 * 8,  # points
+        num_cells * nodes_per_cell * 8,  # connectivity
+        num_cells * 8,  # offsets
+        num_cells,  # types
+        num_points * num_components * 8,  # point data
+    ]
+    offsets = np.concatenate([[0], np.cumsum([8 + s for s in sizes])[:-1]])
+
+    header = "\n".join(
+        [
+            '<?xml version="1.0"?>',
+            '<VTKFile type="UnstructuredGrid" version="0.1" '
+            'byte_order="LittleEndian" header_type="UInt64">',
+            "<UnstructuredGrid>",
+            f'<Piece NumberOfPoints="{num_points}" NumberOfCells="{num_cells}">',
+            "<Points>",
+            '<DataArray type="Float64" Name="Points" NumberOfComponents="3" '
+            f'format="appended" offset="{offsets[0]}"/>',
+            "</Points>",
+            "<Cells>",
+            '<DataArray type="Int64" Name="connectivity" '
+            f'format="appended" offset="{offsets[1]}"/>',
+            '<DataArray type="Int64" Name="offsets" '
+            f'format="appended" offset="{offsets[2]}"/>',
+            '<DataArray type="UInt8" Name="types" '
+            f'format="appended" offset="{offsets[3]}"/>',
+            "</Cells>",
+            "<PointData>",
+            f'<DataArray type="Float64" Name="{name}" '
+            f'NumberOfComponents="{num_components}" '
+            f'format="appended" offset="{offsets[4]}"/>',
+            "</PointData>",
+            "</Piece>",
+            "</UnstructuredGrid>",
+            '<AppendedData encoding="raw">',
+            "_",
+        ]
+    )
+
+    with open(filename, "wb") as f:
+        f.write(header.encode())
+
+        np.array(sizes[0], dtype="<u8").tofile(f)
+        for shift in shifts:
+            (points + shift).astype("<f8").tofile(f)
+
+        np.array(sizes[1], dtype="<u8").tofile(f)
+        for k in range(num_copies):
+            (cells + k * len(points)).astype("<i8").tofile(f)
+
+        np.array(sizes[2], dtype="<u8").tofile(f)
+        block = np.arange(1, len(cells) + 1, dtype="<i8") * nodes_per_cell
+        for k in range(num_copies):
+            (block + k * len(cells) * nodes_per_cell).tofile(f)
+
+        np.array(sizes[3], dtype="<u8").tofile(f)
+        block = np.full(len(cells), _vtk_type[cell_type], dtype="u1")
+        for _ in range(num_copies):
+            block.tofile(f)
+
+        np.array(sizes[4], dtype="<u8").tofile(f)
+        for vals in itertools.islice(values, num_copies):
+            np.asarray(vals).astype("<f8").tofile(f)
+
+        f.write(b"\n</AppendedData>\n</VTKFile>\n")
+
+
+def _write_meshio(
+    filename, points, cells, cell_type, shifts, values, name, num_components
+):
+    import meshio
+
+    num_copies = len(shifts)
+    n = len(points)
+    m = len(cells)
+
+    all_points = np.empty((num_copies, n, 3))
+    np.add(points, shifts[:, None, :], out=all_points)
+
+    all_cells = np.empty((num_copies, m, cells.shape[1]), dtype=cells.dtype)
+    np.add(cells, (n * np.arange(num_copies))[:, None, None], out=all_cells)
+
+    shape = (num_copies, n) if num_components == 1 else (num_copies, n, num_components)
+    all_values = np.empty(shape)
+    for k, vals in enumerate(itertools.islice(values, num_copies)):
+        all_values[k] = vals
+
+    meshio.write_points_cells(
+        filename,
+        all_points.reshape(-1, 3),
+        {cell_type: all_cells.reshape(-1, cells.shape[1])},
+        point_data={name: all_values.reshape((num_copies * n,) + shape[2:])},
+    )
@@ -1,4 +1,12 @@
-from .main import EvalCartesian, EvalSpherical
+from .main import EvalCartesian, EvalSpherical, Plan
+from .rotation import rotate
 from .tools import write_single, write_tree
 
-__all__ = ["EvalCartesian", "EvalSpherical", "write_single", "write_tree"]
+__all__ = [
+    "EvalCartesian",
+    "EvalSpherical",
+    "Plan",
+    "rotate",
+    "write_single",
+    "write_tree",
+]
@@ -1,13 +1,32 @@
 import numpy as np
 import sympy
 
-from ..helpers import Eval135
+from ..helpers import Eval135, EvalReal135
+from ..plans import Plan135
 
 
 class EvalCartesian:
-    """Evaluate spherical harmonics degree by degree `n` at angles `polar`, `azimuthal`."""
-
-    def __init__(self, X, scaling, complex_valued=True, symbolic="auto"):
+    """Evaluate spherical harmonics degree by degree `n` at angles `polar`, `azimuthal`.
+
+    With `real=True`, the members m > 0 are the real harmonics sqrt(2) Re(Y_n^m), i.e.,
+    with cos(m phi), the members -m are sqrt(2) Im(Y_n^m), with sin(m phi); they are
+    computed in real arithmetic. `complex_valued` is ignored then.
+
+    `m_max` truncates the orders to |m| <= m_max. With `negative_orders=False`, only the
+    orders m >= 0 are computed (not with `real=True`); expand() gives the full level
+    when needed.
+    """
+
+    def __init__(
+        self,
+        X,
+        scaling,
+        complex_valued=True,
+        symbolic="auto",
+        real=False,
+        m_max=None,
+        negative_orders=True,
+    ):
         assert len(X) == 3
         # assert X[0] ** 2 + X[1] ** 2 + X[2] ** 2 == 1
 
@@ -23,6 +42,16 @@ class EvalCartesian:
             "schmidt": RCSchmidt(False, symbolic),
         }[scaling]
 
+        if real:
+            pi = sympy.pi if symbolic else np.pi
+            self.int_p0 = rc.p0 * 4 * pi
+            assert negative_orders, "Real harmonics have independent negative orders."
+            # sin(polar) * cos(azimuthal), sin(polar) * sin(azimuthal)
+            self._eval_135 = EvalReal135(
+                rc, X[2], [X[0], X[1]], symbolic=symbolic, m_max=m_max
+            )
+            return
+
         if complex_valued:
             #
             # x = sin(polar) * cos(azimuthal)
@@ -55,7 +84,14 @@ class EvalCartesian:
         pi = sympy.pi if symbolic else np.pi
         self.int_p0 = rc.p0 * 4 * pi
 
-        self._eval_135 = Eval135(rc, X[2], xi, symbolic=symbolic)
+        self._eval_135 = Eval135(
+            rc,
+            X[2],
+            xi,
+            symbolic=symbolic,
+            m_max=m_max,
+            negative_orders=negative_orders,
+        )
 
     def __iter__(self):
         return self
@@ -63,11 +99,26 @@ class EvalCartesian:
     def __next__(self):
         return next(self._eval_135)
 
+    def expand(self, values, L):
+        """All orders of the level L from its orders m >= 0, see Eval135.expand()."""
+        return self._eval_135.expand(values, L)
 
-class EvalSpherical:
-    """Evaluate spherical harmonics degree by degree `n` at angles `polar`, `azimuthal`."""
 
-    def __init__(self, theta_phi, scaling, complex_valued=True, symbolic="auto"):
+class EvalSpherical:
+    """Evaluate spherical harmonics degree by degree `n` at angles `polar`, `azimuthal`.
+    See EvalCartesian for `real`, `m_max`, and `negative_orders`.
+    """
+
+    def __init__(
+        self,
+        theta_phi,
+        scaling,
+        complex_valued=True,
+        symbolic="auto",
+        real=False,
+        m_max=None,
+        negative_orders=True,
+    ):
         assert len(theta_phi) == 2
         if symbolic == "auto":
             symbolic = np.asarray(theta_phi).dtype == sympy.Basic
@@ -90,6 +141,16 @@ class EvalSpherical:
         #     cos_polar,
         # ]
 
+        if real:
+            sin_theta, sin_phi = sin(theta_phi)
+            cos_theta, cos_phi = cos(theta_phi)
+            xi = [sin_theta * cos_phi, sin_theta * sin_phi]
+            assert negative_orders, "Real harmonics have independent negative orders."
+            self._eval_135 = EvalReal135(
+                rc, cos_theta, xi, symbolic=symbolic, m_max=m_max
+            )
+            return
+
         if complex_valued:
             sin_theta, sin_phi = sin(theta_phi)
             cos_theta, cos_phi = cos(theta_phi)
@@ -103,7 +164,14 @@ class EvalSpherical:
             cos_theta = cos(theta)
             xi = [sin_theta, sin_theta]
 
-        self._eval_135 = Eval135(rc, cos_theta, xi, symbolic=symbolic)
+        self._eval_135 = Eval135(
+            rc,
+            cos_theta,
+            xi,
+            symbolic=symbolic,
+            m_max=m_max,
+            negative_orders=negative_orders,
+        )
 
     def __iter__(self):
         return self
@@ -111,6 +179,53 @@ class EvalSpherical:
     def __next__(self):
         return next(self._eval_135)
 
+    def expand(self, values, L):
+        """All orders of the level L from its orders m >= 0, see Eval135.expand()."""
+        return self._eval_135.expand(values, L)
+
+
+class Plan(Plan135):
+    """Reusable plan for the levels 0, ..., n-1 of the spherical harmonics at Cartesian
+    points of shape `shape` (with `shape[0] == 3`, see EvalCartesian); `plan(X,
+    out=buf)` writes all members into `buf`, see orthopy.plans.
+    """
+
+    def __init__(
+        self,
+        n,
+        scaling,
+        shape,
+        complex_valued=True,
+        backend="auto",
+        parallel=False,
+    ):
+        assert shape[0] == 3
+        rc = {
+            "acoustic": RCSpherical(False, False, geodetic=False),
+            "quantum mechanic": RCSpherical(True, False, geodetic=False),
+            "geodetic": RCSpherical(False, False, geodetic=True),
+            "schmidt": RCSchmidt(False, False),
+        }[scaling]
+        dtype = complex if complex_valued else float
+        super().__init__(rc, n, shape[1:], dtype, backend, parallel)
+        self.complex_valued = complex_valued
+        self._xi = np.empty((2,) + tuple(shape[1:]), dtype=dtype)
+
+    def __call__(self, X, out=None):
+        xi = self._xi
+        if self.complex_valued:
+            xi.real[0] = X[0]
+            np.negative(X[1], out=xi.imag[0])
+            xi.real[1] = X[0]
+            xi.imag[1] = X[1]
+        else:
+            np.multiply(X[0], X[0], out=xi[0])
+            np.multiply(X[1], X[1], out=xi[1])
+            xi[0] += xi[1]
+            np.sqrt(xi[0], out=xi[0])
+            xi[1] = xi[0]
+        return super().__call__(X[2], xi, out)
+
 
 class RCSpherical:
     def __init__(self, with_cs_phase, symbolic, geodetic):
@@ -0,0 +1,111 @@
+"""Rotation of expansions in spherical harmonics.
+
+For the rotation R = R_z(alpha) R_y(beta) R_z(gamma) (ZYZ Euler angles, active), the
+coefficients of f(R^{-1} x) in the orthonormal harmonics with Condon-Shortley phase are
+
+    c'_{l, m'} = sum_m D^l_{m' m} c_{l, m},
+    D^l_{m' m} = exp(-i m' alpha) d^l_{m' m}(beta) exp(-i m gamma).
+
+With Delta^l = d^l(pi/2), the Wigner d-matrix factors as
+
+    d^l_{m' m}(beta) = i^(m' - m) sum_k Delta^l_{k m'} Delta^l_{k m} exp(-i k beta),
+
+so one rotation costs two multiplications with Delta^l per degree, O(L^3) for all
+degrees l < L. Delta^l is computed with the stable recurrences of
+
+    Trapani, Navaza,
+    Calculation of spherical harmonics and Wigner d functions by FFT. Applications to
+    fast rotational matching in molecular replacement and implementation into AMoRe,
+    Acta Cryst. A62 (2006), 262-269,
+    <https://doi.org/10.1107/S0108767306017478>,
+
+and cached; the matrices for smaller L are a prefix of those for larger L.
+"""
+import numpy as np
+
+
+def rotate(coeffs, euler_angles, scaling):
+    """Coefficients of f(R^{-1} x) where f has the coefficients `coeffs` in the
+    complex-valued spherical harmonics of EvalCartesian/EvalSpherical in the scaling
+    `scaling`, ordered as in the tree, shape (num_members, ...). The trailing axes of
+    `coeffs` are a batch. `euler_angles` are the ZYZ angles (alpha, beta, gamma) of
+    R = R_z(alpha) R_y(beta) R_z(gamma).
+    """
+    coeffs = np.asarray(coeffs)
+    L = _num_levels(len(coeffs))
+    alpha, beta, gamma = euler_angles
+    batch_shape = coeffs.shape[1:]
+
+    c = coeffs.reshape(len(coeffs), -1) * _factors(scaling, L)[:, None]
+    out = np.empty(c.shape, dtype=complex)
+    for l, delta in enumerate(_deltas(L)):
+        m = np.arange(-l, l + 1)
+        x = c[l ** 2 : (l + 1) ** 2] * (1j ** -m * np.exp(-1j * m * gamma))[:, None]
+        x = (delta @ x) * np.exp(-1j * m * beta)[:, None]
+        x = delta.T @ x
+        out[l ** 2 : (l + 1) ** 2] = x * (1j ** m * np.exp(-1j * m * alpha))[:, None]
+
+    out /= _factors(scaling, L)[:, None]
+    return out.reshape(coeffs.shape[:1] + batch_shape)
+
+
+def _num_levels(num_members):
+    L = int(round(np.sqrt(num_members)))
+    assert L ** 2 == num_members
+    return L
+
+
+def _factors(scaling, L):
+    """Factors s with Y_scaling = s * Y_orthonormal_with_Condon_Shortley_phase, for the
+    members of the levels 0, ..., L-1.
+    """
+    l = np.repeat(np.arange(L), 2 * np.arange(L) + 1)
+    m = np.concatenate([np.arange(-k, k + 1) for k in range(L)])
+    base = {
+        "quantum mechanic": np.ones(len(l)),
+        "acoustic": np.ones(len(l)),
+        "geodetic": np.full(len(l), np.sqrt(4 * np.pi)),
+        "schmidt": np.sqrt(4 * np.pi / (2 * l + 1)),
+    }[scaling]
+    if scaling == "quantum mechanic":
+        return base
+    # no Condon-Shortley phase
+    return np.where(m > 0, (-1.0) ** m, 1.0) * base
+
+
+_DELTAS = [np.ones((1, 1))]
+
+
+def _deltas(L):
+    """Delta^l = d^l(pi/2) for l < L, shape (2l+1, 2l+1), indexed [m' + l, m + l]."""
+    out = _DELTAS
+    for l in range(len(out), L):
+        prev = out[-1]
+        delta = np.zeros((2 * l + 1, 2 * l + 1))
+        m = np.arange(l + 1)
+
+        # the row m' = l from the previous degree
+        delta[2 * l, l] = -np.sqrt((2 * l - 1) / (2 * l)) * prev[2 * l - 2, l - 1]
+        delta[2 * l, l + 1 :] = (
+            np.sqrt(l * (2 * l - 1) / (2 * (l + m[1:]) * (l + m[1:] - 1)))
+            * prev[2 * l - 2, l - 1 : 2 * l - 1]
+        )
+        # downward in m' for all m >= 0 at once
+        for mp in range(l - 1, -1, -1):
+            row = 2 * m / np.sqrt((l - mp) * (l + mp + 1)) * delta[l + mp + 1, l:]
+            if mp < l - 1:
+                row -= (
+                    np.sqrt((l - mp - 1) * (l + mp + 2) / ((l - mp) * (l + mp + 1)))
+                    * delta[l + mp + 2, l:]
+                )
+            delta[l + mp, l:] = row
+
+        # symmetries: d_{m', -m} = (-1)^(l + m') d_{m', m},
+        #             d_{-m', m} = (-1)^(l + m) d_{m', m}
+        sign = (-1.0) ** (l + m)
+        delta[l:, :l] = (sign[:, None] * delta[l:, l + 1 :])[:, ::-1]
+        delta[:l] = (delta[l + 1 :] * ((-1.0) ** (l + np.arange(-l, l + 1))))[::-1]
+
+        delta.setflags(write=False)
+        out.append(delta)
+    return out[:L]
@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 import pytest
 import sympy
@@ -97,6 +99,25 @@ def test_exact(x, scaling, factor):
             assert np.all(v == e)
 
 
+@pytest.mark.parametrize("scaling", ["classical", "normal"])
+@pytest.mark.parametrize("m_max", [None, 0, 3])
+def test_truncated(scaling, m_max, n=8, tol=1.0e-14):
+    x = np.linspace(-0.9, 0.9, 7)
+    full = list(itertools.islice(orthopy.c1.associated_legendre.Eval(x, scaling), n))
+
+    evaluator = orthopy.c1.associated_legendre.Eval(x, scaling, m_max=m_max)
+    half = orthopy.c1.associated_legendre.Eval(
+        x, scaling, m_max=m_max, negative_orders=False
+    )
+    for L, (ref, vals, vals_half) in enumerate(zip(full, evaluator, half)):
+        M = L if m_max is None else min(L, m_max)
+        ref = ref[L - M : L + M + 1]
+        assert len(vals_half) == M + 1
+        assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+        vals = half.expand(vals_half, L)
+        assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+
+
 def test_show(n=2):
     orthopy.c1.associated_legendre.show(n, "normal")
     orthopy.c1.associated_legendre.savefig("associated-legendre.svg", n, "normal")
@@ -81,6 +81,43 @@ def test_chebyshev1_normal(n, y):
     assert all(val == y)
 
 
+@pytest.mark.parametrize(
+    "n, y",
+    [
+        (0, [1, 1, 1]),
+        (1, [0, Rational(1, 2), 1]),
+        (2, [-1, -Rational(1, 2), 1]),
+        (3, [0, -1, 1]),
+        (4, [1, -Rational(1, 2), 1]),
+        (5, [0, Rational(1, 2), 1]),
+    ],
+)
+def test_chebyshev1_standard(n, y):
+    x = np.array([0, Rational(1, 2), 1])
+
+    val = get_nth(orthopy.c1.chebyshev1.Eval(x, "standard", symbolic=True), n)
+    assert all(val == y)
+
+
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal", "standard"])
+def test_trig(scaling, n=20, tol=1.0e-13):
+    # includes both endpoints and points outside of [-1, 1]
+    x = np.concatenate([np.linspace(-1.0, 1.0, 21), [-1.5, 2.0]])
+    ref = np.array(
+        list(itertools.islice(orthopy.c1.chebyshev1.Eval(x, scaling), n + 1))
+    )
+
+    evaluator = orthopy.c1.chebyshev1.Eval(x, scaling, method="trig")
+    vals = np.array(list(itertools.islice(evaluator, n + 1)))
+    assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+
+    vals = orthopy.c1.chebyshev1.tabulate(x, n, scaling)
+    assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+
+    val = orthopy.c1.chebyshev1.evaluate(x, n, scaling)
+    assert np.all(np.abs(val - ref[n]) < tol * (1 + np.abs(ref[n])))
+
+
 # def _integrate(f, x):
 #     # expanding makes sympy work a lot faster here
 #     return sympy.integrate(sympy.expand(f) / sqrt(1 - x ** 2), (x, -1, +1))
@@ -83,6 +83,43 @@ def test_chebyshev2_normal(n, y):
     assert all(val == y)
 
 
+@pytest.mark.parametrize(
+    "n, y",
+    [
+        (0, [1, 1, 1]),
+        (1, [0, 1, 2]),
+        (2, [-1, 0, 3]),
+        (3, [0, -1, 4]),
+        (4, [1, -1, 5]),
+        (5, [0, 0, 6]),
+    ],
+)
+def test_chebyshev2_standard(n, y):
+    x = np.array([0, Rational(1, 2), 1])
+
+    val = get_nth(orthopy.c1.chebyshev2.Eval(x, "standard", symbolic=True), n)
+    assert all(val == y)
+
+
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal", "standard"])
+def test_trig(scaling, n=20, tol=1.0e-13):
+    # includes both endpoints and points outside of [-1, 1]
+    x = np.concatenate([np.linspace(-1.0, 1.0, 21), [-1.5, 2.0]])
+    ref = np.array(
+        list(itertools.islice(orthopy.c1.chebyshev2.Eval(x, scaling), n + 1))
+    )
+
+    evaluator = orthopy.c1.chebyshev2.Eval(x, scaling, method="trig")
+    vals = np.array(list(itertools.islice(evaluator, n + 1)))
+    assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+
+    vals = orthopy.c1.chebyshev2.tabulate(x, n, scaling)
+    assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+
+    val = orthopy.c1.chebyshev2.evaluate(x, n, scaling)
+    assert np.all(np.abs(val - ref[n]) < tol * (1 + np.abs(ref[n])))
+
+
 # def _integrate(f, x):
 #     return sympy.integrate(f * sqrt(1 - x ** 2), (x, -1, +1))
 
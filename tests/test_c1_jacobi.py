@@ -73,5 +73,18 @@ def test_show(n=5):
     orthopy.c1.jacobi.savefig("jacobi.svg", n, "normal", 0, 0)
 
 
+@pytest.mark.parametrize("scaling", ["classical", "monic", "normal"])
+def test_plan(scaling, n=6, tol=1.0e-14):
+    x = np.linspace(-1.0, 1.0, 12).reshape(3, 4)
+    plan = orthopy.c1.jacobi.Plan(n, scaling, 0.5, 1.5, x.shape)
+    buf = plan.empty()
+    out = plan(x, out=buf)
+    assert out is buf
+
+    evaluator = orthopy.c1.jacobi.Eval(x, scaling, 0.5, 1.5)
+    ref = np.array([next(evaluator) for _ in range(n)])
+    assert np.all(np.abs(out - ref) < tol * (1 + np.abs(ref)))
+
+
 if __name__ == "__main__":
     test_show()
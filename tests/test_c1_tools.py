@@ -1,6 +1,9 @@
+import itertools
 import math
 
 import numpy as np
+import pytest
+import sympy
 from scipy.special import legendre
 
 import orthopy
@@ -20,5 +23,62 @@ def test_clenshaw(tol=1.0e-14):
     assert abs(value - ref) < tol
 
 
+def test_convert_exact(n=12, tol=1.0e-14):
+    # classical Legendre -> Chebyshev T, compare with the exact expansion of the same
+    # polynomial in rational arithmetic
+    c = np.random.default_rng(0).random(n) - 0.5
+    d = orthopy.c1.convert(c, ("legendre", "classical"), ("chebyshev1", "standard"))
+
+    x = sympy.Symbol("x")
+    p = sympy.Poly(
+        sum(sympy.Rational(ck) * sympy.legendre_poly(k, x) for k, ck in enumerate(c)),
+        x,
+    )
+    ref = [sympy.S(0)] * n
+    for k in reversed(range(n)):
+        # the leading coefficient of T_k is 2**(k-1)
+        ref[k] = p.coeff_monomial(x ** k) / (2 ** (k - 1) if k > 0 else 1)
+        p -= sympy.Poly(ref[k] * sympy.chebyshevt_poly(k, x), x)
+    ref = np.array([float(r) for r in ref])
+    assert np.all(np.abs(d - ref) < tol * np.max(np.abs(ref)))
+
+
+@pytest.mark.parametrize(
+    "from_family,to_family",
+    [
+        # integer shifts
+        (("jacobi", "classical", 0.3, -0.4), ("jacobi", "normal", 2.3, 0.6)),
+        (("jacobi", "normal", 2.3, 0.6), ("jacobi", "classical", 0.3, -0.4)),
+        # fractional shifts
+        (("legendre", "normal"), ("chebyshev1", "normal")),
+        (("chebyshev2", "standard"), ("gegenbauer", "classical", 1.7)),
+        (("jacobi", "monic", -0.7, 3.2), ("legendre", "classical")),
+    ],
+)
+def test_convert(from_family, to_family, n=25, tol=1.0e-12):
+    def values(family, x):
+        name, *params = family
+        evaluator = getattr(orthopy.c1, name).Eval(x, *params)
+        return np.array(list(itertools.islice(evaluator, n)))
+
+    c = np.random.default_rng(0).random((n, 2)) - 0.5
+    d = orthopy.c1.convert(c, from_family, to_family)
+    assert d.shape == (n, 2)
+
+    x = np.linspace(-0.9, 0.9, 11)
+    ref = values(from_family, x).T @ c
+    assert np.all(np.abs(values(to_family, x).T @ d - ref) < tol * np.max(np.abs(ref)))
+
+
+def test_convert_large(n=5000, tol=1.0e-15):
+    c = np.random.default_rng(0).random(n) - 0.5
+    legendre_normal = ("legendre", "normal")
+    chebyshev_normal = ("chebyshev1", "normal")
+    d = orthopy.c1.convert(c, legendre_normal, chebyshev_normal)
+    c2 = orthopy.c1.convert(d, chebyshev_normal, legendre_normal)
+    # the round-trip error grows about linearly with n
+    assert np.all(np.abs(c2 - c) < tol * n * np.max(np.abs(c)))
+
+
 if __name__ == "__main__":
     test_clenshaw()
@@ -0,0 +1,66 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import orthopy
+
+
+def test_cache():
+    cache = orthopy.cache.TreeCache()
+    x = np.linspace(-1.0, 1.0, 11)
+
+    levels = cache(orthopy.c1.jacobi.Eval, x, 5, "normal", 0.5, 0.5)
+    ref = list(itertools.islice(orthopy.c1.jacobi.Eval(x, "normal", 0.5, 0.5), 5))
+    assert len(levels) == 5
+    for v, r in zip(levels, ref):
+        assert np.all(v == r)
+        assert not v.flags.writeable
+    assert cache.cache_info()[:3] == (0, 1, 0)
+
+    # same content, different array; fewer levels
+    levels2 = cache(orthopy.c1.jacobi.Eval, x.copy(), 3, "normal", 0.5, 0.5)
+    assert all(a is b for a, b in zip(levels, levels2))
+    assert cache.cache_info()[:3] == (1, 1, 0)
+
+    # different parameters, points, or more levels are misses
+    cache(orthopy.c1.jacobi.Eval, x, 5, "normal", 0.5, 1.5)
+    cache(orthopy.c1.jacobi.Eval, x + 1.0e-15, 5, "normal", 0.5, 0.5)
+    cache(orthopy.c1.jacobi.Eval, x, 6, "normal", 0.5, 0.5)
+    assert cache.cache_info()[:3] == (1, 4, 0)
+    assert len(cache) == 3
+
+    with pytest.raises(ValueError):
+        levels[0][0] = 1.0
+
+
+def test_cache_eviction():
+    x = np.linspace(-1.0, 1.0, 100)
+    # room for exactly two entries of 4 levels
+    cache = orthopy.cache.TreeCache(max_bytes=2 * 4 * x.nbytes)
+    cache(orthopy.c1.legendre.Eval, x, 4, "normal")
+    cache(orthopy.c1.legendre.Eval, x, 4, "monic")
+    # refresh "normal"
+    cache(orthopy.c1.legendre.Eval, x, 4, "normal")
+    cache(orthopy.c1.legendre.Eval, x, 4, "classical")
+    info = cache.cache_info()
+    assert info.evictions == 1
+    assert info.nbytes == 2 * 4 * x.nbytes
+    # "monic" was evicted
+    cache(orthopy.c1.legendre.Eval, x, 4, "normal")
+    cache(orthopy.c1.legendre.Eval, x, 4, "monic")
+    assert cache.cache_info()[:2] == (2, 4)
+
+    # too large for the budget: not stored
+    cache(orthopy.c1.legendre.Eval, x, 10, "normal")
+    assert cache.cache_info().nbytes <= cache.max_bytes
+
+
+def test_cache_tree():
+    # zernike reuses the previous level in place; the cached levels must still be right
+    cache = orthopy.cache.TreeCache()
+    X = np.random.rand(2, 7) - 0.5
+    levels = cache(orthopy.s2.zernike.Eval, X, 6, "normal")
+    evaluator = orthopy.s2.zernike.Eval(X, "normal")
+    for v in levels:
+        assert np.all(np.abs(v - np.array(next(evaluator))) < 1.0e-14)
@@ -56,6 +56,63 @@ def test_normality(d, n=4):
         assert _integrate_poly(val ** 2) == 1
 
 
+@pytest.mark.parametrize("d", [1, 2, 3])
+def test_eval_grid(d, n=5):
+    axes = [np.linspace(-1.0, 1.0, 3 + k) for k in range(d)]
+    X = np.array(np.meshgrid(*axes, indexing="ij"))
+
+    ref = orthopy.cn.Eval(X, 0.5, -0.5, return_degrees=True)
+    grid = orthopy.cn.EvalGrid(axes, 0.5, -0.5, return_degrees=True)
+    assert grid.int_p0 == ref.int_p0
+    for (v0, d0), (v1, d1) in itertools.islice(zip(ref, grid), n + 1):
+        assert v0.shape == v1.shape
+        assert np.all(d0 == d1)
+        assert np.all(np.abs(v0 - v1) < 1.0e-13 * (1.0 + np.abs(v0)))
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [("total", 4), ("max", 2), ("hyperbolic", 5), ("anisotropic", 4, [1.0, 2.0, 0.5])],
+)
+def test_index_set(spec):
+    X = np.random.rand(3, 5) - 0.5
+    ev = orthopy.cn.Eval(X, 0.5, -0.5, return_degrees=True, index_set=spec)
+    out = list(ev)
+
+    degrees = np.concatenate([d for _, d in out])
+    assert np.all(degrees == orthopy.helpers.multi_index_set(3, *spec))
+
+    # compare with the full tree
+    ref = orthopy.cn.Eval(X, 0.5, -0.5, return_degrees=True)
+    for (v0, d0), (v1, d1) in zip(ref, out):
+        mask = [any(np.all(d == d1, axis=1)) for d in d0]
+        assert np.all(d0[mask] == d1)
+        assert np.all(np.abs(v0[mask] - v1) < 1.0e-13 * (1.0 + np.abs(v1)))
+
+
+@pytest.mark.parametrize("rule", ["gauss", "leja"])
+def test_sparse_grid(rule, d=4, level=3):
+    grid = orthopy.cn.sparse_grid(d, level, rule=rule, alpha=0.5, beta=-0.5)
+
+    # integrates all basis functions of degree 2 * level + 1 (Gauss) or level (Leja)
+    n = 2 * level + 1 if rule == "gauss" else level
+    evaluator = orthopy.cn.Eval(
+        grid.points, alpha=0.5, beta=-0.5, index_set=("total", n)
+    )
+    vals = np.concatenate(list(evaluator))
+    ref = np.zeros(len(vals))
+    ref[0] = 1.0 / vals[0, 0]
+    assert np.all(np.abs(grid.integrate(vals) - ref) < 1.0e-13)
+
+    # reproduces the basis of total degree `level`
+    evaluator = orthopy.cn.Eval(
+        grid.points, alpha=0.5, beta=-0.5, index_set=grid.degrees
+    )
+    vals = np.concatenate(list(evaluator))
+    coeffs = grid.interpolate(vals)
+    assert np.all(np.abs(coeffs - np.eye(len(vals))) < 1.0e-13)
+
+
 @pytest.mark.parametrize("n", [2])
 def test_show_tree(n):
     alpha = 0.0
@@ -77,6 +134,17 @@ def test_write_tree(n):
 
     # 3D
     orthopy.cn.write_tree_3d("c3.vtk", n, alpha, beta)
+    orthopy.cn.write_tree_3d("c3.vtu", n, alpha, beta)
+
+
+def test_plan(n=5, tol=1.0e-14):
+    X = np.random.rand(3, 4, 2) * 2 - 1
+    plan = orthopy.cn.Plan(n, X.shape, 0.5, -0.5)
+    out = plan(X, out=plan.empty())
+
+    evaluator = orthopy.cn.Eval(X, 0.5, -0.5)
+    for level, ref in zip(plan.levels(out), evaluator):
+        assert np.all(np.abs(level - ref) < tol * (1 + np.abs(ref)))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import itertools
 
+import numpy as np
 import pytest
 import sympy
 from sympy import gamma
@@ -65,6 +66,32 @@ def test_normality(alpha, n=4):
         assert _integrate_poly(val ** 2, alpha, x) == 1
 
 
+@pytest.mark.parametrize("alpha", [0, 0.5])
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal"])
+def test_functions(alpha, scaling, n=20, tol=1.0e-13):
+    X = np.linspace(0.0, 10.0, 11)
+    evaluator = orthopy.e1r.Eval(X, scaling, alpha=alpha, functions=True)
+    vals = np.array(list(itertools.islice(evaluator, n + 1)))
+
+    evaluator = orthopy.e1r.Eval(X, scaling, alpha=alpha)
+    ref = np.array(list(itertools.islice(evaluator, n + 1))) * np.exp(-X / 2)
+    assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+
+
+def test_functions_large():
+    # exp(-x/2) underflows here; the reference values are computed with mpmath.
+    X = np.array([800.0, 2000.0])
+    evaluator = orthopy.e1r.Eval(X, "classical", alpha=0.5, functions=True)
+    vals = list(itertools.islice(evaluator, 1001))
+    ref = {
+        100: [1.9532899329311602e-48, 3.445400362503225e-265],
+        1000: [0.0024122537241506414, 0.012541280206684957],
+    }
+    for n, r in ref.items():
+        assert np.all(np.isfinite(vals[n]))
+        assert np.all(np.abs(vals[n] - r) < 1.0e-10 * np.abs(r))
+
+
 def test_show(n=5):
     orthopy.e1r.show(n, "normal", alpha=0)
     orthopy.e1r.savefig("e1r.svg", n, "normal", alpha=0)
@@ -1,5 +1,6 @@
 import itertools
 
+import numpy as np
 import pytest
 import sympy
 from sympy import Rational, pi, sqrt
@@ -97,6 +98,45 @@ def test_normality(standardization, n=4):
 #     orthopy.e1r2.show(4, standardization, "normal")
 
 
+@pytest.mark.parametrize("standardization", ["probabilists", "physicists"])
+@pytest.mark.parametrize("scaling", ["classical", "monic", "normal"])
+def test_functions(standardization, scaling, n=20, tol=1.0e-13):
+    X = np.linspace(-4.0, 4.0, 17)
+    evaluator = orthopy.e1r2.Eval(X, standardization, scaling, functions=True)
+    vals = np.array(list(itertools.islice(evaluator, n + 1)))
+
+    evaluator = orthopy.e1r2.Eval(X, standardization, scaling)
+    ref = np.array(list(itertools.islice(evaluator, n + 1)))
+    c = 0.5 if standardization == "physicists" else 0.25
+    ref *= np.exp(-c * X ** 2)
+    assert np.all(np.abs(vals - ref) < tol * (1 + np.abs(ref)))
+
+
+def test_functions_large():
+    # Here, both the polynomials and exp(-x**2/2) are out of the float64 range; the
+    # reference values are computed with mpmath.
+    X = np.array([40.0, 50.0])
+    evaluator = orthopy.e1r2.Eval(X, "physicists", "normal", functions=True)
+    vals = list(itertools.islice(evaluator, 2001))
+    ref = {
+        1000: [0.17225052073279226, 1.7381178618413235e-35],
+        2000: [0.10766261188867067, -0.09825497710990165],
+    }
+    for n, r in ref.items():
+        assert np.all(np.isfinite(vals[n]))
+        assert np.all(np.abs(vals[n] - r) < 1.0e-10 * np.abs(r))
+
+
+def test_functions_subnormal_factor():
+    # exp(-x**2/2) is subnormal or zero at these points, the products are not; the
+    # reference values are computed with mpmath.
+    X = np.array([38.0, 39.0, 40.0])
+    evaluator = orthopy.e1r2.Eval(X, "physicists", "normal", functions=True)
+    vals = list(itertools.islice(evaluator, 51))
+    ref = [2.518210480411383e-260, 1.796590277536268e-276, 4.5551293637797303e-293]
+    assert np.all(np.abs(vals[50] - ref) < 1.0e-14 * np.abs(ref))
+
+
 def test_show(n=5):
     orthopy.e1r2.show(n, "probabilists", "normal")
     orthopy.e1r2.savefig("e1r2.svg", n, "probabilists", "normal")
@@ -4,6 +4,7 @@ import ndim
 import numpy as np
 import pytest
 import sympy
+from helpers import get_nth
 
 import orthopy
 
@@ -66,6 +67,109 @@ def test_normality(d, standardization, n=4):
             assert _integrate_poly(val ** 2, standardization) == 1
 
 
+@pytest.mark.parametrize("d", [1, 2, 3])
+@pytest.mark.parametrize("standardization", ["physicists", "probabilists"])
+def test_eval_grid(d, standardization, n=5):
+    axes = [np.linspace(-1.0, 1.0, 3 + k) for k in range(d)]
+    X = np.array(np.meshgrid(*axes, indexing="ij"))
+
+    ref = orthopy.enr2.Eval(X, standardization, return_degrees=True)
+    grid = orthopy.enr2.EvalGrid(axes, standardization, return_degrees=True)
+    assert grid.int_p0 == ref.int_p0
+    for (v0, d0), (v1, d1) in itertools.islice(zip(ref, grid), n + 1):
+        assert v0.shape == v1.shape
+        assert np.all(d0 == d1)
+        assert np.all(np.abs(v0 - v1) < 1.0e-13 * (1.0 + np.abs(v0)))
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [("total", 4), ("max", 2), ("hyperbolic", 5), ("anisotropic", 4, [1.0, 2.0, 0.5])],
+)
+@pytest.mark.parametrize("standardization", ["physicists", "probabilists"])
+def test_index_set(spec, standardization):
+    X = np.random.rand(3, 5) - 0.5
+    ev = orthopy.enr2.Eval(X, standardization, return_degrees=True, index_set=spec)
+    out = list(ev)
+
+    degrees = np.concatenate([d for _, d in out])
+    assert np.all(degrees == orthopy.helpers.multi_index_set(3, *spec))
+
+    # compare with the full tree
+    ref = orthopy.enr2.Eval(X, standardization, return_degrees=True)
+    for (v0, d0), (v1, d1) in zip(ref, out):
+        mask = [any(np.all(d == d1, axis=1)) for d in d0]
+        assert np.all(d0[mask] == d1)
+        assert np.all(np.abs(v0[mask] - v1) < 1.0e-13 * (1.0 + np.abs(v1)))
+
+
+@pytest.mark.parametrize("rule", ["gauss", "leja"])
+@pytest.mark.parametrize("standardization", ["physicists", "probabilists"])
+def test_sparse_grid(rule, standardization, d=4, level=3):
+    grid = orthopy.enr2.sparse_grid(
+        d, level, rule=rule, standardization=standardization
+    )
+
+    # integrates all basis functions of degree 2 * level + 1 (Gauss) or level (Leja)
+    n = 2 * level + 1 if rule == "gauss" else level
+    evaluator = orthopy.enr2.Eval(
+        grid.points, standardization=standardization, index_set=("total", n)
+    )
+    vals = np.concatenate(list(evaluator))
+    ref = np.zeros(len(vals))
+    ref[0] = 1.0 / vals[0, 0]
+    assert np.all(np.abs(grid.integrate(vals) - ref) < 1.0e-13)
+
+    # reproduces the basis of total degree `level`
+    evaluator = orthopy.enr2.Eval(
+        grid.points, standardization=standardization, index_set=grid.degrees
+    )
+    vals = np.concatenate(list(evaluator))
+    coeffs = grid.interpolate(vals)
+    assert np.all(np.abs(coeffs - np.eye(len(vals))) < 1.0e-13)
+
+
+@pytest.mark.parametrize("standardization", ["physicists", "probabilists"])
+def test_functions(standardization, n=30):
+    # some points far out where exp(-r**2/2) underflows
+    X = np.array([[-30.0, 0.5, 40.0, 1.0], [35.0, -1.0, 0.0, 2.0]])
+    c = 0.5 if standardization == "physicists" else 0.25
+
+    # product of the 1D functions
+    vals_1d = [
+        list(
+            itertools.islice(
+                orthopy.e1r2.Eval(x, standardization, "normal", functions=True), n + 1
+            )
+        )
+        for x in X
+    ]
+    ref = [vals_1d[0][n - k] * vals_1d[1][k] for k in range(n + 1)]
+
+    evaluator = orthopy.enr2.Eval(X, standardization, functions=True)
+    vals = get_nth(evaluator, n)
+    assert np.all(np.abs(vals - ref) < 1.0e-14)
+
+    evaluator = orthopy.enr2.Eval(
+        X, standardization, functions=True, index_set=("total", n)
+    )
+    vals = get_nth(evaluator, n)
+    assert np.all(np.abs(vals - ref) < 1.0e-14)
+
+    # moderate points: plain polynomials times the exponential
+    X = X[:, 1:]
+    vals = get_nth(orthopy.enr2.Eval(X, standardization, functions=True), 5)
+    ref = get_nth(orthopy.enr2.Eval(X, standardization), 5)
+    ref *= np.exp(-c * np.sum(X ** 2, axis=0))
+    assert np.all(np.abs(vals - ref) < 1.0e-14)
+
+    evaluator = orthopy.enr2.EvalGrid(X, standardization, functions=True)
+    vals = get_nth(evaluator, 5)
+    ref = get_nth(orthopy.enr2.EvalGrid(X, standardization), 5)
+    ref *= np.exp(-c * np.add.outer(X[0] ** 2, X[1] ** 2))
+    assert np.all(np.abs(vals - ref) < 1.0e-14)
+
+
 @pytest.mark.parametrize("n", [2])
 def test_show_tree(n):
     standardization = "probabilists"
@@ -82,6 +186,18 @@ def test_write_tree(n):
     standardization = "probabilists"
     # 3D
     orthopy.enr2.write_tree_3d("e3r2.vtk", n, standardization)
+    orthopy.enr2.write_tree_3d("e3r2.vtu", n, standardization)
+
+
+@pytest.mark.parametrize("standardization", ["physicists", "probabilists"])
+def test_plan(standardization, n=5, tol=1.0e-14):
+    X = np.random.rand(3, 4, 2) * 2 - 1
+    plan = orthopy.enr2.Plan(n, standardization, X.shape)
+    out = plan(X, out=plan.empty())
+
+    evaluator = orthopy.enr2.Eval(X, standardization)
+    for level, ref in zip(plan.levels(out), evaluator):
+        assert np.all(np.abs(level - ref) < tol * (1 + np.abs(ref)))
 
 
 if __name__ == "__main__":
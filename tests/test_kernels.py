@@ -0,0 +1,96 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import orthopy
+from orthopy import kernels
+
+backends = [
+    ("numpy", False),
+    pytest.param(
+        "numba",
+        False,
+        marks=pytest.mark.skipif(not kernels.has_numba(), reason="needs numba"),
+    ),
+    pytest.param(
+        "numba",
+        True,
+        marks=pytest.mark.skipif(not kernels.has_numba(), reason="needs numba"),
+    ),
+]
+
+
+@pytest.mark.parametrize("backend,parallel", backends)
+def test_1d(backend, parallel, n=7, tol=1.0e-14):
+    x = np.linspace(-1.0, 1.0, 100)
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients("normal", 0.3, -0.2, symbolic=False)
+    out = np.empty((n, len(x)))
+    kernels.eval_1d(x, kernels.pack_1d(rc, n), rc.p0, out, backend, parallel)
+
+    evaluator = orthopy.c1.jacobi.Eval(x, "normal", 0.3, -0.2)
+    ref = np.array(list(itertools.islice(evaluator, n)))
+    assert np.all(np.abs(out - ref) < tol * (1 + np.abs(ref)))
+
+
+@pytest.mark.parametrize("backend,parallel", backends)
+def test_135(backend, parallel, n=7, tol=1.0e-14):
+    x = np.linspace(-1.0, 1.0, 100)
+    evaluator = orthopy.c1.associated_legendre.Eval(x, "normal")
+    kernel = kernels.Kernel(evaluator, n, backend, parallel)
+    assert kernel.out_shape == (kernels.num_members_135(n), len(x))
+    out = kernel()
+
+    ref = np.concatenate(list(itertools.islice(evaluator, n)))
+    assert np.all(np.abs(out - ref) < tol * (1 + np.abs(ref)))
+
+
+@pytest.mark.parametrize("backend,parallel", backends)
+def test_triangle(backend, parallel, n=7, tol=1.0e-14):
+    bary = np.random.rand(3, 100)
+    bary /= np.sum(bary, axis=0)
+    evaluator = orthopy.t2.Eval(bary, "normal")
+    u, v, w = bary
+    coeffs = kernels.pack_triangle(lambda k: evaluator.rc[k], n)
+    out = np.empty((kernels.num_members_triangle(n), len(u)))
+    kernels.eval_triangle(
+        1 - 2 * w,
+        u - v,
+        (u + v) ** 2,
+        coeffs,
+        evaluator.rc.p0,
+        n,
+        out,
+        backend,
+        parallel,
+    )
+
+    ref = np.concatenate(list(itertools.islice(evaluator, n)))
+    assert np.all(np.abs(out - ref) < tol * (1 + np.abs(ref)))
+
+
+@pytest.mark.parametrize(
+    "evaluator",
+    [
+        lambda X: orthopy.c1.legendre.Eval(X[0], "normal"),
+        lambda X: orthopy.c1.chebyshev1.Eval(X[0], "standard"),
+        lambda X: orthopy.e1r2.Eval(X[0], "physicists", "normal"),
+        lambda X: orthopy.c1.associated_legendre.Eval(X[0], "classical"),
+        lambda X: orthopy.s2.xu.Eval(X[:2] / 2, "normal"),
+        lambda X: orthopy.t2.Eval(X / np.sum(X, axis=0), "normal"),
+    ],
+)
+def test_kernel(evaluator, n=6, tol=1.0e-14):
+    X = np.random.default_rng(0).random((3, 4, 5))
+    out = kernels.Kernel(evaluator(X), n)()
+
+    levels = itertools.islice(evaluator(X), n)
+    ref = np.concatenate([np.reshape(level, (-1, 4, 5)) for level in levels])
+    assert out.shape == ref.shape
+    assert np.all(np.abs(out - ref) < tol * (1 + np.abs(ref)))
+
+
+def test_kernel_unsupported():
+    x = np.linspace(-1.0, 1.0, 10)
+    with pytest.raises(TypeError):
+        kernels.Kernel(orthopy.c1.chebyshev1.Eval(x, "standard", method="trig"), 5)
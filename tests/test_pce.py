@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+import orthopy
+
+
+def _model(X):
+    return np.array([X[0] + X[1] * X[2], 2 + X[2] ** 2])
+
+
+def test_fit_cn():
+    # uniform distribution on [-1, 1]^3
+    pce = orthopy.pce.PCE("cn", 3, ("total", 3))
+    X = np.random.rand(3, 100) * 2 - 1
+    pce.fit(X, _model(X))
+    assert pce.coefficients.shape == (20, 2)
+
+    Xt = np.random.rand(3, 10) * 2 - 1
+    assert np.all(np.abs(pce(Xt) - _model(Xt)) < 1.0e-12)
+
+    tol = 1.0e-12
+    assert np.all(np.abs(pce.mean - [0.0, 7.0 / 3.0]) < tol)
+    assert np.all(np.abs(pce.variance - [4.0 / 9.0, 4.0 / 45.0]) < tol)
+    ref = [[0.75, 0.0], [0.0, 0.0], [0.0, 1.0]]
+    assert np.all(np.abs(pce.sobol_first - ref) < tol)
+    ref = [[0.75, 0.0], [0.25, 0.0], [0.25, 1.0]]
+    assert np.all(np.abs(pce.sobol_total - ref) < tol)
+
+
+def test_project_cn():
+    # tensor Gauss-Legendre rule
+    x, w = np.polynomial.legendre.leggauss(4)
+    X = np.array(np.meshgrid(x, x, x, indexing="ij")).reshape(3, -1)
+    W = np.einsum("i,j,k->ijk", w, w, w).reshape(-1)
+
+    pce = orthopy.pce.PCE("cn", 3, ("hyperbolic", 3))
+    pce.project(X, W, _model(X))
+    assert np.all(np.abs(pce.mean - [0.0, 7.0 / 3.0]) < 1.0e-12)
+    assert np.all(np.abs(pce.variance - [4.0 / 9.0, 4.0 / 45.0]) < 1.0e-12)
+
+
+@pytest.mark.parametrize(
+    "standardization,var,sobol_total",
+    [("probabilists", 2.0, [1.0, 0.5]), ("physicists", 0.75, [1.0, 1.0 / 3.0])],
+)
+def test_fit_enr2(standardization, var, sobol_total):
+    pce = orthopy.pce.PCE("enr2", 2, ("total", 2), standardization=standardization)
+    X = np.random.randn(2, 50)
+    pce.fit(X, 1 + X[0] + X[0] * X[1])
+
+    assert abs(pce.mean - 1.0) < 1.0e-12
+    assert abs(pce.variance - var) < 1.0e-12
+    assert np.all(np.abs(pce.sobol_total - sobol_total) < 1.0e-12)
+
+
+def test_output_axes():
+    # outputs of shape (4, 3): Y[i, j] = a[i, j] * x0 + b[i, j] * x1 * x2 + 1
+    rng = np.random.default_rng(0)
+    a = rng.random((4, 3))
+    b = rng.random((4, 3))
+
+    def model(X):
+        return np.multiply.outer(a, X[0]) + np.multiply.outer(b, X[1] * X[2]) + 1
+
+    pce = orthopy.pce.PCE("cn", 3, ("total", 2))
+    X = rng.random((3, 100)) * 2 - 1
+    pce.fit(X, model(X))
+    assert pce.coefficients.shape == (10, 4, 3)
+    assert pce.mean.shape == (4, 3)
+    assert pce.variance.shape == pce.mean.shape
+    assert pce.sobol_first.shape == (3, 4, 3)
+
+    tol = 1.0e-12
+    assert np.all(np.abs(pce.variance - (a ** 2 / 3 + b ** 2 / 9)) < tol)
+    ref = a ** 2 / 3 / (a ** 2 / 3 + b ** 2 / 9)
+    assert np.all(np.abs(pce.sobol_first[0] - ref) < tol)
+
+    Xs = rng.random((3, 100_000)) * 2 - 1
+    assert np.all(np.abs(pce.variance - np.var(model(Xs), axis=-1)) < 0.02)
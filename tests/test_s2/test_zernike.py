@@ -119,6 +119,38 @@ def test_show_tree(n, scaling="normal"):
     )
 
 
+@pytest.mark.parametrize("scaling", ["classical", "normal"])
+def test_plan(scaling, n=6, tol=1.0e-14):
+    X = np.random.rand(2, 4, 2) * 0.7
+    plan = orthopy.s2.zernike.Plan(n, scaling, X.shape)
+    out = plan(X, out=plan.empty())
+
+    evaluator = orthopy.s2.zernike.Eval(X, scaling)
+    for level, _ in zip(plan.levels(out), range(n)):
+        ref = next(evaluator)
+        assert np.all(np.abs(level - ref) < tol * (1 + np.abs(ref)))
+
+
+@pytest.mark.parametrize("scaling", ["classical", "normal"])
+def test_polar(scaling, n=7, num_theta=15, tol=1.0e-12):
+    rho, rho_weights = orthopy.s2.zernike.polar_grid(4)
+    theta = 2 * np.pi * np.arange(num_theta) / num_theta
+    X = np.array([np.outer(rho, np.cos(theta)), np.outer(rho, np.sin(theta))])
+
+    coeffs = np.random.rand(n * (n + 1) // 2, 2)
+    values = orthopy.s2.zernike.polar_synthesize(coeffs, scaling, rho, num_theta)
+    assert values.shape == (len(rho), num_theta, 2)
+
+    # Eval updates the previous level in place
+    evaluator = orthopy.s2.zernike.Eval(X, scaling)
+    vals = np.concatenate([np.array(v) for v in itertools.islice(evaluator, n)])
+    ref = np.einsum("kij,kb->ijb", vals, coeffs)
+    assert np.all(np.abs(values - ref) < tol * (1 + np.abs(ref)))
+
+    c = orthopy.s2.zernike.polar_analyze(values, scaling, n, rho, rho_weights)
+    assert np.all(np.abs(c - coeffs) < tol)
+
+
 if __name__ == "__main__":
     # test_show((3, 2), "normal")
     test_show_tree(5, "normal")
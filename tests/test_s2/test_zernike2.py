@@ -156,6 +156,18 @@ def test_show_tree(n, scaling="normal"):
     )
 
 
+@pytest.mark.parametrize("scaling", ["classical", "normal"])
+def test_plan(scaling, n=6, tol=1.0e-14):
+    X = np.random.rand(2, 4, 2) * 0.7
+    plan = orthopy.s2.zernike2.Plan(n, scaling, X.shape)
+    out = plan(X, out=plan.empty())
+
+    evaluator = orthopy.s2.zernike2.Eval(X, scaling)
+    for level, _ in zip(plan.levels(out), range(n)):
+        ref = next(evaluator)
+        assert np.all(np.abs(level - ref) < tol * (1 + np.abs(ref)))
+
+
 if __name__ == "__main__":
     # test_show((3, 2), "normal")
     test_show_tree(5, "normal")
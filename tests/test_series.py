@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from numpy.polynomial import chebyshev, hermite, laguerre, legendre
+
+import orthopy
+
+
+@pytest.mark.parametrize(
+    "family,params,module,prefix",
+    [
+        ("c1.legendre", ("classical",), legendre, "leg"),
+        ("c1.chebyshev1", ("standard",), chebyshev, "cheb"),
+        ("e1r", ("classical", 0), laguerre, "lag"),
+        ("e1r2", ("physicists", "classical"), hermite, "herm"),
+    ],
+)
+def test_numpy(family, params, module, prefix, tol=1.0e-13):
+    # compare with numpy.polynomial
+    def ref(name):
+        return getattr(module, prefix + name)
+
+    c = np.random.rand(8) - 0.5
+    d = np.random.rand(5) - 0.5
+    s = orthopy.Series(family, params, c)
+    t = orthopy.Series(family, params, d)
+    x = np.linspace(-0.9, 0.9, 7)
+
+    def close(a, b):
+        return np.all(np.abs(a - b) < tol * (1 + np.max(np.abs(b))))
+
+    assert close(s(x), ref("val")(x, c))
+    assert close(s.deriv(2).coeffs, ref("der")(c, 2))
+    assert close(s.integ(2, k=[3, -1], lbnd=0.5).coeffs, ref("int")(c, 2, [3, -1], 0.5))
+    assert close((s * t).coeffs, ref("mul")(c, d))
+    assert close((s + t - 2).coeffs, ref("sub")(ref("add")(c, d), [2]))
+    assert close((3 * s.truncate(4)).coeffs, 3 * c[:4])
+
+
+def test_batch(tol=1.0e-13):
+    c = np.random.rand(6, 3, 2) - 0.5
+    s = orthopy.Series("c1.jacobi", ("normal", 0.5, -0.3), c)
+    x = np.linspace(-1.0, 1.0, 7)
+
+    values = s(x)
+    assert values.shape == (3, 2, 7)
+    for i in range(3):
+        for j in range(2):
+            ref = orthopy.Series("c1.jacobi", ("normal", 0.5, -0.3), c[:, i, j])
+            assert np.all(np.abs(values[i, j] - ref(x)) < tol)
+
+    assert np.all(np.abs((s * s)(x) - values ** 2) < tol * (1 + values ** 2))
+    assert s.deriv().coeffs.shape == (5, 3, 2)
+    assert np.all(np.abs(s.integ().deriv().coeffs - c) < tol)
+    # the antiderivative vanishes at 0 by default
+    assert np.all(np.abs(s.integ()(0.0)) < tol)
@@ -0,0 +1,51 @@
+import itertools
+
+import numpy as np
+
+import orthopy
+
+
+def test_store_tree(tmp_path):
+    bary = np.random.rand(3, 13)
+    bary /= np.sum(bary, axis=0)
+    store = orthopy.store.tabulate(orthopy.t2.Eval, ("normal",), bary, 6, tmp_path)
+    assert store.family == "t2.Eval"
+    assert store.data.shape == (21, 13)
+    assert store.offsets == [0, 1, 3, 6, 10, 15, 21]
+
+    store = orthopy.store.open(tmp_path)
+    assert isinstance(store.data, np.memmap)
+    assert not store.data.flags.writeable
+    assert np.all(store.points == bary)
+    ref = list(itertools.islice(orthopy.t2.Eval(bary, "normal"), 6))
+    for k in range(6):
+        assert np.all(store.level(k) == ref[k])
+        # no copies
+        assert np.shares_memory(store.level(k), store.data)
+    assert np.all(store[4, 2] == ref[4][2])
+
+
+def test_store_1d(tmp_path):
+    x = np.linspace(-1.0, 1.0, 10).reshape(2, 5)
+    store = orthopy.store.tabulate("c1.jacobi.Eval", ["normal", 1, 0], x, 4, tmp_path)
+    assert store.point_shape == (2, 5)
+    assert store.data.shape == (4, 2, 5)
+    evaluator = orthopy.c1.jacobi.Eval(x, "normal", 1, 0)
+    for k in range(4):
+        assert np.all(store.level(k) == next(evaluator))
+
+
+def test_store_135(tmp_path):
+    X = np.random.rand(3, 8) - 0.5
+    X /= np.sqrt(np.einsum("ij,ij->j", X, X))
+    store = orthopy.store.tabulate(
+        orthopy.u3.EvalCartesian, ("quantum mechanic",), X, 5, tmp_path
+    )
+    assert store.family == "u3.EvalCartesian"
+    assert store.dtype == complex
+    evaluator = orthopy.u3.EvalCartesian(X, "quantum mechanic")
+    for L in range(5):
+        ref = next(evaluator)
+        # (l, m) = (L, m) is member L + m
+        for m in range(-L, L + 1):
+            assert np.all(store[L, L + m] == ref[L + m])
@@ -1,4 +1,5 @@
 import itertools
+from concurrent.futures import ProcessPoolExecutor
 
 import ndim
 import numpy as np
@@ -177,6 +178,42 @@ def test_show_tree(n=3):
     orthopy.t2.savefig_tree("triangle-tree.png", n, colorbar=True, clim=(-3, 3))
 
 
+def test_savefig_tree_executor(n=3):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        future = orthopy.t2.savefig_tree("triangle-tree.png", n, executor=executor)
+        assert future.result() == "triangle-tree.png"
+
+
+@pytest.mark.parametrize("scaling", ["classical", "monic", "normal"])
+def test_plan(scaling, n=6, tol=1.0e-14):
+    bary = np.random.rand(3, 4, 2)
+    bary /= np.sum(bary, axis=0)
+    plan = orthopy.t2.Plan(n, scaling, bary.shape)
+    out = plan(bary, out=plan.empty())
+
+    evaluator = orthopy.t2.Eval(bary, scaling)
+    for level, ref in zip(plan.levels(out), evaluator):
+        assert np.all(np.abs(level - ref) < tol * (1 + np.abs(ref)))
+
+
+@pytest.mark.parametrize("scaling", ["classical", "monic", "normal"])
+@pytest.mark.parametrize("num_points", [6, 8])
+def test_collapsed(scaling, num_points, n=6, tol=1.0e-12):
+    bary, weights = orthopy.t2.collapsed_grid(num_points)
+    assert abs(np.sum(weights) - 0.5) < tol
+
+    coeffs = np.random.rand(n * (n + 1) // 2, 3)
+    values = orthopy.t2.synthesize(coeffs, scaling, num_points)
+    assert values.shape == (num_points, num_points, 3)
+
+    evaluator = orthopy.t2.Eval(bary, scaling)
+    vals = np.concatenate(list(itertools.islice(evaluator, n)))
+    ref = np.einsum("kij,kb->ijb", vals, coeffs)
+    assert np.all(np.abs(values - ref) < tol * (1 + np.abs(ref)))
+
+    assert np.all(np.abs(orthopy.t2.analyze(values, scaling, n) - coeffs) < tol)
+
+
 if __name__ == "__main__":
     # test_show_single((2, 1))
     test_show_tree(5)
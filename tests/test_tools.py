@@ -1,4 +1,6 @@
+import itertools
 import math
+from fractions import Fraction
 
 import numpy as np
 import pytest
@@ -21,6 +23,29 @@ def test_stieltjes():
     assert int_1 == rc.int_1
 
 
+def test_stieltjes_exact():
+    n = 5
+    # sympy moments of the Legendre weight
+    moments = [sympy.S(1 + (-1) ** k) / (k + 1) for k in range(2 * n)]
+    alpha0, beta0, int_1 = orthopy.tools.stieltjes_exact(moments, n)
+
+    rc = orthopy.c1.legendre.RecurrenceCoefficients("monic", symbolic=True)
+    _, alpha1, beta1 = np.array([rc[k] for k in range(n)]).T
+
+    assert (alpha0 == alpha1).all()
+    assert (beta0 == beta1).all()
+    assert int_1 == rc.int_1
+
+    # large n with a callable and integer/Fraction arithmetic
+    n = 100
+    alpha, beta, int_1 = orthopy.tools.stieltjes_exact(
+        lambda k: 0 if k % 2 == 1 else Fraction(2, k + 1), n
+    )
+    assert all(a == 0 for a in alpha)
+    assert all(beta[k] == Fraction(k ** 2, 4 * k ** 2 - 1) for k in range(1, n))
+    assert int_1 == 2
+
+
 def test_golub_welsch(tol=1.0e-14):
     """Test the custom Gauss generator with the weight function x ** 2."""
     alpha = 2.0
@@ -47,6 +72,78 @@ def test_golub_welsch(tol=1.0e-14):
     orthopy.tools.gautschi_test_3(moments, alpha, beta)
 
 
+def test_golub_welsch_batch(n=5, tol=1.0e-14):
+    # weight functions |x|^a on [-1, 1]
+    k = np.arange(2 * n + 1)
+    exponents = np.linspace(0.0, 3.0, 7)
+    moments = np.array([np.where(k % 2 == 1, 0.0, 2 / (k + a + 1)) for a in exponents])
+    # not positive definite
+    moments[3, 4] = -1.0
+
+    alpha, beta, int_1, failed = orthopy.tools.golub_welsch(moments)
+    assert alpha.shape == (7, n)
+    assert beta.shape == (7, n)
+    assert int_1.shape == (7,)
+    assert np.all(failed == (np.arange(7) == 3))
+    assert np.all(np.isnan(alpha[3]))
+
+    for j in np.flatnonzero(~failed):
+        a, b, i1 = orthopy.tools.golub_welsch(moments[j])
+        assert np.all(np.abs(alpha[j] - a) < tol)
+        assert np.all(np.abs(beta[j, 1:] - b[1:]) < tol)
+        assert abs(int_1[j] - i1) < tol
+
+
+@pytest.mark.parametrize(
+    "fun",
+    [
+        orthopy.tools.discretized_stieltjes,
+        orthopy.tools.lanczos,
+        lambda *args: orthopy.tools.lanczos(*args, reorthogonalize=True),
+    ],
+)
+def test_discrete_measure(fun, n=30, tol=1.0e-14):
+    # A Gauss-Legendre rule with many points reproduces the Legendre coefficients.
+    x, w = np.polynomial.legendre.leggauss(100)
+    alpha, beta, int_1 = fun(x, w, n)
+
+    rc = orthopy.c1.legendre.RecurrenceCoefficients("monic", symbolic=False)
+    _, ref_alpha, ref_beta = np.array([rc[k] for k in range(n)]).T
+    assert np.all(np.abs(alpha - ref_alpha) < tol)
+    assert math.isnan(beta[0])
+    assert np.all(np.abs(beta[1:] - ref_beta[1:]) < tol)
+    assert abs(int_1 - 2.0) < tol
+
+
+@pytest.mark.parametrize("method", ["stieltjes", "lanczos"])
+def test_mcdis(method, n=20):
+    # Hermite
+    alpha, beta, int_1 = orthopy.tools.mcdis(
+        lambda x: np.exp(-(x ** 2)), [(-np.inf, np.inf)], n, method=method
+    )
+    k = np.arange(1, n)
+    assert np.all(np.abs(alpha) < 1.0e-13)
+    assert np.all(np.abs(beta[1:] - k / 2) < 1.0e-12 * k)
+    assert abs(int_1 - math.sqrt(math.pi)) < 1.0e-13
+
+    # Laguerre
+    alpha, beta, int_1 = orthopy.tools.mcdis(
+        lambda x: np.exp(-x), [(0.0, np.inf)], n, method=method
+    )
+    assert np.all(np.abs(alpha - (2 * np.arange(n) + 1)) < 1.0e-11 * n)
+    assert np.all(np.abs(beta[1:] - k ** 2) < 1.0e-11 * k ** 2)
+    assert abs(int_1 - 1.0) < 1.0e-13
+
+    # two intervals plus a point mass, symmetric about 0
+    alpha, beta, int_1 = orthopy.tools.mcdis(
+        np.ones_like, [(-1.0, -0.5), (0.5, 1.0)], n, point_masses=([0.0], [0.5])
+    )
+    assert np.all(np.abs(alpha) < 1.0e-13)
+    assert abs(int_1 - 1.5) < 1.0e-13
+    # beta_1 = int x^2 / int 1
+    assert abs(beta[1] - (2 * (1 - 0.5 ** 3) / 3) / 1.5) < 1.0e-13
+
+
 @pytest.mark.parametrize("dtype", [float, sympy.S])
 def test_chebyshev(dtype):
     alpha = 2
@@ -108,3 +205,167 @@ def test_chebyshev_modified(tol=1.0e-14):
     assert math.isnan(beta[0])
     assert np.all(abs(beta[1:] - [3 / 5, 4 / 35, 25 / 63, 16 / 99]) < tol)
     assert abs(int_1 - 2 / 3) < tol
+
+
+def test_chebyshev_modified_batch(n=20, tol=1.0e-13):
+    # modified moments of the weight functions exp(c x) with respect to the monic
+    # Legendre polynomials, via Gauss-Legendre quadrature
+    c = np.linspace(-2.0, 2.0, 5)
+    x, w = np.polynomial.legendre.leggauss(2 * n + 20)
+    P = np.array(list(itertools.islice(orthopy.c1.legendre.Eval(x, "monic"), 2 * n)))
+    nu = P @ (w[:, None] * np.exp(np.outer(x, c)))
+
+    rc = orthopy.c1.legendre.RecurrenceCoefficients("monic", symbolic=False)
+    table = np.array([rc[k] for k in range(2 * n)])
+    alpha, beta, int_1 = orthopy.tools.chebyshev_modified(nu, table)
+    assert alpha.shape == (n, len(c))
+    assert beta.shape == (n, len(c))
+    assert np.all(np.isnan(beta[0]))
+
+    for j in range(len(c)):
+        a, b, i1 = orthopy.tools.chebyshev_modified(nu[:, j], rc)
+        assert np.all(np.abs(alpha[:, j] - a) < tol)
+        assert np.all(np.abs(beta[1:, j] - b[1:]) < tol)
+        assert abs(int_1[j] - i1) < tol
+
+    # c = 0 is the Legendre weight itself
+    assert np.all(np.abs(alpha[:, 2]) < tol)
+    assert np.all(np.abs(beta[1:, 2] - table[1:n, 2]) < tol)
+
+
+def test_gautschi_test_3(tol=1.0e-12):
+    # Legendre: alpha_k = 0, beta_k = k^2 / (4k^2 - 1), beta_0 = int_1 = 2
+    n = 8
+    k = np.arange(2 * n)
+    moments = (1.0 + (-1.0) ** k) / (k + 1)
+    alpha = np.zeros(n)
+    beta = np.array([2.0] + [j ** 2 / (4 * j ** 2 - 1) for j in range(1, n)])
+
+    errors_alpha, errors_beta = orthopy.tools.gautschi_test_3(moments, alpha, beta)
+    assert np.all(errors_alpha < tol)
+    assert np.all(errors_beta < tol)
+
+    # many candidate sets at once
+    alpha2 = np.column_stack([alpha, alpha + 1.0e-3])
+    beta2 = np.column_stack([beta, beta])
+    errors_alpha, errors_beta = orthopy.tools.gautschi_test_3(moments, alpha2, beta2)
+    assert errors_alpha.shape == (n, 2)
+    assert np.all(errors_alpha[:, 0] < tol)
+    assert np.all(np.abs(errors_alpha[:, 1] - 1.0e-3) < tol)
+
+    # many moment vectors at once
+    moments2 = np.column_stack([moments, 3 * moments])
+    beta2 = np.column_stack([beta, np.concatenate([[6.0], beta[1:]])])
+    errors_alpha, errors_beta = orthopy.tools.gautschi_test_3(moments2, alpha, beta2)
+    assert np.all(errors_alpha < tol)
+    assert np.all(errors_beta < tol)
+
+
+def test_gautschi_test_3_mpmath(n=200):
+    # The Hankel determinants are far out of the float range here.
+    mpmath = pytest.importorskip("mpmath")
+    with mpmath.workdps(200):
+        moments = np.array(
+            [
+                mpmath.mpf(2) / (k + 1) if k % 2 == 0 else mpmath.mpf(0)
+                for k in range(2 * n)
+            ]
+        )
+        alpha = np.zeros(n)
+        beta = np.array([2.0] + [j ** 2 / (4 * j ** 2 - 1) for j in range(1, n)])
+        errors_alpha, errors_beta = orthopy.tools.gautschi_test_3(moments, alpha, beta)
+    assert np.all(errors_alpha < 1.0e-15)
+    assert np.all(errors_beta < 1.0e-15)
+
+
+@pytest.mark.parametrize("scaling", ["monic", "classical", "normal"])
+def test_gauss(scaling, tol=1.0e-14):
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients(scaling, 0.0, 0.0, symbolic=False)
+    points, weights = orthopy.tools.quadrature.gauss(rc, 5, 2.0)
+    ref_points, ref_weights = np.polynomial.legendre.leggauss(5)
+    assert np.all(np.abs(points - ref_points) < tol)
+    assert np.all(np.abs(weights - ref_weights) < tol)
+
+
+def test_leja(tol=1.0e-14):
+    rc = orthopy.c1.legendre.RecurrenceCoefficients("monic", symbolic=False)
+    candidates = np.linspace(-1.0, 1.0, 1001)
+    points, weights = orthopy.tools.quadrature.leja(
+        rc, 6, 2.0, np.ones_like, candidates
+    )
+    assert len(np.unique(points)) == 6
+    # interpolatory, exact for degree 5
+    for k in range(6):
+        ref = 0.0 if k % 2 == 1 else 2.0 / (k + 1)
+        assert abs(np.dot(weights, points ** k) - ref) < tol
+
+
+def test_modify(n=20, tol=1.0e-14):
+    rc = orthopy.c1.legendre.RecurrenceCoefficients("monic", symbolic=False)
+
+    # (1 - x) * Legendre weight = Jacobi weight with alpha = 1, beta = 0
+    alpha, beta, int_1 = orthopy.tools.modify(rc, n, 2.0, multiply_by_roots=[1.0])
+    ref = orthopy.c1.jacobi.RecurrenceCoefficients("monic", 1, 0, symbolic=False)
+    ref = np.array([ref[k] for k in range(n)], dtype=float)
+    assert np.all(np.abs(alpha - ref[:, 1]) < tol)
+    assert np.all(np.abs(beta[1:] - ref[1:, 2]) < tol)
+    assert abs(int_1 - 2.0) < tol
+
+    # rational modification, compared with discretized Stieltjes on a fine Gauss rule
+    x, w = np.polynomial.legendre.leggauss(200)
+    w = w * np.abs(x + 1.3) * np.abs(x - 2.0) / np.abs(x - 1.05) / np.abs(x + 3.0)
+    ref_alpha, ref_beta, ref_int_1 = orthopy.tools.discretized_stieltjes(x, w, n)
+    alpha, beta, int_1 = orthopy.tools.modify(
+        rc, n, 2.0, multiply_by_roots=[-1.3, 2.0], divide_by_poles=[1.05, -3.0]
+    )
+    assert np.all(np.abs(alpha - ref_alpha) < 10 * tol)
+    assert np.all(np.abs(beta[1:] - ref_beta[1:]) < 10 * tol)
+    assert abs(int_1 - ref_int_1) < 10 * tol
+
+
+@pytest.mark.parametrize("clim", [None, (-30.0, 30.0)])
+def test_tripcolor_tree_colorbar(clim):
+    from matplotlib import pyplot as plt
+
+    from orthopy.tree_plot import tripcolor_tree
+
+    points = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+    cells = np.array([[0, 1, 2]])
+    shifts = np.array([[0.0, 0.0], [2.0, 0.0]])
+    values = np.array([[1.0, 2.0, 3.0], [10.0, 20.0, 30.0]])
+
+    plt.figure()
+    tripcolor_tree(points, cells, shifts, values, clim, colorbar=True)
+    cb_ax = plt.gcf().axes[-1]
+    if clim is None:
+        # values normalized per member: no value scale
+        labels = [t.get_text() for t in cb_ax.get_yticklabels()]
+        assert labels == ["min", "max"]
+    else:
+        assert cb_ax.get_ylim() == clim
+    plt.close()
+
+
+@pytest.mark.parametrize("name", ["xu", "zernike", "zernike2"])
+def test_s2_plot_tree_values(name, monkeypatch, n=6, tol=1.0e-14):
+    from matplotlib import pyplot as plt
+
+    captured = {}
+
+    def tripcolor_tree(points, cells, shifts, values, clim, colorbar):
+        captured["points"] = points
+        captured["values"] = values
+
+    monkeypatch.setattr(orthopy.s2.tools, "tripcolor_tree", tripcolor_tree)
+    Eval = getattr(orthopy.s2, name).Eval
+    plt.figure()
+    orthopy.s2.tools.plot_tree(name, Eval, n, res=5)
+    plt.close()
+
+    # level by level, each one used before the next one is computed
+    ref = []
+    for k in range(n + 1):
+        level = next(itertools.islice(Eval(captured["points"].T, "normal"), k, None))
+        ref.append(level)
+    ref = np.concatenate(ref)
+    assert np.all(np.abs(captured["values"] - ref) < tol * (1 + np.abs(ref)))
@@ -183,5 +183,97 @@ def test_write_tree(n=2):
 #             assert np.all(v == e)
 
 
+@pytest.mark.parametrize(
+    "scaling", ["acoustic", "quantum mechanic", "geodetic", "schmidt"]
+)
+@pytest.mark.parametrize("complex_valued", [True, False])
+def test_plan(scaling, complex_valued, n=6, tol=1.0e-14):
+    X = np.random.randn(3, 4, 2)
+    X /= np.sqrt(np.sum(X ** 2, axis=0))
+    plan = orthopy.u3.Plan(n, scaling, X.shape, complex_valued=complex_valued)
+    out = plan(X, out=plan.empty())
+
+    evaluator = orthopy.u3.EvalCartesian(X, scaling, complex_valued=complex_valued)
+    for level, ref in zip(plan.levels(out), evaluator):
+        assert np.all(np.abs(level - ref) < tol * (1 + np.abs(ref)))
+
+
+@pytest.mark.parametrize(
+    "scaling", ["acoustic", "quantum mechanic", "geodetic", "schmidt"]
+)
+def test_real(scaling, n=7, tol=1.0e-14):
+    theta_phi = np.random.rand(2, 5) * [[np.pi], [2 * np.pi]]
+    theta, phi = theta_phi
+    X = [np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)]
+
+    evaluator = orthopy.u3.EvalSpherical(theta_phi, scaling)
+    refs = [np.array(v) for v in itertools.islice(evaluator, n)]
+    for evaluator_real in [
+        orthopy.u3.EvalSpherical(theta_phi, scaling, real=True),
+        orthopy.u3.EvalCartesian(X, scaling, real=True),
+    ]:
+        for L, (vals, ref) in enumerate(zip(evaluator_real, refs)):
+            assert vals.dtype == float
+            assert np.all(np.abs(vals[L] - ref[L].real) < tol)
+            # cos(m phi) on the right, sin(m phi) on the left
+            m = np.arange(1, L + 1)
+            assert np.all(np.abs(vals[L + m] - np.sqrt(2) * ref[L + m].real) < tol)
+            assert np.all(np.abs(vals[L - m] - np.sqrt(2) * ref[L + m].imag) < tol)
+
+
+@pytest.mark.parametrize("scaling", ["quantum mechanic", "schmidt"])
+@pytest.mark.parametrize("complex_valued", [True, False])
+@pytest.mark.parametrize("m_max", [None, 2])
+def test_truncated(scaling, complex_valued, m_max, n=7, tol=1.0e-14):
+    theta_phi = np.random.rand(2, 5) * [[np.pi], [2 * np.pi]]
+    evaluator = orthopy.u3.EvalSpherical(theta_phi, scaling, complex_valued)
+    full = [np.array(v) for v in itertools.islice(evaluator, n)]
+
+    half = orthopy.u3.EvalSpherical(
+        theta_phi, scaling, complex_valued, m_max=m_max, negative_orders=False
+    )
+    for L, (ref, vals) in enumerate(zip(full, half)):
+        M = L if m_max is None else min(L, m_max)
+        assert len(vals) == M + 1
+        ref = ref[L - M : L + M + 1]
+        assert np.all(np.abs(half.expand(vals, L) - ref) < tol * (1 + np.abs(ref)))
+
+
+def _rotation_matrix(alpha, beta, gamma):
+    def rz(a):
+        return np.array(
+            [[np.cos(a), -np.sin(a), 0], [np.sin(a), np.cos(a), 0], [0, 0, 1]]
+        )
+
+    def ry(b):
+        return np.array(
+            [[np.cos(b), 0, np.sin(b)], [0, 1, 0], [-np.sin(b), 0, np.cos(b)]]
+        )
+
+    return rz(alpha) @ ry(beta) @ rz(gamma)
+
+
+@pytest.mark.parametrize(
+    "scaling", ["acoustic", "quantum mechanic", "geodetic", "schmidt"]
+)
+def test_rotate(scaling, n=7, tol=1.0e-13):
+    def values(X):
+        evaluator = orthopy.u3.EvalCartesian(X, scaling)
+        return np.concatenate([np.array(v) for v in itertools.islice(evaluator, n)])
+
+    euler_angles = (0.3, 1.1, -0.8)
+    X = np.random.randn(3, 10)
+    X /= np.sqrt(np.sum(X ** 2, axis=0))
+    coeffs = np.random.randn(n ** 2, 2) + 1j * np.random.randn(n ** 2, 2)
+
+    rotated = orthopy.u3.rotate(coeffs, euler_angles, scaling)
+    assert rotated.shape == coeffs.shape
+
+    # f(R^{-1} x)
+    R = _rotation_matrix(*euler_angles)
+    ref = values(R.T @ X).T @ coeffs
+    assert np.all(np.abs(values(X).T @ rotated - ref) < tol * (1 + np.abs(ref)))
+
+
 if __name__ == "__main__":
     test_write_tree(n=5)